@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark the schema-compiled codec against marshal_item per entity type.
+
+Encode compares marshal_item (isinstance chain, lists/dicts as JSON strings)
+with seedlib.codec.encode_item. Decode compares what a reader of each layout
+has to do: a generic typed-JSON unmarshal plus json.loads of the JSON-string
+attributes, against seedlib.codec.decode_item.
+
+    python3 scripts/bench-codec.py --rounds 20000 -o codec.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+from seedlib.articles import india_article_item
+from seedlib.codec import decode_item, encode_item
+from seedlib.marshal import marshal_item
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Attributes the json encoding stores as JSON strings, per entity type
+JSON_FIELDS = {
+    "Trend": ("sources",),
+    "TahArticle": ("trfkType", "trfkSubtype", "recruitment", "coercion"),
+}
+
+SAMPLE_ARTICLE = {
+    "_id": {"$oid": "65f0c0ffee0000000000bench"},
+    "url": "https://example.org/news/bench",
+    "title": "Brick kiln workers rescued from debt bondage",
+    "article": "Police rescued workers held in debt bondage at a brick kiln. " * 80,
+    "summary": "Workers including children were rescued from a brick kiln. " * 6,
+    "trfk_type": ["labour_exploitation", "debt_bondage"],
+    "trfk_subtype": ["brick_kiln"],
+    "recruitment": ["family_debt", "advance_payment", "broker"],
+    "coercion": ["debt", "confinement", "threats"],
+    "crawl_date": "2026-01-02",
+    "publish_date": "2026-01-01",
+}
+
+
+class CaptureSink:
+    """Sink that keeps the plain items a seed producer puts."""
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, item: dict):
+        self.items.append(item)
+
+
+def load_script(filename: str):
+    """Import one of the hyphen-named seed scripts as a module."""
+    name = filename.replace("-", "_").removesuffix(".py")
+    spec = importlib.util.spec_from_file_location(name, SCRIPT_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def sample_items() -> dict:
+    """Plain items per entity type, as the seed-dynamodb.py producers build them."""
+    module = load_script("seed-dynamodb.py")
+    samples = {}
+    for entity, produce in [
+        ("Partner", module.seed_partners),
+        ("Trend", module.seed_trends),
+        ("Report", module.seed_reports),
+    ]:
+        sink = CaptureSink()
+        with contextlib.redirect_stdout(io.StringIO()):
+            produce(sink)
+        samples[entity] = sink.items
+
+    article = decode_item(india_article_item((0, SAMPLE_ARTICLE), encoding="native"))
+    samples["TahArticle"] = [article]
+    return samples
+
+
+def unmarshal_json_layout(dynamo_item: dict, json_fields) -> dict:
+    """What a reader of the json layout does: typed JSON to Python, then json.loads."""
+    item = {}
+    for name, attr in dynamo_item.items():
+        if "S" in attr:
+            value = attr["S"]
+            item[name] = json.loads(value) if name in json_fields else value
+        elif "N" in attr:
+            text = attr["N"]
+            item[name] = float(text) if "." in text else int(text)
+        elif "BOOL" in attr:
+            item[name] = attr["BOOL"]
+        elif "B" in attr:
+            item[name] = attr["B"]
+    return item
+
+
+def per_item_us(func, items: list, rounds: int) -> float:
+    """Mean microseconds per call of func over `items`, repeated `rounds` times."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            func(item)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(items)) * 1e6
+
+
+def bench_entity(entity: str, items: list, rounds: int) -> dict:
+    """Encode/decode cost and encoded size of one entity type under both layouts."""
+    json_fields = JSON_FIELDS.get(entity, ())
+    json_items = [marshal_item(item) for item in items]
+    native_items = [encode_item(item) for item in items]
+    assert [decode_item(item) for item in native_items] == [
+        unmarshal_json_layout(item, json_fields) for item in json_items
+    ], f"{entity}: layouts decode differently"
+
+    return {
+        "entity": entity,
+        "items": len(items),
+        "encode_us": {
+            "marshal_item": round(per_item_us(marshal_item, items, rounds), 3),
+            "codec": round(per_item_us(encode_item, items, rounds), 3),
+        },
+        "decode_us": {
+            "json_layout": round(per_item_us(lambda i: unmarshal_json_layout(i, json_fields), json_items, rounds), 3),
+            "codec": round(per_item_us(decode_item, native_items, rounds), 3),
+        },
+        "encoded_bytes": {
+            "json_layout": len(json.dumps(json_items, default=str)),
+            "native": len(json.dumps(native_items, default=str)),
+        },
+    }
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5000, help="Passes over each entity's sample items")
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    results = [bench_entity(entity, items, args.rounds) for entity, items in sample_items().items()]
+    for r in results:
+        print(
+            f"{r['entity']:<12} encode {r['encode_us']['marshal_item']:>7.2f} -> {r['encode_us']['codec']:>7.2f} us  "
+            f"decode {r['decode_us']['json_layout']:>7.2f} -> {r['decode_us']['codec']:>7.2f} us",
+            file=sys.stderr,
+        )
+
+    report = {"config": {"rounds": args.rounds}, "results": results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
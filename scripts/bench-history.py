@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Benchmark conversation history reads on the legacy and time-ordered message keys.
+
+Generates long synthetic conversations in the seed files' layout
+(`ORG#<orgId>` / `MESSAGE#<conversationId>#<uuid>`), times rekeying them
+with seedlib.messages, and loads both layouts into an in-process DynamoDB
+stand-in. It then times reading a page of history newest-first on each
+layout. The legacy layout needs the whole conversation read and sorted;
+the time-ordered one uses a descending Query with Limit and a cursor.
+Reports latency, calls, items read and read units per request as JSON.
+The stand-in evaluates a whole partition per Query, so on long
+conversations items read and read units say more than its latency.
+
+    python3 scripts/bench-history.py --latency-ms 5 --messages 5000 -o history.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.messages import LEGACY_PREFIX, message_history, rekey_message
+from seedlib.sink import BulkSink
+
+TABLE_NAME = "bench"
+ORG_ID = "bench"
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def legacy_messages(args) -> tuple:
+    """(conversation ids, typed Message items keyed as in messages.json)."""
+    rng = random.Random(args.seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    content = "Synthetic message text for the history benchmark. " * (args.content_chars // 52 + 1)
+    conversations, items = [], []
+    for _ in range(args.conversations):
+        conversation_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        conversations.append(conversation_id)
+        created = start + timedelta(seconds=rng.randint(0, 86400 * 30))
+        for i in range(args.messages):
+            message_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            created += timedelta(milliseconds=rng.randint(1, 120_000))
+            items.append({
+                "PK": {"S": f"ORG#{ORG_ID}"},
+                "SK": {"S": f"{LEGACY_PREFIX}{conversation_id}#{message_id}"},
+                "entityType": {"S": "Message"},
+                "id": {"S": message_id},
+                "conversationId": {"S": conversation_id},
+                "role": {"S": "user" if i % 2 == 0 else "assistant"},
+                "content": {"S": content[:args.content_chars]},
+                "createdAt": {"S": created.isoformat(timespec="microseconds")},
+            })
+    rng.shuffle(items)
+    return conversations, items
+
+
+def load(items: list) -> FakeDynamoDB:
+    """A stand-in table holding `items`."""
+    client = FakeDynamoDB()
+    with BulkSink(BatchWriter(client, TABLE_NAME, max_workers=8)) as sink:
+        for item in items:
+            sink.put_typed(item)
+    return client
+
+
+def legacy_page(client, conversation_id: str, limit: int, page: int) -> tuple:
+    """Page `page` (0 = newest) of a conversation on the legacy keys: read it all, sort, slice."""
+    params = {
+        "TableName": TABLE_NAME,
+        "KeyConditionExpression": "PK = :pk AND begins_with(SK, :prefix)",
+        "ExpressionAttributeValues": {
+            ":pk": {"S": f"ORG#{ORG_ID}"},
+            ":prefix": {"S": f"{LEGACY_PREFIX}{conversation_id}#"},
+        },
+    }
+    items, calls, scanned = [], 0, 0
+    while True:
+        response = client.query(**params)
+        calls += 1
+        items.extend(response["Items"])
+        scanned += response["ScannedCount"]
+        if "LastEvaluatedKey" not in response:
+            break
+        params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    items.sort(key=lambda item: (item["createdAt"]["S"], item["id"]["S"]), reverse=True)
+    page_items = items[page * limit:(page + 1) * limit]
+    return [item["id"]["S"] for item in page_items], calls, scanned
+
+
+def ordered_page(client, conversation_id: str, limit: int, page: int) -> tuple:
+    """Page `page` (0 = newest) on the time-ordered keys, following the cursor from the newest page."""
+    cursor, calls, scanned = None, 0, 0
+    for _ in range(page + 1):
+        items, cursor = message_history(client, TABLE_NAME, ORG_ID, conversation_id, limit, cursor)
+        calls += 1
+        scanned += len(items)
+    return [item["id"]["S"] for item in items], calls, scanned
+
+
+def measure(pattern: str, layout: str, request, client: FakeDynamoDB, conversations: list, args) -> tuple:
+    """Time `request` for every conversation, `repeats` times; returns (result row, ids returned)."""
+    latencies_ms, ids = [], []
+    rcu_start = client.consumed_rcu
+    calls = scanned = runs = 0
+    for _ in range(args.repeats):
+        ids = []
+        for conversation_id in conversations:
+            start = time.perf_counter()
+            page_ids, page_calls, page_scanned = request(client, conversation_id)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            ids.append(page_ids)
+            calls += page_calls
+            scanned += page_scanned
+            runs += 1
+    return {
+        "pattern": pattern,
+        "layout": layout,
+        "calls": round(calls / runs, 1),
+        "items_read": round(scanned / runs, 1),
+        "read_units": round((client.consumed_rcu - rcu_start) / runs, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+        },
+    }, ids
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per API call")
+    parser.add_argument("--conversations", type=int, default=10, help="Synthetic conversations")
+    parser.add_argument("--messages", type=int, default=2000, help="Messages per conversation")
+    parser.add_argument("--content-chars", type=int, default=800, help="Message content length")
+    parser.add_argument("--page-size", type=int, default=20, help="Messages per history page")
+    parser.add_argument("--deep-page", type=int, default=5, help="Page number (0 = newest) for the deep-page read")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs of each request per conversation")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic data")
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    conversations, items = legacy_messages(args)
+    start = time.perf_counter()
+    rekeyed = [rekey_message(item) for item in items]
+    rekey_seconds = time.perf_counter() - start
+
+    clients = {"legacy": load(items), "time_ordered": load(rekeyed)}
+    for client in clients.values():
+        client.latency = args.latency_ms / 1000
+
+    requests = {
+        "legacy": lambda page: lambda client, conversation_id: legacy_page(
+            client, conversation_id, args.page_size, page
+        ),
+        "time_ordered": lambda page: lambda client, conversation_id: ordered_page(
+            client, conversation_id, args.page_size, page
+        ),
+    }
+    results = []
+    for pattern, page in (("latest_page", 0), (f"page_{args.deep_page}", args.deep_page)):
+        rows = {}
+        for layout, client in clients.items():
+            row, ids = measure(pattern, layout, requests[layout](page), client, conversations, args)
+            rows[layout] = ids
+            results.append(row)
+        assert rows["legacy"] == rows["time_ordered"], f"{pattern}: layouts disagree"
+
+    for r in results:
+        print(
+            f"{r['pattern']:<14} {r['layout']:<13} {r['calls']:>6} calls {r['items_read']:>8} read "
+            f"{r['read_units']:>8.1f} RCU  p50 {r['latency_ms']['p50']:>9.2f} ms  p99 {r['latency_ms']['p99']:>9.2f} ms",
+            file=sys.stderr,
+        )
+
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "messages": len(items),
+        "rekey": {
+            "seconds": round(rekey_seconds, 6),
+            "items_per_sec": round(len(items) / rekey_seconds, 1) if rekey_seconds else 0.0,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
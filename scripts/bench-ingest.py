@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Benchmark the seed ingestion paths against an in-process DynamoDB stand-in.
+
+Runs each path per entity type and reports items/sec, p50/p95/p99 call
+latency, peak traced memory and CPU time as JSON, so runs can be diffed.
+
+    python3 scripts/bench-ingest.py --latency-ms 5 --throttle-rate 0.02 -o bench.json
+    python3 scripts/bench-ingest.py --write-capacity 200 --target-utilisation 0.8
+    python3 scripts/bench-ingest.py --paths bulk async --latency-ms 10 --concurrency 64
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.async_sink import AsyncBulkSink
+from seedlib.fake_dynamodb import AsyncFakeDynamoDB, FakeDynamoDB
+from seedlib.rate_limiter import table_rate_limiter
+from seedlib.sink import BulkSink, PutItemSink
+
+SCRIPT_DIR = Path(__file__).parent
+PATHS = ["put_item", "bulk", "async", "batch_write_items", "init_loader"]
+
+
+def load_script(filename: str):
+    """Import one of the hyphen-named seed scripts as a module."""
+    name = filename.replace("-", "_").removesuffix(".py")
+    spec = importlib.util.spec_from_file_location(name, SCRIPT_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TimedClient:
+    """Proxy a client, recording the wall time of every API call."""
+
+    def __init__(self, client):
+        self.client = client
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def timed(**kwargs):
+            start = time.perf_counter()
+            try:
+                return method(**kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.latencies.append(elapsed)
+
+        return timed
+
+
+class AsyncTimedClient:
+    """Async stand-in client recording the wall time of every API call, like TimedClient.
+
+    Takes over the FakeDynamoDB's latency and awaits it instead.
+    """
+
+    def __init__(self, client: FakeDynamoDB):
+        self.client = client
+        self.latencies = []
+        self._async = AsyncFakeDynamoDB(client, client.latency)
+        client.latency = 0.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def __getattr__(self, name):
+        method = getattr(self._async, name)
+
+        async def timed(**kwargs):
+            start = time.perf_counter()
+            try:
+                return await method(**kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        return timed
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def measure(path: str, entity: str, run, client: TimedClient) -> dict:
+    """Time one case; `run` performs the writes and returns the item count."""
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        items = run()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms = [x * 1000 for x in client.latencies]
+    return {
+        "path": path,
+        "entity": entity,
+        "items": items,
+        "calls": len(latencies_ms),
+        "seconds": round(wall, 6),
+        "items_per_sec": round(items / wall, 1) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p95": round(percentile(latencies_ms, 95), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+        },
+        "peak_memory_bytes": peak,
+        "cpu_seconds": round(cpu, 6),
+        "consumed_wcu": client.client.consumed_wcu,
+    }
+
+
+def make_rate_limiter(client, args):
+    """Limiter for one case, when --target-utilisation is set."""
+    if not args.target_utilisation:
+        return None
+    return table_rate_limiter(client, "bench", args.target_utilisation)
+
+
+def bench_seed_dynamodb(path: str, args, make_client) -> list:
+    """Benchmark the seed-dynamodb.py producers through PutItemSink, BulkSink or AsyncBulkSink."""
+    module = load_script("seed-dynamodb.py")
+    if args.dataset_dir:
+        module.DATASET_DIR = Path(args.dataset_dir)
+
+    producers = [
+        ("Partner", module.seed_partners),
+        ("Trend", module.seed_trends),
+        ("Report", module.seed_reports),
+        ("TahArticle", lambda sink: module.seed_tah_articles(sink, limit=args.limit)),
+        ("TahArticle:india_labour", lambda sink: module.seed_india_labour_articles(sink, limit=args.limit)),
+        ("TahArticle:india_se", lambda sink: module.seed_india_se_articles(sink, limit=args.limit)),
+    ]
+
+    results = []
+    for entity, produce in producers:
+        client = AsyncTimedClient(make_client()) if path == "async" else TimedClient(make_client())
+        rate_limiter = make_rate_limiter(client.client, args)
+
+        def run():
+            if path == "async":
+                sink = AsyncBulkSink(
+                    lambda: client,
+                    module.TABLE_NAME,
+                    concurrency=args.concurrency,
+                    base_delay=0.001,
+                    rate_limiter=rate_limiter,
+                )
+            elif path == "put_item":
+                sink = PutItemSink(client, module.TABLE_NAME, rate_limiter=rate_limiter)
+            else:
+                writer = BatchWriter(
+                    client, module.TABLE_NAME, max_workers=args.workers, base_delay=0.001, rate_limiter=rate_limiter
+                )
+                sink = BulkSink(writer)
+            with sink:
+                produce(sink)
+            return sink.close().written
+
+        results.append(measure(path, entity, run, client))
+    return results
+
+
+def bench_seed_all(path: str, args, make_client) -> list:
+    """Benchmark seed-all.py per seed file; init_loader includes loading the file."""
+    module = load_script("seed-all.py")
+    module.WORKERS = args.workers
+
+    results = []
+    for filename, entity in [
+        ("partners.json", "Partner"),
+        ("trends.json", "Trend"),
+        ("reports.json", "Report"),
+        ("conversations.json", "Conversation"),
+        ("messages.json", "Message"),
+    ]:
+        client = TimedClient(make_client())
+        module.RATE_LIMITER = make_rate_limiter(client.client, args)
+        preloaded = module.load_json_file(filename) if path == "batch_write_items" else None
+
+        def run():
+            items = preloaded if preloaded is not None else module.load_json_file(filename)
+            return module.batch_write_items(client, items, entity)
+
+        results.append(measure(path, entity, run, client))
+    return results
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", nargs="+", choices=PATHS, default=PATHS)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per API call")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Chance a call is throttled")
+    parser.add_argument("--unprocessed-rate", type=float, default=0.0, help="Chance a batch item comes back unprocessed")
+    parser.add_argument("--write-capacity", type=float, help="Provision the stand-in table at this many WCU/s")
+    parser.add_argument(
+        "--target-utilisation", type=float, help="Pace writes to this fraction of --write-capacity"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent batch writers")
+    parser.add_argument("--concurrency", type=int, default=64, help="Calls in flight for the async path")
+    parser.add_argument("--limit", type=int, default=100, help="Articles per TAH dataset")
+    parser.add_argument("--dataset-dir", help="Directory with the TAH datasets (defaults to the seed script's)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for throttling")
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    def make_client():
+        return FakeDynamoDB(
+            latency=args.latency_ms / 1000,
+            throttle_rate=args.throttle_rate,
+            unprocessed_rate=args.unprocessed_rate,
+            seed=args.seed,
+            write_capacity=args.write_capacity,
+        )
+
+    results = []
+    for path in args.paths:
+        if path in ("put_item", "bulk", "async"):
+            results.extend(bench_seed_dynamodb(path, args, make_client))
+        else:
+            results.extend(bench_seed_all(path, args, make_client))
+
+    for r in results:
+        print(
+            f"{r['path']:<18} {r['entity']:<24} {r['items']:>7} items "
+            f"{r['items_per_sec']:>10.1f}/s  p99 {r['latency_ms']['p99']:>8.2f} ms",
+            file=sys.stderr,
+        )
+
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Benchmark the list views with and without the GSIs of seedlib.indexes.
+
+Seeds an in-process DynamoDB stand-in with the seed-data files plus
+synthetic reports, trends and TAH articles, then times each access pattern
+as a Query on its index and as the filtered Scan it replaces. Reports
+latency, calls, items read and read units per request as JSON.
+
+    python3 scripts/bench-query.py --latency-ms 5 --articles 20000 -o query.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+from seedlib.articles import region_pk, synthetic_article_item
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import COUNTRY_TYPE, ENTITY_UPDATED, REGION_CRAWL, add_index_keys, create_table
+from seedlib.marshal import marshal_item
+from seedlib.seed_cache import load_items
+from seedlib.sharding import query_sharded
+from seedlib.sink import BulkSink
+
+SCRIPT_DIR = Path(__file__).parent
+SEED_DATA_DIR = SCRIPT_DIR / "seed-data"
+TABLE_NAME = "bench"
+
+COUNTRIES = ["United Kingdom", "India", "Brazil", "Nigeria", "Philippines", "Pakistan", "Italy", "Thailand"]
+EXPLOITATION_TYPES = ["labour_exploitation", "sexual_exploitation", "child_labour", "forced_marriage"]
+STATUSES = ["draft", "in_review", "approved", "published"]
+REGIONS = ["Asia-Pacific", "Europe", "Africa", "Americas", "Middle East"]
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def _timestamp(rng: random.Random) -> str:
+    return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z"
+
+
+def synthetic_items(args) -> list:
+    """Typed items: the seed-data files plus generated reports, trends and articles."""
+    rng = random.Random(args.seed)
+    items = []
+    for source in sorted(SEED_DATA_DIR.glob("*.json")):
+        if source.name != "all-items.json":
+            items.extend(add_index_keys(item) for item in load_items(source))
+
+    for i in range(args.reports):
+        org_id = f"org-{i % 20:02d}"
+        updated = _timestamp(rng)
+        report = {
+            "PK": f"ORG#{org_id}",
+            "SK": f"REPORT#bench-report-{i:06d}",
+            "entityType": "Report",
+            "id": f"bench-report-{i:06d}",
+            "orgId": org_id,
+            "title": f"Benchmark report {i}",
+            "country": rng.choice(COUNTRIES),
+            "sector": "Benchmark",
+            "exploitationType": rng.choice(EXPLOITATION_TYPES),
+            "status": rng.choice(STATUSES),
+            "version": 1,
+            "wordCount": rng.randint(800, 4000),
+            "createdAt": updated,
+            "updatedAt": updated,
+        }
+        items.append(add_index_keys(marshal_item(report)))
+
+    for i in range(args.trends):
+        country = rng.choice(COUNTRIES)
+        trend = {
+            "PK": "TRENDS",
+            "SK": f"TREND#{country[:2].upper()}#bench-trend-{i:06d}",
+            "entityType": "Trend",
+            "id": f"bench-trend-{i:06d}",
+            "country": country,
+            "title": f"Benchmark trend {i}",
+            "confidence": "medium",
+            "exploitationType": rng.choice(EXPLOITATION_TYPES),
+            "summary": "Synthetic trend for the query benchmark.",
+            "lastUpdated": _timestamp(rng),
+        }
+        items.append(add_index_keys(marshal_item(trend)))
+
+    body = "Synthetic article text for the query benchmark. " * (args.body_chars // 49 + 1)
+    for i in range(args.articles):
+        line = json.dumps({
+            "doc_id": f"bench-article-{i:07d}",
+            "title": f"Benchmark article {i}",
+            "article": body[:args.body_chars],
+            "summary": "Synthetic summary.",
+            "region": rng.choice(REGIONS),
+            "source_type": "NEWS",
+            "trfk_type": [rng.choice(EXPLOITATION_TYPES)],
+            "crawl_date": _timestamp(rng)[:10],
+        })
+        items.append(synthetic_article_item((i, line), shards=args.tah_shards))
+    return items
+
+
+def paginate(operation, params: dict) -> tuple:
+    """Run a Query or Scan to the end; returns (items, calls, items read)."""
+    params = dict(params, ReturnConsumedCapacity="TOTAL")
+    items, calls, scanned = [], 0, 0
+    while True:
+        response = operation(**params)
+        calls += 1
+        items.extend(response["Items"])
+        scanned += response.get("ScannedCount", len(response["Items"]))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items, calls, scanned
+        params["ExclusiveStartKey"] = last_key
+
+
+def patterns(args) -> list:
+    """(name, index request, scan request) per access pattern; each request returns (keys, calls, items read)."""
+    status, country, exploitation_type, region = "approved", "India", "labour_exploitation", "Asia-Pacific"
+    crawl_from, crawl_to = "2025-03-01", "2025-03-31"
+
+    def reports_index(client):
+        params = {
+            "TableName": TABLE_NAME,
+            "IndexName": ENTITY_UPDATED.name,
+            "KeyConditionExpression": "GSI1PK = :entity AND begins_with(GSI1SK, :status)",
+            "ExpressionAttributeValues": {":entity": {"S": "Report"}, ":status": {"S": f"{status}#"}},
+            "ScanIndexForward": False,
+            "Limit": args.page_size,
+        }
+        response = client.query(**params)
+        return [item["SK"]["S"] for item in response["Items"]], 1, response["ScannedCount"]
+
+    def reports_scan(client):
+        items, calls, scanned = paginate(client.scan, {
+            "TableName": TABLE_NAME,
+            "FilterExpression": "entityType = :entity AND #status = :status",
+            "ExpressionAttributeNames": {"#status": "status"},
+            "ExpressionAttributeValues": {":entity": {"S": "Report"}, ":status": {"S": status}},
+        })
+        items.sort(key=lambda item: (item["updatedAt"]["S"], item["PK"]["S"], item["SK"]["S"]), reverse=True)
+        return [item["SK"]["S"] for item in items[:args.page_size]], calls, scanned
+
+    def trends_index(client):
+        items, calls, scanned = paginate(client.query, {
+            "TableName": TABLE_NAME,
+            "IndexName": COUNTRY_TYPE.name,
+            "KeyConditionExpression": "GSI2PK = :country AND begins_with(GSI2SK, :type)",
+            "ExpressionAttributeValues": {":country": {"S": country}, ":type": {"S": f"{exploitation_type}#Trend#"}},
+        })
+        return sorted(item["SK"]["S"] for item in items), calls, scanned
+
+    def trends_scan(client):
+        items, calls, scanned = paginate(client.scan, {
+            "TableName": TABLE_NAME,
+            "FilterExpression": "entityType = :entity AND country = :country AND exploitationType = :type",
+            "ExpressionAttributeValues": {
+                ":entity": {"S": "Trend"}, ":country": {"S": country}, ":type": {"S": exploitation_type}
+            },
+        })
+        return sorted(item["SK"]["S"] for item in items), calls, scanned
+
+    def articles_index(client):
+        counter = CountingClient(client)
+        items = query_sharded(
+            counter, TABLE_NAME, region_pk(region), args.tah_shards,
+            index=REGION_CRAWL, sk_between=(crawl_from, f"{crawl_to}~"),
+        )
+        return sorted(item["SK"]["S"] for item in items), counter.calls, counter.scanned
+
+    def articles_scan(client):
+        items, calls, scanned = paginate(client.scan, {
+            "TableName": TABLE_NAME,
+            "FilterExpression": "entityType = :entity AND #region = :region AND crawlDate BETWEEN :from AND :to",
+            "ExpressionAttributeNames": {"#region": "region"},
+            "ExpressionAttributeValues": {
+                ":entity": {"S": "TahArticle"}, ":region": {"S": region},
+                ":from": {"S": crawl_from}, ":to": {"S": crawl_to},
+            },
+        })
+        return sorted(item["SK"]["S"] for item in items), calls, scanned
+
+    return [
+        ("reports_by_status", reports_index, reports_scan),
+        ("trends_by_country_type", trends_index, trends_scan),
+        ("articles_by_region_crawl_date", articles_index, articles_scan),
+    ]
+
+
+class CountingClient:
+    """Proxy a client's query, counting calls and items read."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = 0
+        self.scanned = 0
+
+    def query(self, **kwargs):
+        response = self.client.query(**kwargs)
+        self.calls += 1
+        self.scanned += response.get("ScannedCount", len(response["Items"]))
+        return response
+
+
+def measure(pattern: str, path: str, request, client: FakeDynamoDB, repeats: int) -> tuple:
+    """Time `repeats` runs of one request; returns (result row, keys returned)."""
+    latencies_ms = []
+    rcu_start = client.consumed_rcu
+    for _ in range(repeats):
+        start = time.perf_counter()
+        keys, calls, scanned = request(client)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    return {
+        "pattern": pattern,
+        "path": path,
+        "results": len(keys),
+        "calls": calls,
+        "items_read": scanned,
+        "read_units": round((client.consumed_rcu - rcu_start) / repeats, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+        },
+    }, keys
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per API call")
+    parser.add_argument("--reports", type=int, default=2000, help="Synthetic reports")
+    parser.add_argument("--trends", type=int, default=500, help="Synthetic trends")
+    parser.add_argument("--articles", type=int, default=5000, help="Synthetic TAH articles")
+    parser.add_argument("--body-chars", type=int, default=2000, help="Article body length")
+    parser.add_argument("--tah-shards", type=int, default=0, help="Write shards per TAH region partition")
+    parser.add_argument("--page-size", type=int, default=20, help="Reports per page for reports_by_status")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of each request")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic data")
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    client = FakeDynamoDB()
+    create_table(client, TABLE_NAME)
+    items = synthetic_items(args)
+    with BulkSink(BatchWriter(client, TABLE_NAME, max_workers=8)) as sink:
+        for item in items:
+            sink.put_typed(item)
+    client.latency = args.latency_ms / 1000
+
+    results = []
+    for pattern, index_request, scan_request in patterns(args):
+        index_row, index_keys = measure(pattern, "index", index_request, client, args.repeats)
+        scan_row, scan_keys = measure(pattern, "scan", scan_request, client, args.repeats)
+        assert index_keys == scan_keys, f"{pattern}: index and scan disagree"
+        results += [index_row, scan_row]
+
+    for r in results:
+        print(
+            f"{r['pattern']:<30} {r['path']:<6} {r['results']:>6} results {r['calls']:>5} calls "
+            f"{r['items_read']:>7} read {r['read_units']:>9.1f} RCU  p50 {r['latency_ms']['p50']:>9.2f} ms",
+            file=sys.stderr,
+        )
+
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "table_items": len(items),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark PII redaction of article text: one combined matcher against one regex per pattern.
+
+Redacts the title, summary and article of every record of a JSONL file
+(e.g. synthetic_tah_dataset.jsonl), or of synthetic articles made from the
+seed-data vocabulary with identifiers planted in a --pii-rate fraction of
+them. Each matcher runs in-process and then on a process pool through
+seedlib.transform, as seed-dynamodb.py runs it. Reports MB/s, articles/s
+and hits per identifier type as JSON, and checks both matchers redact
+the same text.
+
+    python3 scripts/bench-redaction.py --articles 20000 --processes 4 -o redaction.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from functools import partial
+from pathlib import Path
+
+from seedlib.pii import redact_article, redact_text, redact_text_naive
+from seedlib.synthetic import load_templates
+from seedlib.transform import default_workers, transform_ordered
+
+SEED_DATA_DIR = Path(__file__).parent / "seed-data"
+
+PLANTED = (
+    "Contact the recruiter at agent.{n}@mail.example.com for details.",
+    "The broker used +91 98765 {n:05d} and (555) 201-{n:04d}.",
+    "Victim SSN 123-45-{n:04d} was recorded at intake.",
+    "Payments went to card 4111 1111 1111 {n:04d}.",
+    "Logins came from 10.20.{a}.{b}.",
+)
+MATCHERS = {"per_pattern": redact_text_naive, "combined": redact_text}
+
+
+def synthetic_articles(args) -> list:
+    """Raw articles of --article-words words, some with planted identifiers."""
+    rng = random.Random(args.seed)
+    words = load_templates(str(SEED_DATA_DIR))["words"]
+    articles = []
+    for n in range(args.articles):
+        text = rng.choices(words, k=args.article_words)
+        if rng.random() < args.pii_rate:
+            for template in rng.sample(PLANTED, rng.randint(1, 3)):
+                sentence = template.format(n=n % 10000, a=n % 256, b=(n // 256) % 256)
+                text.insert(rng.randrange(len(text)), sentence)
+        articles.append({
+            "title": " ".join(rng.choices(words, k=8)),
+            "summary": " ".join(rng.choices(words, k=40)),
+            "article": " ".join(text),
+        })
+    return articles
+
+
+def dataset_articles(path: Path, limit: int) -> list:
+    """Raw articles from a JSONL file, skipping malformed lines."""
+    articles = []
+    with open(path) as f:
+        for line in f:
+            if len(articles) >= limit:
+                break
+            try:
+                articles.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return articles
+
+
+def measure(name: str, matcher, articles: list, processes: int, chunk_size: int) -> tuple:
+    """Redact every article; returns (result row, redacted articles)."""
+    redact = partial(redact_article, redact=matcher)
+    counts = Counter()
+    redacted = []
+    start = time.perf_counter()
+    for article, hits in transform_ordered(redact, articles, processes, chunk_size):
+        redacted.append(article)
+        counts.update(hits)
+    seconds = time.perf_counter() - start
+    megabytes = sum(len(a.get(f) or "") for a in articles for f in ("title", "summary", "article")) / 1e6
+    return {
+        "matcher": name,
+        "processes": processes,
+        "seconds": round(seconds, 4),
+        "mb_per_sec": round(megabytes / seconds, 2) if seconds else 0.0,
+        "articles_per_sec": round(len(articles) / seconds, 1) if seconds else 0.0,
+        "hits": dict(counts.most_common()),
+    }, redacted
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, help="JSONL articles to redact instead of synthetic ones")
+    parser.add_argument("--articles", type=int, default=10_000, help="Articles to redact")
+    parser.add_argument("--article-words", type=int, default=600, help="Words per synthetic article")
+    parser.add_argument("--pii-rate", type=float, default=0.2, help="Fraction of synthetic articles with identifiers")
+    parser.add_argument("--processes", type=int, default=default_workers(), help="Processes for the parallel runs")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Articles per worker task")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic articles")
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    articles = dataset_articles(args.dataset, args.articles) if args.dataset else synthetic_articles(args)
+
+    results, outputs = [], {}
+    for processes in sorted({1, args.processes}):
+        for name, matcher in MATCHERS.items():
+            row, redacted = measure(name, matcher, articles, processes, args.chunk_size)
+            results.append(row)
+            outputs[name] = redacted
+    mismatches = sum(a != b for a, b in zip(outputs["per_pattern"], outputs["combined"]))
+
+    for r in results:
+        print(
+            f"{r['matcher']:<12} {r['processes']:>3} proc {r['mb_per_sec']:>8.2f} MB/s "
+            f"{r['articles_per_sec']:>10.1f} articles/s  hits {sum(r['hits'].values())}",
+            file=sys.stderr,
+        )
+    if mismatches:
+        print(f"{mismatches} articles redacted differently by the two matchers", file=sys.stderr)
+
+    report = {
+        "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items() if k != "output"},
+        "articles": len(articles),
+        "mismatches": mismatches,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Compile scripts/seed-data/*.json into the binary seed cache.
+
+Reads $SEED_DATA_DIR (default scripts/seed-data) and writes to
+$SEED_CACHE_DIR, or to the seed directory's .cache; seed-all.py reads the
+cache from the same place.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+from seedlib.seed_cache import CACHE_DIRNAME, build_cache, cache_is_fresh
+
+SEED_DATA_DIR = Path(os.getenv("SEED_DATA_DIR", Path(__file__).parent / "seed-data"))
+SEED_CACHE_DIR = os.getenv("SEED_CACHE_DIR")
+
+
+def main():
+    """Main entry point."""
+    force = "--force" in sys.argv[1:]
+
+    print(f"Building seed cache in {SEED_CACHE_DIR or SEED_DATA_DIR / CACHE_DIRNAME}")
+    for source in sorted(SEED_DATA_DIR.glob("*.json")):
+        if not force and cache_is_fresh(source, SEED_CACHE_DIR):
+            print(f"  {source.name}: up to date")
+            continue
+        start = time.perf_counter()
+        cache_path = build_cache(source, cache_dir=SEED_CACHE_DIR)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"  {source.name}: {source.stat().st_size} -> {cache_path.stat().st_size} bytes "
+            f"({elapsed_ms:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Create the single table with the indexes of seedlib.indexes.
+
+A missing table is created with all its GSIs. An existing one only gets the
+indexes it lacks, so the script is safe to run on every LocalStack start.
+"""
+
+import os
+import time
+
+from botocore.exceptions import ClientError
+
+from seedlib.clients import dynamodb_client
+from seedlib.indexes import create_table, ensure_indexes
+
+TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
+REGION = os.getenv("AWS_REGION", "us-west-2")
+ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", None)
+
+
+def wait_until_active(client, table_name: str, poll_seconds: float = 1.0):
+    """Block until the table's status is ACTIVE."""
+    while client.describe_table(TableName=table_name)["Table"].get("TableStatus") != "ACTIVE":
+        time.sleep(poll_seconds)
+
+
+def create_or_update(client, table_name: str, poll_seconds: float = 1.0, progress=print) -> bool:
+    """Create `table_name`, or add its missing indexes; True if the table was created."""
+    try:
+        create_table(client, table_name)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") != "ResourceInUseException":
+            raise
+        progress(f"Table {table_name} exists")
+        wait_until_active(client, table_name, poll_seconds)
+        created = ensure_indexes(client, table_name, poll_seconds, progress)
+        progress(f"Indexes created: {', '.join(created)}" if created else "Indexes: all present")
+        return False
+    progress(f"Creating table {table_name}...")
+    wait_until_active(client, table_name, poll_seconds)
+    return True
+
+
+def main():
+    """Main entry point."""
+    client = dynamodb_client(REGION, ENDPOINT_URL)
+    create_or_update(client, TABLE_NAME)
+    print(f"Table {TABLE_NAME} is active")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Export a DynamoDB table into seed-data JSON files with a parallel segmented Scan."""
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+from seedlib.clients import dynamodb_client
+from seedlib.table_export import export_table
+
+# Configuration
+TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
+REGION = os.getenv("AWS_REGION", "us-west-2")
+ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", None)
+SEGMENTS = int(os.getenv("EXPORT_SEGMENTS", "8"))
+PAGE_SIZE = os.getenv("EXPORT_PAGE_SIZE")
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+SEED_DATA_DIR = Path(os.getenv("SEED_DATA_DIR", SCRIPT_DIR / "seed-data"))
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=SEGMENTS,
+        help="Parallel Scan segments (TotalSegments), each on its own thread",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=int(PAGE_SIZE) if PAGE_SIZE else None,
+        help="Scan Limit per page (default: DynamoDB's 1 MB pages)",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=SEED_DATA_DIR,
+        help="Directory for the per-entityType files (default: the seed-data directory)",
+    )
+    parser.add_argument("--no-all-items", action="store_true", help="Do not write all-items.json")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    print("=== DynamoDB Table Export ===")
+    print(f"Table: {TABLE_NAME}")
+    print(f"Region: {REGION}")
+    print(f"Endpoint: {ENDPOINT_URL or 'AWS default'}")
+    print(f"Output: {args.out_dir}")
+    print(f"Segments: {args.segments}")
+    print()
+
+    start = time.perf_counter()
+    client = dynamodb_client(REGION, ENDPOINT_URL, args.segments)
+    counts = export_table(
+        client,
+        TABLE_NAME,
+        args.out_dir,
+        segments=args.segments,
+        page_size=args.page_size,
+        all_items=not args.no_all_items,
+    )
+    elapsed = time.perf_counter() - start
+
+    print()
+    for filename, count in sorted(counts.items()):
+        print(f"  {filename}: {count} items")
+    print(f"=== Export complete in {elapsed:.2f}s ===")
+
+
+if __name__ == "__main__":
+    main()
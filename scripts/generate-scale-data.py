@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Generate synthetic scale-test data from the seed-data templates.
+
+Builds reports, partners, trends, conversations with their messages and
+TAH articles with seedlib.synthetic: deterministic for a given --seed,
+spread over --orgs organisations, with Zipf-skewed hot orgs and hot
+regions. Chunks are generated on --processes worker processes and then
+streamed, in order, to one of:
+
+- sharded files: --out-dir writes `<entity>-NNNN.json` seed-data arrays of
+  at most --shard-items items each
+- the table: written through BulkSink (--mode bulk) or AsyncBulkSink
+  (--mode async)
+- an in-process DynamoDB stand-in (--fake), to measure generation and
+  write throughput offline
+
+    python3 scripts/generate-scale-data.py --out-dir /tmp/scale --reports 1000000 --articles 2000000
+    python3 scripts/generate-scale-data.py --fake --mode async --org-skew 1.3
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from functools import partial
+from pathlib import Path
+
+from seedlib.async_sink import AsyncBulkSink, async_client_factory
+from seedlib.batch_writer import BatchWriter
+from seedlib.clients import client_options, dynamodb_client
+from seedlib.fake_dynamodb import AsyncFakeDynamoDB, FakeDynamoDB
+from seedlib.sink import BulkSink
+from seedlib.synthetic import KINDS, REGIONS, ScaleConfig, SkewedChoice, chunk_plan, generate_chunk, org_ids
+from seedlib.table_export import JsonArrayWriter, entity_filename
+from seedlib.transform import default_workers, transform_ordered
+
+# Configuration
+TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
+REGION = os.getenv("AWS_REGION", "us-west-2")
+ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", None)
+WORKERS = int(os.getenv("SEED_WORKERS", "8"))
+CONCURRENCY = int(os.getenv("SEED_CONCURRENCY", "64"))
+SCALE_SEED = int(os.getenv("SCALE_SEED", "42"))
+SCALE_ORGS = int(os.getenv("SCALE_ORGS", "100"))
+SCALE_ORG_SKEW = float(os.getenv("SCALE_ORG_SKEW", "1.1"))
+SCALE_REGION_SKEW = float(os.getenv("SCALE_REGION_SKEW", "1.1"))
+SHARD_ITEMS = int(os.getenv("SCALE_SHARD_ITEMS", "100000"))
+TAH_SHARDS = int(os.getenv("TAH_SHARDS", "0"))
+ITEM_ENCODING = os.getenv("ITEM_ENCODING", "json")
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+SEED_DATA_DIR = Path(os.getenv("SEED_DATA_DIR", SCRIPT_DIR / "seed-data"))
+
+
+class ShardedFiles:
+    """Per-entityType JSON array files rotated every `shard_items` items."""
+
+    def __init__(self, out_dir: Path, shard_items: int, buffer_items: int = 1000):
+        self.out_dir = out_dir
+        self.shard_items = shard_items
+        self.buffer_items = buffer_items
+        self.files = []
+        self._writers = {}
+        self._shards = Counter()
+        self._pending = {}
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+    def _writer(self, entity_type: str) -> JsonArrayWriter:
+        """The entity's open shard, starting a new one when it is full."""
+        writer = self._writers.get(entity_type)
+        if writer is None or writer.count >= self.shard_items:
+            if writer is not None:
+                writer.commit()
+            stem = entity_filename(entity_type).removesuffix(".json")
+            path = self.out_dir / f"{stem}-{self._shards[entity_type]:04d}.json"
+            self._shards[entity_type] += 1
+            writer = self._writers[entity_type] = JsonArrayWriter(path)
+            self.files.append(path)
+        return writer
+
+    def _drain(self, entity_type: str):
+        """Write an entity's buffered items, splitting them over shards."""
+        pending = self._pending.pop(entity_type, [])
+        while pending:
+            writer = self._writer(entity_type)
+            room = self.shard_items - writer.count
+            writer.write_many(pending[:room])
+            pending = pending[room:]
+
+    def put_typed(self, dynamo_item: dict):
+        """Queue one typed item for its entity's current shard."""
+        entity_type = dynamo_item.get("entityType", {}).get("S")
+        pending = self._pending.setdefault(entity_type, [])
+        pending.append(dynamo_item)
+        if len(pending) >= self.buffer_items:
+            self._drain(entity_type)
+
+    def close(self) -> list:
+        """Write the remainder and commit every open shard; returns the files written."""
+        for entity_type in list(self._pending):
+            self._drain(entity_type)
+        for writer in self._writers.values():
+            writer.commit()
+        self._writers = {}
+        return self.files
+
+    def abort(self):
+        """Drop the open shards; shards already committed stay."""
+        for writer in self._writers.values():
+            writer.abort()
+        self._writers = {}
+
+
+def open_sink(args, client):
+    """BulkSink or AsyncBulkSink writing to `client` (a FakeDynamoDB with --fake)."""
+    if args.mode == "async":
+        if args.fake:
+            open_client = partial(AsyncFakeDynamoDB, client, args.latency_ms / 1000)
+        else:
+            open_client = async_client_factory("dynamodb", ENDPOINT_URL, **client_options(REGION, args.concurrency))
+        return AsyncBulkSink(open_client, TABLE_NAME, concurrency=args.concurrency)
+    return BulkSink(BatchWriter(client, TABLE_NAME, max_workers=args.workers))
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=SCALE_SEED, help="Random seed; the same seed gives the same items")
+    parser.add_argument("--orgs", type=int, default=SCALE_ORGS, help="Organisations reports and conversations are spread over")
+    parser.add_argument("--reports", type=int, default=100_000, help="Report items")
+    parser.add_argument("--partners", type=int, default=1000, help="Partner items")
+    parser.add_argument("--trends", type=int, default=1000, help="Trend items")
+    parser.add_argument("--conversations", type=int, default=10_000, help="Conversations")
+    parser.add_argument("--messages-per-conversation", type=int, default=10, help="Messages per conversation")
+    parser.add_argument("--articles", type=int, default=100_000, help="TahArticle items")
+    parser.add_argument("--article-words", type=int, default=300, help="Mean article length in words")
+    parser.add_argument(
+        "--org-skew", type=float, default=SCALE_ORG_SKEW, help="Zipf exponent of the org distribution (0 = uniform)"
+    )
+    parser.add_argument(
+        "--region-skew", type=float, default=SCALE_REGION_SKEW, help="Zipf exponent of the article regions (0 = uniform)"
+    )
+    parser.add_argument("--tah-shards", type=int, default=TAH_SHARDS, help="Write shards per TAH region partition")
+    parser.add_argument("--encoding", choices=("json", "native"), default=ITEM_ENCODING, help="Item encoding")
+    parser.add_argument(
+        "--kinds", default=",".join(KINDS), help=f"Comma-separated kinds to generate (default: {','.join(KINDS)})"
+    )
+    parser.add_argument("--templates", type=Path, default=SEED_DATA_DIR, help="Directory of the seed-data templates")
+    parser.add_argument("--processes", type=int, default=default_workers(), help="Generator processes")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--out-dir", type=Path, help="Write sharded JSON files here instead of to the table")
+    target.add_argument("--fake", action="store_true", help="Write to an in-process DynamoDB stand-in")
+    parser.add_argument("--shard-items", type=int, default=SHARD_ITEMS, help="Items per output file")
+    parser.add_argument("--mode", choices=("bulk", "async"), default="bulk", help="Table write path")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Batch writer threads (bulk mode)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="Batches in flight (async mode)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per call with --fake")
+    parser.add_argument("-o", "--output", help="Also write the JSON summary here")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        sys.exit(f"unknown kinds: {', '.join(sorted(unknown))}")
+
+    config = ScaleConfig(
+        templates_dir=str(args.templates),
+        seed=args.seed,
+        orgs=args.orgs,
+        partners=args.partners,
+        trends=args.trends,
+        reports=args.reports,
+        conversations=args.conversations,
+        messages_per_conversation=args.messages_per_conversation,
+        articles=args.articles,
+        org_skew=args.org_skew,
+        region_skew=args.region_skew,
+        tah_shards=args.tah_shards,
+        article_words=args.article_words,
+        encoding=args.encoding,
+    )
+    orgs = SkewedChoice(org_ids(args.orgs), args.org_skew)
+    regions = SkewedChoice(REGIONS, args.region_skew)
+
+    print("=== Synthetic Scale Data ===")
+    print(f"Seed: {args.seed}  Orgs: {args.orgs}  Kinds: {', '.join(kinds)}")
+    print(f"Hot org share: top 1 {orgs.share(1):.1%}, top 10% {orgs.share(max(1, args.orgs // 10)):.1%}")
+    print(f"Hot region share: {regions.values[0]} {regions.share(1):.1%}")
+    if args.out_dir:
+        print(f"Output: {args.out_dir} ({args.shard_items} items per file)")
+    else:
+        print(f"Table: {'in-process stand-in' if args.fake else f'{ENDPOINT_URL or REGION}/{TABLE_NAME}'} ({args.mode})")
+    print()
+
+    client = None
+    if args.out_dir:
+        sink = ShardedFiles(args.out_dir, args.shard_items)
+    else:
+        client = FakeDynamoDB(latency=0.0 if args.mode == "async" else args.latency_ms / 1000) if args.fake else (
+            dynamodb_client(REGION, ENDPOINT_URL, args.workers)
+        )
+        sink = open_sink(args, client)
+
+    counts = Counter()
+    start = time.perf_counter()
+    try:
+        chunks = transform_ordered(partial(generate_chunk, config), chunk_plan(config, kinds), args.processes, 1)
+        for items in chunks:
+            for item in items:
+                sink.put_typed(item)
+                counts[item["entityType"]["S"]] += 1
+    except BaseException:
+        if args.out_dir:
+            sink.abort()
+        else:
+            sink.close()
+        raise
+    result = sink.close()
+    elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    for entity_type, count in sorted(counts.items()):
+        print(f"  {entity_type}: {count}")
+    summary = {
+        "config": config.describe(),
+        "items": dict(counts),
+        "total": total,
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(total / elapsed, 1) if elapsed else 0.0,
+    }
+    if args.out_dir:
+        summary["files"] = [str(path) for path in result]
+        print(f"  files: {len(result)}")
+    else:
+        summary["written"] = result.written
+        summary["failed"] = result.failed
+        print(f"  written: {result.written}, failed: {result.failed}")
+        for error in result.errors:
+            print(f"  Error: {error}")
+    print(f"=== Generated {total} items in {elapsed:.2f}s ({summary['items_per_sec']:.0f} items/s) ===")
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, indent=2) + "\n")
+    if not args.out_dir and result.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,118 +7,68 @@ echo "Initializing LocalStack resources..."
 awslocal s3 mb s3://lon12-bucket --region us-west-2
 awslocal s3 mb s3://treven-data-local --region us-west-2
 
-# Create DynamoDB table (single-table design)
-awslocal dynamodb create-table \
-    --table-name lon12-table \
-    --attribute-definitions \
-        AttributeName=PK,AttributeType=S \
-        AttributeName=SK,AttributeType=S \
-    --key-schema \
-        AttributeName=PK,KeyType=HASH \
-        AttributeName=SK,KeyType=RANGE \
-    --billing-mode PAY_PER_REQUEST \
-    --region us-west-2
-
-echo "Waiting for table to be active..."
-awslocal dynamodb wait table-exists --table-name lon12-table --region us-west-2
-sleep 2
+# Create DynamoDB table (single-table design) with the GSIs of
+# scripts/seedlib/indexes.py; an existing table only gets the indexes it lacks.
+PYTHONDONTWRITEBYTECODE=1 \
+DYNAMODB_ENDPOINT=http://localhost:4566 \
+AWS_REGION=us-west-2 \
+AWS_ACCESS_KEY_ID="${AWS_ACCESS_KEY_ID:-test}" \
+AWS_SECRET_ACCESS_KEY="${AWS_SECRET_ACCESS_KEY:-test}" \
+DYNAMODB_TABLE=lon12-table \
+    python3 /seed-scripts/create-table.py
 
 echo "LocalStack table created!"
 
-# Seed initial data from JSON files using Python
-echo "Seeding initial data from JSON files..."
-
+# Seed initial data in one long-lived Python process (pooled client, concurrent
+# batches); it logs per-entity and total timings. seed-all.py reads $SEED_DIR,
+# or falls back to its hardcoded partners/trends/reports when the seed files
+# are not mounted. With SEED_WARM_CACHE=1 it then writes the partner, trend
+# and report lists to Redis.
 SEED_DIR="/seed-data"
+SEED_SCRIPTS="/seed-scripts"
+
+# The seed files and scripts are mounted read-only, so the binary seed cache
+# lives on the localstack_data volume. It is only rebuilt when a seed file
+# changes, so warm starts load the cached batches instead of parsing JSON.
+# The batches are read as plain data only (see seedlib/seed_cache.py).
+SEED_CACHE_DIR="${SEED_CACHE_DIR:-/var/lib/localstack/seed-cache}"
+if [ -d "$SEED_DIR" ]; then
+    echo "Building seed cache..."
+    PYTHONDONTWRITEBYTECODE=1 \
+    SEED_DATA_DIR="$SEED_DIR" \
+    SEED_CACHE_DIR="$SEED_CACHE_DIR" \
+        python3 "$SEED_SCRIPTS/build-seed-cache.py" || echo "  Seed cache build failed; seeding parses the JSON"
+fi
 
-if [ -d "$SEED_DIR" ] && [ -f "$SEED_DIR/partners.json" ]; then
-    python3 << 'PYTHON_SCRIPT'
-import json
-import subprocess
-import os
-
-SEED_DIR = "/seed-data"
-TABLE_NAME = "lon12-table"
-REGION = "us-west-2"
-
-def load_json_file(filename):
-    filepath = os.path.join(SEED_DIR, filename)
-    if not os.path.exists(filepath):
-        print(f"  Warning: {filepath} not found")
-        return []
-    with open(filepath, 'r') as f:
-        return json.load(f)
-
-def batch_write_items(items, entity_type):
-    if not items:
-        return 0
-
-    count = 0
-    batch_size = 25
-
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i+batch_size]
-        request_items = {
-            TABLE_NAME: [{"PutRequest": {"Item": item}} for item in batch]
-        }
-
-        # Write to temp file and use awslocal
-        with open('/tmp/batch.json', 'w') as f:
-            json.dump(request_items, f)
-
-        result = subprocess.run(
-            ['awslocal', 'dynamodb', 'batch-write-item',
-             '--request-items', 'file:///tmp/batch.json',
-             '--region', REGION],
-            capture_output=True, text=True
-        )
-
-        if result.returncode != 0:
-            print(f"  Error: {result.stderr}")
-
-        count += len(batch)
-
-    print(f"  Loaded {count} {entity_type}")
-    return count
-
-# Load all entity types
-files = [
-    ("partners.json", "Partners"),
-    ("trends.json", "Trends"),
-    ("reports.json", "Reports"),
-    ("conversations.json", "Conversations"),
-    ("messages.json", "Messages"),
-]
-
-total = 0
-for filename, entity_type in files:
-    items = load_json_file(filename)
-    total += batch_write_items(items, entity_type)
-
-print(f"\nTotal items loaded: {total}")
-PYTHON_SCRIPT
-
-else
-    echo "No seed-data directory found, loading hardcoded data..."
-
-    # Partners (fallback)
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-001"},"entityType":{"S":"Partner"},"id":{"S":"partner-001"},"name":{"S":"Barclays Bank"},"type":{"S":"fi"},"reportsShared":{"N":"12"},"accessLevel":{"S":"download"},"createdAt":{"S":"2026-01-10T10:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-002"},"entityType":{"S":"Partner"},"id":{"S":"partner-002"},"name":{"S":"HSBC"},"type":{"S":"fi"},"reportsShared":{"N":"8"},"accessLevel":{"S":"view"},"createdAt":{"S":"2026-01-08T09:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-003"},"entityType":{"S":"Partner"},"id":{"S":"partner-003"},"name":{"S":"Anti-Slavery International"},"type":{"S":"ngo"},"reportsShared":{"N":"15"},"accessLevel":{"S":"download"},"createdAt":{"S":"2026-01-05T11:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-004"},"entityType":{"S":"Partner"},"id":{"S":"partner-004"},"name":{"S":"Metropolitan Police"},"type":{"S":"le"},"reportsShared":{"N":"6"},"accessLevel":{"S":"download"},"createdAt":{"S":"2026-01-12T14:30:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-005"},"entityType":{"S":"Partner"},"id":{"S":"partner-005"},"name":{"S":"Europol"},"type":{"S":"le"},"reportsShared":{"N":"4"},"accessLevel":{"S":"view"},"createdAt":{"S":"2026-01-11T16:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"PARTNERS"},"SK":{"S":"PARTNER#partner-006"},"entityType":{"S":"Partner"},"id":{"S":"partner-006"},"name":{"S":"Standard Chartered"},"type":{"S":"fi"},"reportsShared":{"N":"10"},"accessLevel":{"S":"download"},"createdAt":{"S":"2026-01-09T08:00:00Z"}}' --region us-west-2
-
-    # Trends (fallback)
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"TRENDS"},"SK":{"S":"TREND#GB#trend-001"},"entityType":{"S":"Trend"},"id":{"S":"trend-001"},"country":{"S":"United Kingdom"},"countryCode":{"S":"GB"},"title":{"S":"Modern Slavery in Supply Chains"},"confidence":{"S":"high"},"exploitationType":{"S":"labour_exploitation"},"summary":{"S":"Increasing evidence of labour exploitation in UK supply chains, particularly in car washes, agriculture, and construction sectors."},"sources":{"S":"[]"},"lastUpdated":{"S":"2026-01-15T00:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"TRENDS"},"SK":{"S":"TREND#IN#trend-002"},"entityType":{"S":"Trend"},"id":{"S":"trend-002"},"country":{"S":"India"},"countryCode":{"S":"IN"},"title":{"S":"Child Labour in Manufacturing"},"confidence":{"S":"high"},"exploitationType":{"S":"child_labour"},"summary":{"S":"Persistent child labour issues in garment manufacturing and brick kilns, often linked to debt bondage."},"sources":{"S":"[]"},"lastUpdated":{"S":"2026-01-15T00:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"TRENDS"},"SK":{"S":"TREND#BR#trend-003"},"entityType":{"S":"Trend"},"id":{"S":"trend-003"},"country":{"S":"Brazil"},"countryCode":{"S":"BR"},"title":{"S":"Sexual Exploitation in Tourism"},"confidence":{"S":"medium"},"exploitationType":{"S":"sexual_exploitation"},"summary":{"S":"Growing concern about sexual exploitation linked to tourism industry in coastal areas."},"sources":{"S":"[]"},"lastUpdated":{"S":"2026-01-15T00:00:00Z"}}' --region us-west-2
-
-    # Reports (fallback)
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"ORG#stt"},"SK":{"S":"REPORT#report-001"},"entityType":{"S":"Report"},"id":{"S":"report-001"},"orgId":{"S":"stt"},"title":{"S":"Labour Exploitation in UK Car Washes"},"country":{"S":"United Kingdom"},"sector":{"S":"Car Wash"},"exploitationType":{"S":"labour_exploitation"},"status":{"S":"approved"},"version":{"N":"3"},"wordCount":{"N":"2450"},"createdAt":{"S":"2026-01-10T10:00:00Z"},"updatedAt":{"S":"2026-01-12T14:30:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"ORG#stt"},"SK":{"S":"REPORT#report-002"},"entityType":{"S":"Report"},"id":{"S":"report-002"},"orgId":{"S":"stt"},"title":{"S":"Sexual Exploitation via Online Platforms in Italy"},"country":{"S":"Italy"},"sector":{"S":"Online Platforms"},"exploitationType":{"S":"sexual_exploitation"},"status":{"S":"in_review"},"version":{"N":"2"},"wordCount":{"N":"2180"},"createdAt":{"S":"2026-01-08T09:00:00Z"},"updatedAt":{"S":"2026-01-11T16:00:00Z"}}' --region us-west-2
-    awslocal dynamodb put-item --table-name lon12-table --item '{"PK":{"S":"ORG#stt"},"SK":{"S":"REPORT#report-003"},"entityType":{"S":"Report"},"id":{"S":"report-003"},"orgId":{"S":"stt"},"title":{"S":"Child Labour in Indian Manufacturing"},"country":{"S":"India"},"sector":{"S":"Manufacturing"},"exploitationType":{"S":"child_labour"},"status":{"S":"draft"},"version":{"N":"1"},"wordCount":{"N":"1850"},"createdAt":{"S":"2026-01-05T11:00:00Z"},"updatedAt":{"S":"2026-01-05T11:00:00Z"}}' --region us-west-2
-
-    echo "  Loaded fallback data: 6 Partners, 3 Trends, 3 Reports"
+echo "Seeding initial data..."
+
+PYTHONDONTWRITEBYTECODE=1 \
+DYNAMODB_ENDPOINT=http://localhost:4566 \
+AWS_REGION=us-west-2 \
+AWS_ACCESS_KEY_ID="${AWS_ACCESS_KEY_ID:-test}" \
+AWS_SECRET_ACCESS_KEY="${AWS_SECRET_ACCESS_KEY:-test}" \
+SEED_DATA_DIR="$SEED_DIR" \
+SEED_CACHE_DIR="$SEED_CACHE_DIR" \
+SEED_WARM_CACHE="${SEED_WARM_CACHE:-}" \
+REDIS_URL="${REDIS_URL:-redis://redis:6379}" \
+    python3 "$SEED_SCRIPTS/seed-all.py"
+SEED_STATUS=$?
+
+if [ $SEED_STATUS -ne 0 ]; then
+    echo "  Seeding finished with errors (exit $SEED_STATUS)"
 fi
 
+# Upload report markdown (plus any files under $ARTIFACTS_DIR, laid out as the
+# bucket) and message bodies to treven-data-local under <orgId>/..., then
+# record s3Keys / contentRef on the items. Unchanged objects are skipped.
+echo "Uploading artifacts..."
+PYTHONDONTWRITEBYTECODE=1 \
+DYNAMODB_ENDPOINT=http://localhost:4566 \
+AWS_REGION=us-west-2 \
+AWS_ACCESS_KEY_ID="${AWS_ACCESS_KEY_ID:-test}" \
+AWS_SECRET_ACCESS_KEY="${AWS_SECRET_ACCESS_KEY:-test}" \
+ARTIFACT_BUCKET=treven-data-local \
+ARTIFACTS_DIR="${ARTIFACTS_DIR:-}" \
+    python3 "$SEED_SCRIPTS/upload-artifacts.py" || echo "  Artifact upload finished with errors"
+
 echo "LocalStack initialization complete!"
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Ranked keyword search over the TAH articles of a keyword index.
+
+Build the index while seeding, then query it:
+
+    python3 scripts/seed-dynamodb.py --keyword-index tah-keywords.idx
+    python3 scripts/search-articles.py "debt bondage brick kiln" -n 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from seedlib.keyword_index import KeywordIndex
+
+KEYWORD_INDEX = os.getenv("KEYWORD_INDEX", "tah-keywords.idx")
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", help="Free-text query")
+    parser.add_argument("--index", default=KEYWORD_INDEX, help="Keyword index file written by seed-dynamodb.py")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="Results to show")
+    parser.add_argument("--all", action="store_true", help="Only articles containing every query term")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    if not os.path.exists(args.index):
+        print(f"Keyword index not found: {args.index}", file=sys.stderr)
+        sys.exit(1)
+
+    with KeywordIndex(args.index) as index:
+        start = time.perf_counter()
+        results = index.search(args.query, limit=args.limit, require_all=args.all)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{len(results)} results from {index.header['docs']} articles in {elapsed_ms:.2f} ms")
+        for score, pk, doc_id in results:
+            print(f"  {score:7.3f}  {pk}  ARTICLE#{doc_id}")
+
+
+if __name__ == "__main__":
+    main()
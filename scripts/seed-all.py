@@ -1,63 +1,113 @@
 #!/usr/bin/env python3
 """Comprehensive seed script - loads all data into DynamoDB."""
 
-import json
+import argparse
 import os
+import sys
+import time
 from pathlib import Path
 
-import boto3
-from botocore.config import Config
+from seedlib.aggregates import Aggregates
+from seedlib.batch_writer import BatchWriter
+from seedlib.cache_warmup import CACHE_ERRORS, DEFAULT_PREFIX, DEFAULT_TTLS, ReadModels, redis_client, warm_cache
+from seedlib.clients import dynamodb_client
+from seedlib.indexes import add_index_keys
+from seedlib.manifest import Manifest
+from seedlib.marshal import item_key
+from seedlib.messages import rekey_message
+from seedlib.rate_limiter import table_rate_limiter
+from seedlib.seed_cache import load_items
+from seedlib.sink import BulkSink
+from seedlib.telemetry import Telemetry
 
 # Configuration
 TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
 REGION = os.getenv("AWS_REGION", "us-west-2")
 ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", "http://localhost:4566")
+WORKERS = int(os.getenv("SEED_WORKERS", "8"))
+MAX_RETRIES = int(os.getenv("SEED_MAX_RETRIES", "8"))
+MANIFEST_PATH = os.getenv("SEED_MANIFEST")
+TARGET_UTILISATION = os.getenv("SEED_TARGET_UTILISATION")
+WRITE_CAPACITY = os.getenv("SEED_WRITE_CAPACITY")
+METRICS_DIR = os.getenv("SEED_METRICS_DIR")
+STATS = os.getenv("SEED_STATS", "1") not in ("", "0")
+WARM_CACHE = os.getenv("SEED_WARM_CACHE", "") not in ("", "0")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", DEFAULT_PREFIX)
+CACHE_TTLS = {model: int(os.getenv(f"CACHE_TTL_{model.upper()}", ttl)) for model, ttl in DEFAULT_TTLS.items()}
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
-SEED_DATA_DIR = SCRIPT_DIR / "seed-data"
+SEED_DATA_DIR = Path(os.getenv("SEED_DATA_DIR", SCRIPT_DIR / "seed-data"))
+SEED_CACHE_DIR = os.getenv("SEED_CACHE_DIR")  # build-seed-cache.py output, if not seed-data/.cache
 
+# Failed item counts per batch_write_items call, checked before exiting
+FAILURES = []
 
-def get_dynamodb_client():
-    """Create DynamoDB client."""
-    config = Config(region_name=REGION)
-    return boto3.client("dynamodb", endpoint_url=ENDPOINT_URL, config=config)
+# Shared by every batch_write_items call when --target-utilisation is set
+RATE_LIMITER = None
+
+# STATS#... counters maintained by every batch_write_items call with --manifest, unless --no-stats
+AGGREGATES = None
+
+# Read models for the Redis warm-up, fed by every batch_write_items call with --warm-cache
+READ_MODELS = None
+
+# Per-entity metrics of this run, exported with --metrics-dir
+TELEMETRY = Telemetry()
+
+
+def get_redis_client(url: str = REDIS_URL):
+    """Create the Redis client of the cache warm-up."""
+    return redis_client(url)
 
 
 def load_json_file(filename: str) -> list:
-    """Load items from a JSON file."""
+    """Load items from a JSON file, via the binary seed cache when it is fresh."""
     filepath = SEED_DATA_DIR / filename
     if not filepath.exists():
         print(f"  Warning: {filepath} not found")
         return []
-    with open(filepath, "r") as f:
-        return json.load(f)
+    return load_items(filepath, SEED_CACHE_DIR)
 
 
-def batch_write_items(client, items: list, entity_type: str):
-    """Write items to DynamoDB in batches of 25."""
+def batch_write_items(client, items: list, entity_type: str, manifest=None):
+    """Write items to DynamoDB in concurrent batches of 25, retrying unprocessed items."""
     if not items:
         return 0
 
-    count = 0
-    batch = []
-
-    for item in items:
-        batch.append({"PutRequest": {"Item": item}})
-        count += 1
-
-        if len(batch) == 25:
-            client.batch_write_item(RequestItems={TABLE_NAME: batch})
-            batch = []
-
-    if batch:
-        client.batch_write_item(RequestItems={TABLE_NAME: batch})
-
-    print(f"  Loaded {count} {entity_type}")
-    return count
-
-
-def seed_from_files(client):
+    start = time.perf_counter()
+    writer = BatchWriter(
+        client,
+        TABLE_NAME,
+        max_workers=WORKERS,
+        max_retries=MAX_RETRIES,
+        rate_limiter=RATE_LIMITER,
+        telemetry=TELEMETRY,
+    )
+    with TELEMETRY.stage(items[0]["entityType"]["S"], "sink"):
+        with BulkSink(writer, manifest=manifest, aggregates=AGGREGATES) as sink:
+            for item in items:
+                sink.put_typed(add_index_keys(item))
+        result = sink.close()
+    elapsed = time.perf_counter() - start
+    if READ_MODELS:
+        failed = {item_key(item) for item in result.failed_items}
+        for item in items:
+            if item_key(item) not in failed:
+                READ_MODELS.add(item)
+
+    print(
+        f"  Loaded {result.written} {entity_type} in {elapsed * 1000:.0f} ms "
+        f"(unchanged {result.skipped}, retried {result.retried}, failed {result.failed})"
+    )
+    for error in result.errors:
+        print(f"  Error: {error}")
+    FAILURES.append(result.failed)
+    return result.written
+
+
+def seed_from_files(client, manifest=None):
     """Load seed data from JSON files."""
     print("Loading seed data from files...")
 
@@ -65,21 +115,26 @@ def seed_from_files(client):
 
     # Load each entity type
     files = [
-        ("partners.json", "Partners"),
-        ("trends.json", "Trends"),
-        ("reports.json", "Reports"),
-        ("conversations.json", "Conversations"),
-        ("messages.json", "Messages"),
+        ("partners.json", "Partners", "Partner"),
+        ("trends.json", "Trends", "Trend"),
+        ("reports.json", "Reports", "Report"),
+        ("conversations.json", "Conversations", "Conversation"),
+        ("messages.json", "Messages", "Message"),
     ]
 
-    for filename, entity_type in files:
-        items = load_json_file(filename)
-        total += batch_write_items(client, items, entity_type)
+    for filename, entity_type, entity in files:
+        with TELEMETRY.stage(entity, "parse"):
+            items = load_json_file(filename)
+        if entity == "Message":
+            # Time-ordered keys, so a conversation's history is one sorted Query
+            with TELEMETRY.stage(entity, "transform"):
+                items = [rekey_message(item) for item in items]
+        total += batch_write_items(client, items, entity_type, manifest)
 
     return total
 
 
-def seed_hardcoded_partners(client):
+def seed_hardcoded_partners(client, manifest=None):
     """Seed partners if no JSON file exists."""
     partners = [
         {
@@ -149,10 +204,10 @@ def seed_hardcoded_partners(client):
             "createdAt": {"S": "2026-01-09T08:00:00Z"},
         },
     ]
-    return batch_write_items(client, partners, "Partners (hardcoded)")
+    return batch_write_items(client, partners, "Partners (hardcoded)", manifest)
 
 
-def seed_hardcoded_trends(client):
+def seed_hardcoded_trends(client, manifest=None):
     """Seed trends if no JSON file exists."""
     trends = [
         {
@@ -198,10 +253,10 @@ def seed_hardcoded_trends(client):
             "lastUpdated": {"S": "2026-01-15T00:00:00Z"},
         },
     ]
-    return batch_write_items(client, trends, "Trends (hardcoded)")
+    return batch_write_items(client, trends, "Trends (hardcoded)", manifest)
 
 
-def seed_hardcoded_reports(client):
+def seed_hardcoded_reports(client, manifest=None):
     """Seed reports if no JSON file exists."""
     reports = [
         {
@@ -253,31 +308,124 @@ def seed_hardcoded_reports(client):
             "updatedAt": {"S": "2026-01-05T11:00:00Z"},
         },
     ]
-    return batch_write_items(client, reports, "Reports (hardcoded)")
+    return batch_write_items(client, reports, "Reports (hardcoded)", manifest)
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target-utilisation",
+        type=float,
+        default=float(TARGET_UTILISATION) if TARGET_UTILISATION else None,
+        help="Pace writes to this fraction (0-1] of the table's write capacity, backing off on throttles",
+    )
+    parser.add_argument(
+        "--write-capacity",
+        type=float,
+        default=float(WRITE_CAPACITY) if WRITE_CAPACITY else None,
+        help="Table WCU for --target-utilisation (default: provisioned WCU from DescribeTable)",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default=METRICS_DIR,
+        help="Write per-entity metrics here as seed-metrics.prom (Prometheus text) and seed-metrics.json",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=MANIFEST_PATH,
+        help="SQLite manifest file; only new or changed items are written and interrupted runs resume",
+    )
+    parser.add_argument("--full", action="store_true", help="Rewrite every item even if the manifest has it")
+    parser.add_argument(
+        "--no-stats",
+        dest="stats",
+        action="store_false",
+        default=STATS,
+        help="Do not maintain the STATS#... aggregate items (seedlib.aggregates); they are only kept with --manifest",
+    )
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        default=WARM_CACHE,
+        help="Write the partner, trend and report list read models to Redis after seeding (seedlib.cache_warmup)",
+    )
+    parser.add_argument("--redis-url", default=REDIS_URL, help="Redis to warm with --warm-cache")
+    for model, ttl in CACHE_TTLS.items():
+        parser.add_argument(
+            f"--{model}-ttl", type=int, default=ttl, help=f"Seconds the cached {model} read models live"
+        )
+    return parser.parse_args()
+
+
+def warm_redis(args):
+    """Write the collected read models to Redis; a cache that is down only costs a warning."""
+    ttls = {model: getattr(args, f"{model}_ttl") for model in CACHE_TTLS}
+    try:
+        counts = warm_cache(get_redis_client(args.redis_url), READ_MODELS, ttls)
+    except CACHE_ERRORS as e:
+        print(f"Cache warm-up skipped, Redis unavailable: {e}")
+        return
+    print(
+        f"Cache warmed: {counts['partners']} partner, {counts['trends']} trend and {counts['reports']} report "
+        f"lists in {counts['round_trips']} round trips, {counts['seconds'] * 1000:.0f} ms"
+    )
 
 
 def main():
     """Main entry point."""
-    print(f"=== Comprehensive DynamoDB Seed ===")
+    global RATE_LIMITER, AGGREGATES, READ_MODELS
+    args = parse_args()
+
+    print("=== Comprehensive DynamoDB Seed ===")
     print(f"Table: {TABLE_NAME}")
     print(f"Region: {REGION}")
     print(f"Endpoint: {ENDPOINT_URL}")
+    print(f"Seed data: {SEED_DATA_DIR}")
+    print(f"Workers: {WORKERS}")
     print()
 
-    client = get_dynamodb_client()
+    start = time.perf_counter()
+    client = dynamodb_client(REGION, ENDPOINT_URL, WORKERS)
+    manifest = Manifest(args.manifest, f"{ENDPOINT_URL}/{TABLE_NAME}", full=args.full) if args.manifest else None
+    if args.target_utilisation:
+        RATE_LIMITER = table_rate_limiter(client, TABLE_NAME, args.target_utilisation, args.write_capacity)
+        print(f"Write rate: {RATE_LIMITER.ceiling:.0f} WCU/s" if RATE_LIMITER else "Write rate: unlimited (on-demand)")
+    if args.stats and manifest:
+        AGGREGATES = Aggregates(manifest)
+    elif args.stats:
+        print("Stats: not maintained without --manifest, as a rerun would count every item again")
+    if args.warm_cache:
+        READ_MODELS = ReadModels(CACHE_PREFIX)
 
     # Check if seed-data directory exists with files
     if SEED_DATA_DIR.exists() and (SEED_DATA_DIR / "partners.json").exists():
-        total = seed_from_files(client)
+        total = seed_from_files(client, manifest)
     else:
         print("No seed-data files found, using hardcoded data...")
         total = 0
-        total += seed_hardcoded_partners(client)
-        total += seed_hardcoded_trends(client)
-        total += seed_hardcoded_reports(client)
+        total += seed_hardcoded_partners(client, manifest)
+        total += seed_hardcoded_trends(client, manifest)
+        total += seed_hardcoded_reports(client, manifest)
+
+    if READ_MODELS:
+        warm_redis(args)
 
     print()
-    print(f"=== Seeding complete! Total items: {total} ===")
+    if manifest:
+        manifest.close()
+
+    failed = sum(FAILURES)
+    elapsed = time.perf_counter() - start
+    print(f"=== Seeding complete! Total items: {total}, failed: {failed}, {elapsed:.2f}s ===")
+    if AGGREGATES:
+        print(f"Stats items updated: {AGGREGATES.updates}")
+    for line in TELEMETRY.table():
+        print(line)
+    if args.metrics_dir:
+        print(f"Metrics: {', '.join(TELEMETRY.export(args.metrics_dir))}")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
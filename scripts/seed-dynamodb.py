@@ -1,67 +1,158 @@
 #!/usr/bin/env python3
 """Seed DynamoDB with initial data from hackathon dataset."""
 
-import json
+import argparse
 import os
 import sys
-from datetime import datetime
+import time
+from collections import Counter
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
-import boto3
-from botocore.config import Config
+from seedlib.aggregates import Aggregates
+from seedlib.article_body import BODY_MODES, OFFLOAD_THRESHOLD, OffloadSink
+from seedlib.async_sink import AsyncBulkSink, async_client_factory
+from seedlib.articles import india_article_item, item_with_pii, synthetic_article_item
+from seedlib.batch_writer import BatchWriter
+from seedlib.clients import client_options, dynamodb_client, s3_client
+from seedlib.codec import ENCODINGS, get_marshaller
+from seedlib.dedup import NearDuplicateDetector, alias_item
+from seedlib.indexes import ensure_indexes, index_attributes
+from seedlib.json_stream import iter_json_array
+from seedlib.jsonl_ingest import parallel_ingest
+from seedlib.keyword_index import KeywordIndexBuilder
+from seedlib.manifest import Manifest
+from seedlib.pii import format_counts
+from seedlib.rate_limiter import table_rate_limiter
+from seedlib.sink import BulkSink, PutItemSink
+from seedlib.telemetry import Telemetry
+from seedlib.transform import default_workers, transform_ordered
 
 # Configuration
 TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
 REGION = os.getenv("AWS_REGION", "us-west-2")
 ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", None)
+WORKERS = int(os.getenv("SEED_WORKERS", "8"))
+CONCURRENCY = int(os.getenv("SEED_CONCURRENCY", "64"))
+MANIFEST_PATH = os.getenv("SEED_MANIFEST")
+TAH_SHARDS = int(os.getenv("TAH_SHARDS", "0"))
+TAH_FULL = os.getenv("TAH_FULL", "") not in ("", "0")
+ARTICLE_BODIES = os.getenv("ARTICLE_BODIES", "truncate")
+ITEM_ENCODING = os.getenv("ITEM_ENCODING", "json")
+TARGET_UTILISATION = os.getenv("SEED_TARGET_UTILISATION")
+WRITE_CAPACITY = os.getenv("SEED_WRITE_CAPACITY")
+METRICS_DIR = os.getenv("SEED_METRICS_DIR")
+CREATE_INDEXES = os.getenv("SEED_CREATE_INDEXES", "") not in ("", "0")
+STATS = os.getenv("SEED_STATS", "1") not in ("", "0")
+KEYWORD_INDEX = os.getenv("KEYWORD_INDEX")
+ARTICLE_DEDUP = os.getenv("ARTICLE_DEDUP", "") not in ("", "0")
+ARTICLE_DEDUP_THRESHOLD = float(os.getenv("ARTICLE_DEDUP_THRESHOLD", "0.8"))
+ARTICLE_DEDUP_WINDOW = int(os.getenv("ARTICLE_DEDUP_WINDOW", "100000"))
+REDACT_PII = os.getenv("REDACT_PII", "1") not in ("", "0")
+
+# Per-entity metrics of this run, exported with --metrics-dir
+TELEMETRY = Telemetry()
+S3_BUCKET = os.getenv("S3_BUCKET", "lon12-bucket")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT", ENDPOINT_URL)
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 DATASET_DIR = PROJECT_ROOT / "dataset_for_hackathon" / "AWS-Hackathon-2026-Dataset"
 
 
-def get_dynamodb_client():
-    """Create DynamoDB client."""
-    config = Config(region_name=REGION)
-    if ENDPOINT_URL:
-        return boto3.client("dynamodb", endpoint_url=ENDPOINT_URL, config=config)
-    return boto3.client("dynamodb", config=config)
-
-
-def put_item(client, item: dict):
-    """Put an item into DynamoDB."""
-    dynamo_item = {}
-    for key, value in item.items():
-        if value is None:
-            continue
-        if isinstance(value, str):
-            dynamo_item[key] = {"S": value}
-        elif isinstance(value, bool):
-            dynamo_item[key] = {"BOOL": value}
-        elif isinstance(value, int):
-            dynamo_item[key] = {"N": str(value)}
-        elif isinstance(value, float):
-            dynamo_item[key] = {"N": str(value)}
-        elif isinstance(value, list):
-            dynamo_item[key] = {"S": json.dumps(value)}
-        elif isinstance(value, dict):
-            dynamo_item[key] = {"S": json.dumps(value)}
-
-    client.put_item(TableName=TABLE_NAME, Item=dynamo_item)
-
-
-def seed_partners(client):
+def get_sink(
+    client,
+    mode: str,
+    workers: int,
+    manifest=None,
+    article_bodies: str = "truncate",
+    offload_threshold: int = OFFLOAD_THRESHOLD,
+    encoding: str = "json",
+    rate_limiter=None,
+    telemetry=None,
+    aggregates=None,
+    concurrency: int = CONCURRENCY,
+):
+    """Create the item sink for the chosen write mode, article body storage and item encoding."""
+    marshal = get_marshaller(encoding)
+    telemetry = telemetry or TELEMETRY
+    if mode == "put":
+        sink = PutItemSink(
+            client,
+            TABLE_NAME,
+            manifest=manifest,
+            marshal=marshal,
+            rate_limiter=rate_limiter,
+            telemetry=telemetry,
+            aggregates=aggregates,
+        )
+    elif mode == "async":
+        sink = AsyncBulkSink(
+            async_client_factory("dynamodb", ENDPOINT_URL, **client_options(REGION, concurrency)),
+            TABLE_NAME,
+            concurrency=concurrency,
+            manifest=manifest,
+            marshal=marshal,
+            aggregates=aggregates,
+            rate_limiter=rate_limiter,
+            telemetry=telemetry,
+        )
+    else:
+        writer = BatchWriter(
+            client, TABLE_NAME, max_workers=workers, rate_limiter=rate_limiter, telemetry=telemetry
+        )
+        sink = BulkSink(writer, manifest=manifest, marshal=marshal, aggregates=aggregates)
+    if article_bodies == "offload":
+        return OffloadSink(sink, s3_client(REGION, S3_ENDPOINT_URL, workers), S3_BUCKET, threshold=offload_threshold, max_workers=workers)
+    return sink
+
+
+# Client and manifest of a --tah-full worker process, reused across its ranges
+_WORKER_RESOURCES = {}
+
+
+def open_worker_sink(options: dict, telemetry):
+    """Sink for one range of a --tah-full run, inside a worker process."""
+    if not _WORKER_RESOURCES:
+        client = dynamodb_client(REGION, ENDPOINT_URL, options["workers"])
+        _WORKER_RESOURCES["client"] = client
+        _WORKER_RESOURCES["manifest"] = (
+            Manifest(options["manifest"], options["target"], full=options["full"]) if options["manifest"] else None
+        )
+        _WORKER_RESOURCES["rate_limiter"] = (
+            table_rate_limiter(client, TABLE_NAME, options["target_utilisation"], options["write_capacity"])
+            if options["target_utilisation"]
+            else None
+        )
+        _WORKER_RESOURCES["aggregates"] = Aggregates(_WORKER_RESOURCES["manifest"]) if options["stats"] else None
+    return get_sink(
+        _WORKER_RESOURCES["client"],
+        options["mode"],
+        options["workers"],
+        _WORKER_RESOURCES["manifest"],
+        options["article_bodies"],
+        options["offload_threshold"],
+        options["encoding"],
+        _WORKER_RESOURCES["rate_limiter"],
+        telemetry,
+        _WORKER_RESOURCES["aggregates"],
+        options["concurrency"],
+    )
+
+
+def seed_partners(sink):
     """Seed partner organizations."""
     print("Seeding partners...")
     partners = [
-        {"id": "partner-001", "name": "Barclays Bank", "partner_type": "fi", "reports_shared": 12, "access_level": "download"},
-        {"id": "partner-002", "name": "HSBC", "partner_type": "fi", "reports_shared": 8, "access_level": "view"},
-        {"id": "partner-003", "name": "Anti-Slavery International", "partner_type": "ngo", "reports_shared": 15, "access_level": "download"},
-        {"id": "partner-004", "name": "Metropolitan Police", "partner_type": "le", "reports_shared": 6, "access_level": "download"},
-        {"id": "partner-005", "name": "Europol", "partner_type": "le", "reports_shared": 4, "access_level": "view"},
-        {"id": "partner-006", "name": "Standard Chartered", "partner_type": "fi", "reports_shared": 10, "access_level": "download"},
-        {"id": "partner-007", "name": "IOM", "partner_type": "ngo", "reports_shared": 22, "access_level": "download"},
-        {"id": "partner-008", "name": "UNODC", "partner_type": "ngo", "reports_shared": 18, "access_level": "view"},
+        {"id": "partner-001", "name": "Barclays Bank", "partner_type": "fi", "reports_shared": 12, "access_level": "download", "created_at": "2026-01-10T10:00:00Z"},
+        {"id": "partner-002", "name": "HSBC", "partner_type": "fi", "reports_shared": 8, "access_level": "view", "created_at": "2026-01-08T09:00:00Z"},
+        {"id": "partner-003", "name": "Anti-Slavery International", "partner_type": "ngo", "reports_shared": 15, "access_level": "download", "created_at": "2026-01-05T11:00:00Z"},
+        {"id": "partner-004", "name": "Metropolitan Police", "partner_type": "le", "reports_shared": 6, "access_level": "download", "created_at": "2026-01-12T14:30:00Z"},
+        {"id": "partner-005", "name": "Europol", "partner_type": "le", "reports_shared": 4, "access_level": "view", "created_at": "2026-01-11T16:00:00Z"},
+        {"id": "partner-006", "name": "Standard Chartered", "partner_type": "fi", "reports_shared": 10, "access_level": "download", "created_at": "2026-01-09T08:00:00Z"},
+        {"id": "partner-007", "name": "IOM", "partner_type": "ngo", "reports_shared": 22, "access_level": "download", "created_at": "2026-01-07T13:00:00Z"},
+        {"id": "partner-008", "name": "UNODC", "partner_type": "ngo", "reports_shared": 18, "access_level": "view", "created_at": "2026-01-06T10:30:00Z"},
     ]
 
     for partner in partners:
@@ -74,14 +165,16 @@ def seed_partners(client):
             "type": partner["partner_type"],
             "reportsShared": partner["reports_shared"],
             "accessLevel": partner["access_level"],
-            "createdAt": datetime.utcnow().isoformat() + "Z",
+            "createdAt": partner["created_at"],
         }
-        put_item(client, item)
+        item.update(index_attributes(item))
+        with TELEMETRY.stage("Partner", "sink"):
+            sink.put(item)
 
     print(f"  Created {len(partners)} partners")
 
 
-def seed_trends(client):
+def seed_trends(sink):
     """Seed trends data."""
     print("Seeding trends...")
     trends = [
@@ -93,6 +186,7 @@ def seed_trends(client):
             "confidence": "high",
             "exploitationType": "labour_exploitation",
             "summary": "Increasing evidence of labour exploitation in UK supply chains, particularly in car washes, agriculture, and construction sectors.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
         {
             "id": "trend-002",
@@ -102,6 +196,7 @@ def seed_trends(client):
             "confidence": "high",
             "exploitationType": "child_labour",
             "summary": "Persistent child labour issues in garment manufacturing and brick kilns, often linked to debt bondage.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
         {
             "id": "trend-003",
@@ -111,6 +206,7 @@ def seed_trends(client):
             "confidence": "medium",
             "exploitationType": "sexual_exploitation",
             "summary": "Growing concern about sexual exploitation linked to tourism industry in coastal areas.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
         {
             "id": "trend-004",
@@ -120,6 +216,7 @@ def seed_trends(client):
             "confidence": "high",
             "exploitationType": "sexual_exploitation",
             "summary": "Well-documented trafficking routes from Nigeria to Europe, particularly Italy and Spain.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
         {
             "id": "trend-005",
@@ -129,6 +226,7 @@ def seed_trends(client):
             "confidence": "high",
             "exploitationType": "sexual_exploitation",
             "summary": "Increasing online sexual exploitation of children, often facilitated by family members.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
         {
             "id": "trend-006",
@@ -138,6 +236,7 @@ def seed_trends(client):
             "confidence": "high",
             "exploitationType": "labour_exploitation",
             "summary": "Generational debt bondage in brick kiln industry affecting entire families.",
+            "lastUpdated": "2026-01-15T00:00:00Z",
         },
     ]
 
@@ -158,15 +257,17 @@ def seed_trends(client):
             "confidence": trend["confidence"],
             "exploitationType": trend["exploitationType"],
             "summary": trend["summary"],
-            "sources": json.dumps(sources[:2]),
-            "lastUpdated": datetime.utcnow().isoformat() + "Z",
+            "sources": sources[:2],
+            "lastUpdated": trend["lastUpdated"],
         }
-        put_item(client, item)
+        item.update(index_attributes(item))
+        with TELEMETRY.stage("Trend", "sink"):
+            sink.put(item)
 
     print(f"  Created {len(trends)} trends")
 
 
-def seed_reports(client):
+def seed_reports(sink):
     """Seed sample reports."""
     print("Seeding reports...")
     org_id = "stt"
@@ -181,6 +282,8 @@ def seed_reports(client):
             "status": "approved",
             "version": 3,
             "wordCount": 2450,
+            "createdAt": "2026-01-10T10:00:00Z",
+            "updatedAt": "2026-01-12T14:30:00Z",
         },
         {
             "id": "report-002",
@@ -191,6 +294,8 @@ def seed_reports(client):
             "status": "in_review",
             "version": 2,
             "wordCount": 2180,
+            "createdAt": "2026-01-08T09:00:00Z",
+            "updatedAt": "2026-01-11T16:00:00Z",
         },
         {
             "id": "report-003",
@@ -201,6 +306,8 @@ def seed_reports(client):
             "status": "draft",
             "version": 1,
             "wordCount": 1850,
+            "createdAt": "2026-01-05T11:00:00Z",
+            "updatedAt": "2026-01-05T11:00:00Z",
         },
         {
             "id": "report-004",
@@ -211,11 +318,12 @@ def seed_reports(client):
             "status": "approved",
             "version": 4,
             "wordCount": 3200,
+            "createdAt": "2026-01-03T09:15:00Z",
+            "updatedAt": "2026-01-14T10:45:00Z",
         },
     ]
 
     for report in reports:
-        now = datetime.utcnow().isoformat() + "Z"
         item = {
             "PK": f"ORG#{org_id}",
             "SK": f"REPORT#{report['id']}",
@@ -229,16 +337,51 @@ def seed_reports(client):
             "status": report["status"],
             "version": report["version"],
             "wordCount": report["wordCount"],
-            "createdAt": now,
-            "updatedAt": now,
+            "createdAt": report["createdAt"],
+            "updatedAt": report["updatedAt"],
         }
-        put_item(client, item)
+        item.update(index_attributes(item))
+        with TELEMETRY.stage("Report", "sink"):
+            sink.put(item)
 
     print(f"  Created {len(reports)} reports")
 
 
-def seed_tah_articles(client, limit: int = 100):
-    """Seed TAH articles from synthetic dataset."""
+def accept_article(
+    built, keyword_index: KeywordIndexBuilder = None, dedup: NearDuplicateDetector = None, pii: Counter = None
+) -> dict:
+    """Typed item to write for a builder result.
+
+    A near-duplicate of an earlier article becomes an alias item pointing at
+    it; other articles are added to the keyword index when building one.
+    With `pii`, the builder redacted the article and its hits are added there.
+    """
+    if keyword_index is None and dedup is None and pii is None:
+        return built
+    dynamo_item = built.item
+    if pii is not None:
+        pii.update(built.pii)
+    if dedup is not None:
+        match = dedup.check((dynamo_item["PK"]["S"], dynamo_item["SK"]["S"]), built.signature)
+        if match:
+            return alias_item(dynamo_item, *match)
+    if keyword_index is not None:
+        keyword_index.add(dynamo_item["PK"]["S"], dynamo_item["docId"]["S"], built.terms)
+    return dynamo_item
+
+
+def seed_tah_articles(
+    sink,
+    limit: int = 100,
+    workers: int = 0,
+    shards: int = TAH_SHARDS,
+    body_mode: str = ARTICLE_BODIES,
+    encoding: str = ITEM_ENCODING,
+    keyword_index: KeywordIndexBuilder = None,
+    dedup: NearDuplicateDetector = None,
+    pii: Counter = None,
+):
+    """Seed TAH articles from synthetic dataset (see accept_article for `keyword_index`, `dedup` and `pii`)."""
     print("Seeding TAH articles from synthetic dataset...")
 
     dataset_file = DATASET_DIR / "synthetic_tah_dataset.jsonl"
@@ -247,161 +390,412 @@ def seed_tah_articles(client, limit: int = 100):
         return
 
     count = 0
+    rejected = 0
     with open(dataset_file, "r") as f:
-        for line in f:
+        build_item = partial(
+            synthetic_article_item,
+            shards=shards,
+            body_mode=body_mode,
+            encoding=encoding,
+            keywords=keyword_index is not None,
+            minhash=dedup is not None,
+            redact=pii is not None,
+        )
+        records = TELEMETRY.timed("TahArticle", "parse", enumerate(f))
+        for built in TELEMETRY.timed("TahArticle", "transform", transform_ordered(build_item, records, workers)):
             if count >= limit:
                 break
-
-            try:
-                article = json.loads(line.strip())
-
-                # Extract region
-                region = article.get("region", "GLOBAL")
-                if not region:
-                    region = "GLOBAL"
-
-                # Create TAH article item
-                doc_id = article.get("doc_id", f"synth-{count}")
-
-                item = {
-                    "PK": f"TAH#{region.upper().replace(' ', '_').replace('-', '_')}",
-                    "SK": f"ARTICLE#{doc_id}",
-                    "entityType": "TahArticle",
-                    "docId": doc_id,
-                    "title": article.get("title", "Untitled"),
-                    "article": article.get("article", "")[:5000],  # Truncate long articles
-                    "summary": article.get("summary", "")[:2000] if article.get("summary") else None,
-                    "region": region,
-                    "sourceType": article.get("source_type"),
-                    "trfkType": json.dumps(article.get("trfk_type")) if article.get("trfk_type") else None,
-                    "trfkSubtype": json.dumps(article.get("trfk_subtype")) if article.get("trfk_subtype") else None,
-                    "recruitment": json.dumps(article.get("recruitment")) if article.get("recruitment") else None,
-                    "coercion": json.dumps(article.get("coercion")) if article.get("coercion") else None,
-                    "crawlDate": article.get("crawl_date"),
-                }
-
-                put_item(client, item)
-                count += 1
-
-            except json.JSONDecodeError:
+            if built is None:
+                rejected += 1
                 continue
+            dynamo_item = accept_article(built, keyword_index, dedup, pii)
+            with TELEMETRY.stage("TahArticle", "sink"):
+                sink.put_typed(dynamo_item)
+            count += 1
 
-    print(f"  Created {count} TAH articles")
+    print(f"  Created {count} TAH articles ({rejected} malformed lines rejected)")
 
 
-def seed_india_labour_articles(client, limit: int = 50):
-    """Seed India labour exploitation articles."""
-    print("Seeding India labour articles...")
+def seed_tah_articles_full(
+    processes: int,
+    worker_options: dict,
+    shards: int = TAH_SHARDS,
+    body_mode: str = ARTICLE_BODIES,
+    encoding: str = ITEM_ENCODING,
+    pii: Counter = None,
+):
+    """Seed every line of the synthetic dataset with parallel range workers; returns their WriteResult.
 
-    dataset_file = DATASET_DIR / "tah-labour-india-six-months.json"
+    With `pii`, the workers redact the articles and their hits are added there.
+    """
+    print("Seeding all TAH articles from synthetic dataset...")
+
+    dataset_file = DATASET_DIR / "synthetic_tah_dataset.jsonl"
     if not dataset_file.exists():
         print(f"  Warning: Dataset file not found: {dataset_file}")
-        return
-
-    with open(dataset_file, "r") as f:
-        articles = json.load(f)
+        return None
+
+    start = time.perf_counter()
+    build_item = partial(synthetic_article_item, shards=shards, body_mode=body_mode, encoding=encoding)
+    if pii is not None:
+        build_item = partial(item_with_pii, partial(build_item, redact=True))
+    open_sink = partial(open_worker_sink, worker_options)
+    totals = parallel_ingest(dataset_file, build_item, open_sink, processes, "TahArticle", telemetry=TELEMETRY)
+    elapsed = time.perf_counter() - start
+    if pii is not None:
+        pii.update(totals.counts)
+
+    print(
+        f"  Created {totals.items} TAH articles from {totals.lines} lines "
+        f"({totals.rejected} malformed lines rejected) in {elapsed:.1f}s, "
+        f"{totals.items / elapsed if elapsed else 0:.0f} items/s"
+    )
+    return totals.write
+
+
+def seed_india_articles(
+    sink,
+    filename: str,
+    id_prefix: str,
+    limit: int,
+    workers: int,
+    shards: int,
+    body_mode: str,
+    encoding: str,
+    keyword_index: KeywordIndexBuilder = None,
+    dedup: NearDuplicateDetector = None,
+    pii: Counter = None,
+) -> int:
+    """Seed one tah-*-india-six-months.json dataset; returns the number of articles written."""
+    dataset_file = DATASET_DIR / filename
+    if not dataset_file.exists():
+        print(f"  Warning: Dataset file not found: {dataset_file}")
+        return 0
+
+    build_item = partial(
+        india_article_item,
+        id_prefix=id_prefix,
+        shards=shards,
+        body_mode=body_mode,
+        encoding=encoding,
+        keywords=keyword_index is not None,
+        minhash=dedup is not None,
+        redact=pii is not None,
+    )
+    records = TELEMETRY.timed("TahArticle", "parse", enumerate(islice(iter_json_array(dataset_file), limit)))
 
     count = 0
-    for article in articles[:limit]:
-        try:
-            doc_id = article.get("_id", {}).get("$oid", f"india-{count}")
-
-            item = {
-                "PK": "TAH#ASIA_PACIFIC",
-                "SK": f"ARTICLE#{doc_id}",
-                "entityType": "TahArticle",
-                "docId": doc_id,
-                "url": article.get("url"),
-                "title": article.get("title", "Untitled"),
-                "article": article.get("article", "")[:5000],
-                "summary": article.get("summary", "")[:2000] if article.get("summary") else None,
-                "region": "Asia-Pacific",
-                "sourceType": "NEWS",
-                "trfkType": json.dumps(article.get("trfk_type")) if article.get("trfk_type") else None,
-                "trfkSubtype": json.dumps(article.get("trfk_subtype")) if article.get("trfk_subtype") else None,
-                "recruitment": json.dumps(article.get("recruitment")) if article.get("recruitment") else None,
-                "coercion": json.dumps(article.get("coercion")) if article.get("coercion") else None,
-                "crawlDate": article.get("crawl_date"),
-                "publishDate": article.get("publish_date"),
-            }
-
-            put_item(client, item)
-            count += 1
-
-        except Exception as e:
-            print(f"  Error processing article: {e}")
+    for built in TELEMETRY.timed("TahArticle", "transform", transform_ordered(build_item, records, workers)):
+        if built is None:
             continue
-
+        dynamo_item = accept_article(built, keyword_index, dedup, pii)
+        with TELEMETRY.stage("TahArticle", "sink"):
+            sink.put_typed(dynamo_item)
+        count += 1
+    return count
+
+
+def seed_india_labour_articles(
+    sink,
+    limit: int = 50,
+    workers: int = 0,
+    shards: int = TAH_SHARDS,
+    body_mode: str = ARTICLE_BODIES,
+    encoding: str = ITEM_ENCODING,
+    keyword_index: KeywordIndexBuilder = None,
+    dedup: NearDuplicateDetector = None,
+    pii: Counter = None,
+):
+    """Seed India labour exploitation articles."""
+    print("Seeding India labour articles...")
+    count = seed_india_articles(
+        sink,
+        "tah-labour-india-six-months.json",
+        "india",
+        limit,
+        workers,
+        shards,
+        body_mode,
+        encoding,
+        keyword_index,
+        dedup,
+        pii,
+    )
     print(f"  Created {count} India labour articles")
 
 
-def seed_india_se_articles(client, limit: int = 50):
+def seed_india_se_articles(
+    sink,
+    limit: int = 50,
+    workers: int = 0,
+    shards: int = TAH_SHARDS,
+    body_mode: str = ARTICLE_BODIES,
+    encoding: str = ITEM_ENCODING,
+    keyword_index: KeywordIndexBuilder = None,
+    dedup: NearDuplicateDetector = None,
+    pii: Counter = None,
+):
     """Seed India sexual exploitation articles."""
     print("Seeding India SE articles...")
+    count = seed_india_articles(
+        sink,
+        "tah-se-india-six-months.json",
+        "india-se",
+        limit,
+        workers,
+        shards,
+        body_mode,
+        encoding,
+        keyword_index,
+        dedup,
+        pii,
+    )
+    print(f"  Created {count} India SE articles")
 
-    dataset_file = DATASET_DIR / "tah-se-india-six-months.json"
-    if not dataset_file.exists():
-        print(f"  Warning: Dataset file not found: {dataset_file}")
-        return
-
-    with open(dataset_file, "r") as f:
-        articles = json.load(f)
-
-    count = 0
-    for article in articles[:limit]:
-        try:
-            doc_id = article.get("_id", {}).get("$oid", f"india-se-{count}")
-
-            item = {
-                "PK": "TAH#ASIA_PACIFIC",
-                "SK": f"ARTICLE#{doc_id}",
-                "entityType": "TahArticle",
-                "docId": doc_id,
-                "url": article.get("url"),
-                "title": article.get("title", "Untitled"),
-                "article": article.get("article", "")[:5000],
-                "summary": article.get("summary", "")[:2000] if article.get("summary") else None,
-                "region": "Asia-Pacific",
-                "sourceType": "NEWS",
-                "trfkType": json.dumps(article.get("trfk_type")) if article.get("trfk_type") else None,
-                "trfkSubtype": json.dumps(article.get("trfk_subtype")) if article.get("trfk_subtype") else None,
-                "recruitment": json.dumps(article.get("recruitment")) if article.get("recruitment") else None,
-                "coercion": json.dumps(article.get("coercion")) if article.get("coercion") else None,
-                "crawlDate": article.get("crawl_date"),
-                "publishDate": article.get("publish_date"),
-            }
-
-            put_item(client, item)
-            count += 1
 
-        except Exception as e:
-            print(f"  Error processing article: {e}")
-            continue
-
-    print(f"  Created {count} India SE articles")
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=["bulk", "async", "put"],
+        default=os.getenv("SEED_MODE", "bulk"),
+        help=(
+            "bulk: concurrent BatchWriteItem on a thread pool (default); async: BatchWriteItem from an asyncio "
+            "loop (needs aiobotocore); put: one PutItem per item, for debugging"
+        ),
+    )
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Concurrent batch writers in bulk mode")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=CONCURRENCY,
+        help="BatchWriteItem calls in flight (and pooled connections) in async mode",
+    )
+    parser.add_argument(
+        "--transform-workers",
+        type=int,
+        default=default_workers(),
+        help="Processes marshalling articles into items (0 or 1 = in-process)",
+    )
+    parser.add_argument(
+        "--tah-shards",
+        type=int,
+        default=TAH_SHARDS,
+        help="Spread each TAH region over TAH#<REGION>#<n> partitions (0 = single partition)",
+    )
+    parser.add_argument(
+        "--tah-full",
+        action="store_true",
+        default=TAH_FULL,
+        help="Seed the whole synthetic TAH dataset, split into line-aligned ranges over --transform-workers processes",
+    )
+    parser.add_argument(
+        "--article-bodies",
+        choices=BODY_MODES,
+        default=ARTICLE_BODIES,
+        help="truncate: 5000/2000-char strings (default); compress: full zlib body in articleZ; "
+        "offload: as compress, with large bodies moved to S3 behind contentRef",
+    )
+    parser.add_argument(
+        "--offload-threshold",
+        type=int,
+        default=OFFLOAD_THRESHOLD,
+        help="Compressed body size in bytes above which --article-bodies offload moves it to S3",
+    )
+    parser.add_argument(
+        "--item-encoding",
+        choices=ENCODINGS,
+        default=ITEM_ENCODING,
+        help="json: lists/dicts as JSON strings (default); native: schema-compiled L/M/SS attributes",
+    )
+    parser.add_argument(
+        "--target-utilisation",
+        type=float,
+        default=float(TARGET_UTILISATION) if TARGET_UTILISATION else None,
+        help="Pace writes to this fraction (0-1] of the table's write capacity, backing off on throttles",
+    )
+    parser.add_argument(
+        "--write-capacity",
+        type=float,
+        default=float(WRITE_CAPACITY) if WRITE_CAPACITY else None,
+        help="Table WCU for --target-utilisation (default: provisioned WCU from DescribeTable)",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default=METRICS_DIR,
+        help="Write per-entity metrics here as seed-metrics.prom (Prometheus text) and seed-metrics.json",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=MANIFEST_PATH,
+        help="SQLite manifest file; only new or changed items are written and interrupted runs resume",
+    )
+    parser.add_argument("--full", action="store_true", help="Rewrite every item even if the manifest has it")
+    parser.add_argument(
+        "--create-indexes",
+        action="store_true",
+        default=CREATE_INDEXES,
+        help="Add any missing GSIs (seedlib.indexes) to the table and wait for them before seeding",
+    )
+    parser.add_argument(
+        "--no-stats",
+        dest="stats",
+        action="store_false",
+        default=STATS,
+        help="Do not maintain the STATS#... aggregate items (seedlib.aggregates); they are only kept with --manifest",
+    )
+    parser.add_argument(
+        "--keyword-index",
+        default=KEYWORD_INDEX,
+        help="Build an inverted keyword index of the seeded articles into this file (search with search-articles.py)",
+    )
+    parser.add_argument(
+        "--dedup-articles",
+        action="store_true",
+        default=ARTICLE_DEDUP,
+        help="Write near-duplicate articles across the datasets as alias items of the first copy (seedlib.dedup)",
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=ARTICLE_DEDUP_THRESHOLD,
+        help="Estimated Jaccard similarity of word shingles at which two articles are duplicates",
+    )
+    parser.add_argument(
+        "--dedup-window",
+        type=int,
+        default=ARTICLE_DEDUP_WINDOW,
+        help="Distinct articles remembered for duplicate detection (bounds its memory)",
+    )
+    parser.add_argument(
+        "--no-redact-pii",
+        dest="redact_pii",
+        action="store_false",
+        default=REDACT_PII,
+        help="Write article text without redacting emails, phone numbers and ID numbers (seedlib.pii)",
+    )
+    return parser.parse_args()
 
 
 def main():
     """Main entry point."""
+    args = parse_args()
+
     print(f"Seeding DynamoDB table: {TABLE_NAME}")
     print(f"Region: {REGION}")
     if ENDPOINT_URL:
         print(f"Endpoint: {ENDPOINT_URL}")
+    print(f"Mode: {args.mode}")
+    print(f"Article bodies: {args.article_bodies}")
+    print(f"Item encoding: {args.item_encoding}")
     print()
 
-    client = get_dynamodb_client()
+    client = dynamodb_client(REGION, ENDPOINT_URL, args.workers)
+    if args.create_indexes:
+        created = ensure_indexes(client, TABLE_NAME)
+        print(f"Indexes created: {', '.join(created)}" if created else "Indexes: all present")
+    target = f"{ENDPOINT_URL or REGION}/{TABLE_NAME}"
+    manifest = Manifest(args.manifest, target, full=args.full) if args.manifest else None
+    rate_limiter = None
+    if args.target_utilisation:
+        rate_limiter = table_rate_limiter(client, TABLE_NAME, args.target_utilisation, args.write_capacity)
+        print(f"Write rate: {rate_limiter.ceiling:.0f} WCU/s" if rate_limiter else "Write rate: unlimited (on-demand)")
+
+    aggregates = Aggregates(manifest) if args.stats and manifest else None
+    if args.stats and not manifest:
+        print("Stats: not maintained without --manifest, as a rerun would count every item again")
 
     # Seed all data
-    seed_partners(client)
-    seed_trends(client)
-    seed_reports(client)
-    seed_tah_articles(client, limit=100)
-    seed_india_labour_articles(client, limit=100)
-    seed_india_se_articles(client, limit=100)
+    articles = {
+        "workers": args.transform_workers,
+        "shards": args.tah_shards,
+        "body_mode": args.article_bodies,
+        "encoding": args.item_encoding,
+        "keyword_index": KeywordIndexBuilder() if args.keyword_index else None,
+        "dedup": NearDuplicateDetector(args.dedup_threshold, args.dedup_window) if args.dedup_articles else None,
+        "pii": Counter() if args.redact_pii else None,
+    }
+    sink = get_sink(
+        client,
+        args.mode,
+        args.workers,
+        manifest,
+        args.article_bodies,
+        args.offload_threshold,
+        args.item_encoding,
+        rate_limiter,
+        aggregates=aggregates,
+        concurrency=args.concurrency,
+    )
+    full_result = None
+    with sink:
+        seed_partners(sink)
+        seed_trends(sink)
+        seed_reports(sink)
+        if args.tah_full:
+            processes = max(1, args.transform_workers)
+            worker_options = {
+                "target": target,
+                "mode": args.mode,
+                "workers": args.workers,
+                "manifest": args.manifest,
+                "full": args.full,
+                "article_bodies": args.article_bodies,
+                "offload_threshold": args.offload_threshold,
+                "encoding": args.item_encoding,
+                "target_utilisation": args.target_utilisation,
+                "stats": aggregates is not None,
+                "concurrency": args.concurrency,
+                # The workers share the table's capacity with each other
+                "write_capacity": rate_limiter.ceiling / args.target_utilisation / processes if rate_limiter else None,
+            }
+            full_result = seed_tah_articles_full(
+                processes, worker_options, args.tah_shards, args.article_bodies, args.item_encoding, articles["pii"]
+            )
+        else:
+            seed_tah_articles(sink, limit=100, **articles)
+        seed_india_labour_articles(sink, limit=100, **articles)
+        seed_india_se_articles(sink, limit=100, **articles)
+    result = sink.close()
+    if full_result:
+        result.merge(full_result)
+    if manifest:
+        manifest.close()
+    if articles["keyword_index"] is not None:
+        if args.tah_full:
+            print("Keyword index: --tah-full articles are not indexed, only the India datasets")
+        header = articles["keyword_index"].write(args.keyword_index)
+        print(f"Keyword index: {header['docs']} articles, {header['terms']} terms -> {args.keyword_index}")
+    dedup = articles["dedup"]
+    if dedup is not None:
+        if args.tah_full:
+            print("Dedup: --tah-full articles are not checked, only the India datasets")
+        print(
+            f"Dedup: {dedup.duplicates} of {dedup.seen} articles written as aliases "
+            f"(dedup ratio {dedup.ratio:.1%})"
+        )
+    if articles["pii"] is not None:
+        print(f"PII redacted: {format_counts(articles['pii'])}")
+    else:
+        print("PII: article text written unredacted (--no-redact-pii)")
 
     print()
     print("Seeding complete!")
-    print(f"  Total: Partners, Trends, Reports, and ~300 TAH articles loaded")
+    print(
+        f"  Total: {result.written} written, {result.skipped} unchanged, "
+        f"{result.retried} retried, {result.failed} failed"
+    )
+    if aggregates:
+        print(f"  Stats items updated: {aggregates.updates}")
+    for error in result.errors:
+        print(f"  Error: {error}")
+    for line in TELEMETRY.table():
+        print(line)
+    if args.metrics_dir:
+        print(f"  Metrics: {', '.join(TELEMETRY.export(args.metrics_dir))}")
+    if result.failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
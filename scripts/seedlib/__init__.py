@@ -0,0 +1 @@
+"""Shared helpers for the DynamoDB seed scripts."""
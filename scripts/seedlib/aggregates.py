@@ -0,0 +1,160 @@
+"""Dashboard aggregates kept as `STATS#...` items with atomic counters.
+
+Sinks report every batch DynamoDB accepted to `Aggregates.record_batch`.
+Each item is mapped to the counters it counts under (`item_counters`), and
+`flush` applies the summed deltas with one UpdateItem ADD per stats item.
+A dashboard then reads one item with GetItem (`get_stats`) instead of
+scanning:
+
+- `ORG#<orgId>` / `STATS#REPORTS`: `total` and `status#<status>` reports
+- `STATS` / `STATS#ARTICLES#<region>`: `total` and `trfkType#<type>` articles
+- `STATS` / `STATS#PARTNERS`: `total` and `type#<type>` partners
+
+With a manifest the counters each item was counted under are remembered,
+so rerunning a seed counts only what changed (a report moving from draft
+to approved moves one count), and deltas are queued in the manifest until
+applied, so an interrupted run's counts are flushed by the next one.
+Without a manifest every written item counts as new, which is only right
+for a fresh table, so the seed scripts keep stats only with --manifest.
+"""
+
+import json
+import threading
+from datetime import datetime
+
+from seedlib.marshal import item_key
+
+STATS_PK = "STATS"
+
+
+def report_stats_key(org_id: str) -> tuple:
+    """Key of an org's report counts."""
+    return f"ORG#{org_id}", "STATS#REPORTS"
+
+
+def article_stats_key(region: str) -> tuple:
+    """Key of a region's article counts."""
+    return STATS_PK, f"STATS#ARTICLES#{region}"
+
+
+def partner_stats_key() -> tuple:
+    """Key of the partner counts."""
+    return STATS_PK, "STATS#PARTNERS"
+
+
+def _string(dynamo_item: dict, name: str):
+    return dynamo_item.get(name, {}).get("S")
+
+
+def _string_list(attr: dict) -> list:
+    """Strings of an L/SS attribute or of a JSON-string list (the json item encoding)."""
+    if "L" in attr:
+        return [next(iter(x.values())) for x in attr["L"]]
+    if "SS" in attr:
+        return list(attr["SS"])
+    if "S" in attr:
+        try:
+            value = json.loads(attr["S"])
+        except json.JSONDecodeError:
+            return [attr["S"]]
+        return value if isinstance(value, list) else [value]
+    return []
+
+
+def item_counters(dynamo_item: dict) -> list:
+    """(stats PK, stats SK, counter) triples a typed item counts under."""
+    entity_type = _string(dynamo_item, "entityType")
+
+    if entity_type == "Report":
+        org_id = _string(dynamo_item, "orgId")
+        if not org_id:
+            return []
+        key = report_stats_key(org_id)
+        return [(*key, "total"), (*key, f"status#{_string(dynamo_item, 'status')}")]
+
+    if entity_type == "TahArticle":
+        key = article_stats_key(_string(dynamo_item, "region") or "GLOBAL")
+        types = sorted({str(t) for t in _string_list(dynamo_item.get("trfkType", {})) if t})
+        return [(*key, "total")] + [(*key, f"trfkType#{t}") for t in types]
+
+    if entity_type == "Partner":
+        key = partner_stats_key()
+        return [(*key, "total"), (*key, f"type#{_string(dynamo_item, 'type')}")]
+
+    return []
+
+
+class Aggregates:
+    """Thread-safe accumulator of stats counter deltas for one table."""
+
+    def __init__(self, manifest=None):
+        self.manifest = manifest
+        self.updates = 0
+        self._deltas = {}
+        self._lock = threading.Lock()
+
+    def record_batch(self, batch: list, result):
+        """Count the items of `batch` that were written.
+
+        Call before the manifest records the batch: if the run dies in
+        between, the rewrite on the next run then counts nothing twice.
+        """
+        failed = {item_key(item) for item in result.failed_items}
+        contributions = {
+            item_key(item): item_counters(item) for item in batch if item_key(item) not in failed
+        }
+        if self.manifest:
+            with self._lock:
+                self.manifest.record_counters(contributions)
+            return
+        with self._lock:
+            for counters in contributions.values():
+                for counter in counters:
+                    self._deltas[counter] = self._deltas.get(counter, 0) + 1
+
+    def flush(self, client, table_name: str) -> int:
+        """Apply the pending deltas with atomic counters; returns the stats items updated."""
+        with self._lock:
+            if self.manifest:
+                deltas = self.manifest.take_pending_counters()
+            else:
+                deltas, self._deltas = self._deltas, {}
+
+        by_item = {}
+        for (pk, sk, name), delta in deltas.items():
+            by_item.setdefault((pk, sk), {})[name] = delta
+
+        now = datetime.utcnow().isoformat() + "Z"
+        done = set()
+        try:
+            for (pk, sk), counters in by_item.items():
+                names = {f"#c{i}": name for i, name in enumerate(counters)}
+                values = {f":c{i}": {"N": str(delta)} for i, delta in enumerate(counters.values())}
+                client.update_item(
+                    TableName=table_name,
+                    Key={"PK": {"S": pk}, "SK": {"S": sk}},
+                    UpdateExpression=(
+                        "ADD " + ", ".join(f"#c{i} :c{i}" for i in range(len(counters)))
+                        + " SET entityType = :type, updatedAt = :now"
+                    ),
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues={**values, ":type": {"S": "Stats"}, ":now": {"S": now}},
+                )
+                done.add((pk, sk))
+        finally:
+            unapplied = {counter: delta for counter, delta in deltas.items() if counter[:2] not in done}
+            if unapplied:
+                with self._lock:
+                    if self.manifest:
+                        self.manifest.requeue_counters(unapplied)
+                    else:
+                        for counter, delta in unapplied.items():
+                            self._deltas[counter] = self._deltas.get(counter, 0) + delta
+        self.updates += len(done)
+        return len(done)
+
+
+def get_stats(client, table_name: str, key: tuple) -> dict:
+    """Counters of one stats item ({} if it does not exist yet), with a single GetItem."""
+    item = client.get_item(TableName=table_name, Key={"PK": {"S": key[0]}, "SK": {"S": key[1]}}).get("Item", {})
+    return {name: int(attr["N"]) for name, attr in item.items() if "N" in attr}
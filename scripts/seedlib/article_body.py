@@ -0,0 +1,163 @@
+"""Storage modes for TAH article bodies.
+
+- truncate: `article` and `summary` cut to 5000/2000 chars as plain strings
+  (the original layout, still what the API reads by default).
+- compress: the full article as zlib bytes in the binary `articleZ`
+  attribute, with `contentEncoding` = "zlib"; the full summary stays a string.
+- offload: as compress, but `OffloadSink` moves bodies whose compressed size
+  exceeds a threshold to S3 and leaves a `contentRef` (s3://bucket/key) and
+  `contentSha256` on the item instead.
+
+Compression happens in `seedlib.articles`, i.e. in the transform workers; the
+S3 uploads happen in the seeding process, on `OffloadSink`'s thread pool.
+"""
+
+import hashlib
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+BODY_MODES = ("truncate", "compress", "offload")
+ARTICLE_MAX_CHARS = 5000
+SUMMARY_MAX_CHARS = 2000
+OFFLOAD_THRESHOLD = 16 * 1024
+OFFLOAD_PREFIX = "tah-articles/"
+
+
+def body_attributes(article: str, summary: str, mode: str = "truncate") -> dict:
+    """Plain item attributes holding an article body and summary in `mode`."""
+    if mode == "truncate":
+        return {
+            "article": article[:ARTICLE_MAX_CHARS],
+            "summary": summary[:SUMMARY_MAX_CHARS] if summary else None,
+        }
+    if mode not in BODY_MODES:
+        raise ValueError(f"unknown article body mode: {mode}")
+    return {
+        "articleZ": zlib.compress(article.encode("utf-8"), 9) if article else None,
+        "contentEncoding": "zlib" if article else None,
+        "summary": summary or None,
+    }
+
+
+def read_article(dynamo_item: dict, s3_client=None) -> str:
+    """Full article text of a typed item in any of the storage modes."""
+    if "articleZ" in dynamo_item:
+        return zlib.decompress(dynamo_item["articleZ"]["B"]).decode("utf-8")
+    if "contentRef" in dynamo_item:
+        bucket, _, key = dynamo_item["contentRef"]["S"][len("s3://"):].partition("/")
+        body = s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        return zlib.decompress(body).decode("utf-8")
+    return dynamo_item.get("article", {}).get("S", "")
+
+
+class OffloadSink:
+    """Sink wrapper that moves large compressed article bodies to S3.
+
+    Items pass through to `sink` in the order they were put. An item whose
+    `articleZ` is larger than `threshold` bytes is uploaded to
+    `s3://<bucket>/<prefix><docId>.zlib` first and written with `contentRef`
+    in place of `articleZ`. The upload is skipped when the wrapped sink's
+    manifest already has the resulting item, since `contentSha256` changes
+    with the body.
+    """
+
+    def __init__(
+        self,
+        sink,
+        s3_client,
+        bucket: str,
+        threshold: int = OFFLOAD_THRESHOLD,
+        prefix: str = OFFLOAD_PREFIX,
+        max_workers: int = 8,
+    ):
+        self.sink = sink
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.threshold = threshold
+        self.prefix = prefix
+        self.max_workers = max_workers
+        self.offloaded = 0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending = deque()
+        self._closed = False
+
+    @property
+    def result(self):
+        """Write counts of the wrapped sink."""
+        return self.sink.result
+
+    def put(self, item: dict):
+        """Write one plain item (non-article entities pass straight through)."""
+        self._drain()
+        self.sink.put(item)
+
+    def put_typed(self, dynamo_item: dict):
+        """Write one typed item, offloading its body first if it is too large."""
+        body = dynamo_item.get("articleZ", {}).get("B")
+        if body is None or len(body) <= self.threshold:
+            self._enqueue(None, dynamo_item)
+            return
+
+        key = f"{self.prefix}{dynamo_item['docId']['S']}.zlib"
+        item = {k: v for k, v in dynamo_item.items() if k != "articleZ"}
+        item["contentRef"] = {"S": f"s3://{self.bucket}/{key}"}
+        item["contentSha256"] = {"S": hashlib.sha256(body).hexdigest()}
+
+        manifest = getattr(self.sink, "manifest", None)
+        if manifest and manifest.is_current(item):
+            self._enqueue(None, item)
+            return
+        self._enqueue(self._pool.submit(self._upload, key, body), item)
+
+    def _upload(self, key: str, body: bytes):
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=body,
+            ContentType="text/plain; charset=utf-8",
+            ContentEncoding="deflate",
+        )
+
+    def _enqueue(self, future, item: dict):
+        """Queue an item behind any uploads still in flight, bounding them to 2 * max_workers."""
+        self._pending.append((future, item))
+        self._drain()
+        while len(self._pending) > self.max_workers * 2:
+            wait([self._pending[0][0]])
+            self._drain()
+
+    def _drain(self):
+        """Pass on items from the front of the queue whose upload has finished."""
+        while self._pending:
+            future, item = self._pending[0]
+            if future is not None and not future.done():
+                return
+            self._pending.popleft()
+            if future is None:
+                self.sink.put_typed(item)
+                continue
+            error = future.exception()
+            if error is not None:
+                self.sink.result.failed += 1
+                self.sink.result.errors.append(f"S3 upload of {item['contentRef']['S']} failed: {error}")
+                continue
+            self.offloaded += 1
+            self.sink.put_typed(item)
+
+    def close(self):
+        """Wait for every upload, write the remaining items and close the wrapped sink."""
+        if not self._closed:
+            for future, _ in self._pending:
+                if future is not None:
+                    wait([future])
+            self._drain()
+            self._pool.shutdown()
+            self._closed = True
+        return self.sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,157 @@
+"""Raw TAH article records to DynamoDB items.
+
+These are top-level functions taking a single `(index, record)` tuple so
+they can be shipped to worker processes by `seedlib.transform`; options such
+as `shards`, `body_mode` and `encoding` are bound with functools.partial.
+With `keywords=True` or `minhash=True` they return a `BuiltArticle` that
+also carries the article's term frequencies for seedlib.keyword_index and
+its MinHash signature for seedlib.dedup, so tokenizing and shingling
+happen in the workers too. `redact=True` strips direct identifiers from the
+raw text with seedlib.pii before anything else sees it, and the result
+carries the hits per identifier type.
+"""
+
+import json
+from typing import NamedTuple
+
+from seedlib.article_body import body_attributes
+from seedlib.codec import get_marshaller
+from seedlib.dedup import minhash as minhash_signature
+from seedlib.indexes import index_attributes
+from seedlib.keyword_index import article_terms
+from seedlib.pii import redact_article
+from seedlib.sharding import sharded_pk
+
+
+class BuiltArticle(NamedTuple):
+    """A typed article item with the extras computed alongside it."""
+
+    item: dict
+    terms: dict = None
+    signature: object = None
+    pii: dict = None
+
+
+def _built(dynamo_item: dict, title: str, article: dict, keywords: bool, minhash: bool, pii: dict = None):
+    """The builder result: the bare item, or a BuiltArticle when extras were asked for."""
+    if not (keywords or minhash or pii is not None):
+        return dynamo_item
+    return BuiltArticle(
+        dynamo_item,
+        terms=article_terms(title, article.get("summary"), article.get("article")) if keywords else None,
+        signature=minhash_signature(f"{title}\n{article.get('article') or ''}") if minhash else None,
+        pii=pii,
+    )
+
+
+def item_with_pii(build_item, record):
+    """`build_item(record)` as (typed item, PII hits), the form seedlib.jsonl_ingest tallies; None stays None."""
+    built = build_item(record)
+    if not isinstance(built, BuiltArticle):
+        return built
+    return built.item, built.pii or {}
+
+
+def region_pk(region: str) -> str:
+    """Partition key for a TAH region, e.g. 'Asia-Pacific' -> 'TAH#ASIA_PACIFIC'."""
+    return f"TAH#{region.upper().replace(' ', '_').replace('-', '_')}"
+
+
+def _dumps_or_none(value):
+    """JSON-encode a truthy value, otherwise None (attribute is dropped)."""
+    return json.dumps(value) if value else None
+
+
+def _classification(article: dict, encoding: str = "json") -> dict:
+    """Trafficking classification attributes shared by every TAH source.
+
+    JSON strings for the "json" encoding; raw values, stored as native L/M
+    by the codec, for "native".
+    """
+    encode = _dumps_or_none if encoding == "json" else lambda value: value or None
+    return {
+        "trfkType": encode(article.get("trfk_type")),
+        "trfkSubtype": encode(article.get("trfk_subtype")),
+        "recruitment": encode(article.get("recruitment")),
+        "coercion": encode(article.get("coercion")),
+    }
+
+
+def synthetic_article_item(
+    record,
+    shards: int = 0,
+    body_mode: str = "truncate",
+    encoding: str = "json",
+    keywords: bool = False,
+    minhash: bool = False,
+    redact: bool = False,
+):
+    """Build a typed item from one line of synthetic_tah_dataset.jsonl, or None if malformed."""
+    index, line = record
+    try:
+        article = json.loads(line.strip())
+    except json.JSONDecodeError:
+        return None
+    pii = None
+    if redact:
+        article, pii = redact_article(article)
+
+    region = article.get("region", "GLOBAL")
+    if not region:
+        region = "GLOBAL"
+    doc_id = article.get("doc_id", f"synth-{index}")
+
+    item = {
+        "PK": sharded_pk(region_pk(region), doc_id, shards),
+        "SK": f"ARTICLE#{doc_id}",
+        "entityType": "TahArticle",
+        "docId": doc_id,
+        "title": article.get("title", "Untitled"),
+        **body_attributes(article.get("article", ""), article.get("summary"), body_mode),
+        "region": region,
+        "sourceType": article.get("source_type"),
+        **_classification(article, encoding),
+        "crawlDate": article.get("crawl_date"),
+    }
+    item.update(index_attributes(item))
+    return _built(get_marshaller(encoding)(item), item["title"], article, keywords, minhash, pii)
+
+
+def india_article_item(
+    record,
+    id_prefix: str = "india",
+    shards: int = 0,
+    body_mode: str = "truncate",
+    encoding: str = "json",
+    keywords: bool = False,
+    minhash: bool = False,
+    redact: bool = False,
+):
+    """Build a typed item from one element of a tah-*-india-six-months.json array, or None on error."""
+    index, article = record
+    try:
+        pii = None
+        if redact:
+            article, pii = redact_article(article)
+        doc_id = article.get("_id", {}).get("$oid", f"{id_prefix}-{index}")
+
+        item = {
+            "PK": sharded_pk(region_pk("Asia-Pacific"), doc_id, shards),
+            "SK": f"ARTICLE#{doc_id}",
+            "entityType": "TahArticle",
+            "docId": doc_id,
+            "url": article.get("url"),
+            "title": article.get("title", "Untitled"),
+            **body_attributes(article.get("article", ""), article.get("summary"), body_mode),
+            "region": "Asia-Pacific",
+            "sourceType": "NEWS",
+            **_classification(article, encoding),
+            "crawlDate": article.get("crawl_date"),
+            "publishDate": article.get("publish_date"),
+        }
+        item.update(index_attributes(item))
+        return _built(get_marshaller(encoding)(item), item["title"], article, keywords, minhash, pii)
+
+    except Exception as e:
+        print(f"  Error processing article: {e}")
+        return None
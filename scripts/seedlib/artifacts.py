@@ -0,0 +1,117 @@
+"""Report and message artifacts in the bucket layout of docs/data-model.md.
+
+Every key starts with the item's orgId:
+
+- `<orgId>/reports/<reportId>/v<version>/report.{md,pdf,docx}`, recorded on
+  the Report item as `s3Keys` (a map of markdown/pdf/docx to key)
+- `<orgId>/conversations/<conversationId>/messages/<messageId>.md`, recorded
+  on the Message item as `contentRef` (s3://bucket/key)
+
+A report's files are taken from an artifacts directory that mirrors the
+bucket layout. A report without a markdown file gets one rendered from
+its item, so every report has at least its markdown in the bucket. A
+message's artifact is its content.
+"""
+
+from pathlib import Path
+
+from seedlib.codec import decode_item
+from seedlib.s3_upload import Artifact
+
+REPORT_FORMATS = {"markdown": "md", "pdf": "pdf", "docx": "docx"}
+
+
+def report_prefix(org_id: str, report_id: str, version) -> str:
+    """Key prefix of one report version's files."""
+    return f"{org_id}/reports/{report_id}/v{version}/"
+
+
+def message_key(org_id: str, conversation_id: str, message_id: str) -> str:
+    """Key of a message's content."""
+    return f"{org_id}/conversations/{conversation_id}/messages/{message_id}.md"
+
+
+def _org_id(item: dict) -> str:
+    """orgId of a plain item, falling back to its ORG#<orgId>... partition key."""
+    return item.get("orgId") or item["PK"].removeprefix("ORG#").split("#", 1)[0]
+
+
+def render_report_markdown(item: dict) -> str:
+    """Markdown body for a plain Report item that has no report.md of its own."""
+    lines = [f"# {item.get('title') or item['id']}", ""]
+    for label, name in (
+        ("Country", "country"),
+        ("Sector", "sector"),
+        ("Exploitation type", "exploitationType"),
+        ("Status", "status"),
+        ("Version", "version"),
+        ("Word count", "wordCount"),
+        ("Updated", "updatedAt"),
+    ):
+        if item.get(name) is not None:
+            lines.append(f"- **{label}:** {item[name]}")
+    if item.get("content"):
+        lines += ["", str(item["content"])]
+    return "\n".join(lines) + "\n"
+
+
+def report_artifacts(dynamo_item: dict, artifacts_dir: Path = None) -> dict:
+    """{format: Artifact} of a typed Report item."""
+    item = decode_item(dynamo_item)
+    version = item.get("version") or 1
+    prefix = report_prefix(_org_id(item), item["id"], int(version))
+    artifacts = {}
+    for fmt, extension in REPORT_FORMATS.items():
+        key = f"{prefix}report.{extension}"
+        path = artifacts_dir / key if artifacts_dir else None
+        if path and path.is_file():
+            artifacts[fmt] = Artifact(key, path=path)
+        elif fmt == "markdown":
+            artifacts[fmt] = Artifact(key, body=render_report_markdown(item).encode("utf-8"))
+    return artifacts
+
+
+def message_artifact(dynamo_item: dict, min_chars: int = 0):
+    """Artifact of a typed Message item's content, or None if it has less than `min_chars` characters."""
+    content = dynamo_item.get("content", {}).get("S")
+    if not content or len(content) < min_chars:
+        return None
+    item = decode_item(dynamo_item)
+    return Artifact(message_key(_org_id(item), item["conversationId"], item["id"]), body=content.encode("utf-8"))
+
+
+def report_update(dynamo_item: dict, keys: dict):
+    """UpdateItem arguments recording a report's uploaded `{format: key}`, or None if already recorded.
+
+    Into an existing s3Keys map each format is set on its own, so formats
+    that failed to upload this time keep the keys recorded before.
+    """
+    recorded = dynamo_item.get("s3Keys", {}).get("M")
+    changed = {fmt: key for fmt, key in sorted(keys.items()) if (recorded or {}).get(fmt) != {"S": key}}
+    if not changed:
+        return None
+    update = {
+        "Key": {"PK": dynamo_item["PK"], "SK": dynamo_item["SK"]},
+        "ConditionExpression": "attribute_exists(PK)",
+    }
+    if recorded is None:
+        update["UpdateExpression"] = "SET s3Keys = :keys"
+        update["ExpressionAttributeValues"] = {":keys": {"M": {fmt: {"S": key} for fmt, key in changed.items()}}}
+        return update
+    update["UpdateExpression"] = "SET " + ", ".join(f"s3Keys.#f{i} = :k{i}" for i in range(len(changed)))
+    update["ExpressionAttributeNames"] = {f"#f{i}": fmt for i, fmt in enumerate(changed)}
+    update["ExpressionAttributeValues"] = {f":k{i}": {"S": key} for i, key in enumerate(changed.values())}
+    return update
+
+
+def message_update(dynamo_item: dict, bucket: str, key: str):
+    """UpdateItem arguments pointing a message's contentRef at its object, or None if it already does."""
+    value = {"S": f"s3://{bucket}/{key}"}
+    if dynamo_item.get("contentRef") == value:
+        return None
+    return {
+        "Key": {"PK": dynamo_item["PK"], "SK": dynamo_item["SK"]},
+        "UpdateExpression": "SET contentRef = :ref",
+        "ConditionExpression": "attribute_exists(PK)",
+        "ExpressionAttributeValues": {":ref": value},
+    }
@@ -0,0 +1,179 @@
+"""asyncio bulk sink: many BatchWriteItem calls in flight from one thread.
+
+`AsyncBulkSink` is a BulkSink whose batches are written by coroutines on
+an event loop in a background thread, over a single aiobotocore client
+whose connection pool is sized to `concurrency`. Producers keep the
+synchronous `put` / `put_typed` interface. Up to `max_in_flight` batches
+wait in line or are being written; beyond that `put` blocks until one
+finishes, so a fast producer cannot run ahead of the table. At most
+`concurrency` requests are on the wire at once.
+
+aiobotocore is optional; only the async write mode needs it.
+"""
+
+import asyncio
+import contextlib
+import random
+import threading
+import time
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from seedlib.batch_writer import BatchWriter, WriteResult
+from seedlib.marshal import marshal_item
+from seedlib.rate_limiter import item_write_units
+from seedlib.sink import BulkSink
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:  # optional: only the async write mode needs aiobotocore
+    AioConfig = get_session = None
+
+
+def async_client_factory(service: str, endpoint_url: str = None, **config_options):
+    """Zero-argument opener of an aiobotocore client for AsyncBulkSink.
+
+    `config_options` are botocore Config options (region_name,
+    max_pool_connections, connect_timeout, read_timeout, retries).
+    """
+    if get_session is None:
+        raise RuntimeError("the async write mode needs aiobotocore: pip install aiobotocore")
+    config = AioConfig(**config_options)
+
+    def open_client():
+        return get_session().create_client(service, endpoint_url=endpoint_url, config=config)
+
+    return open_client
+
+
+class BlockingClient:
+    """Call an async client's operations synchronously from outside its event loop."""
+
+    def __init__(self, client, loop: asyncio.AbstractEventLoop):
+        self.client = client
+        self.loop = loop
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def call(**kwargs):
+            return asyncio.run_coroutine_threadsafe(method(**kwargs), self.loop).result()
+
+        return call
+
+
+class AsyncBatchWriter(BatchWriter):
+    """BatchWriter with a coroutine twin of write_batch; create it on the loop it runs on.
+
+    At most `max_workers` calls are in flight at once. `client` is a
+    BlockingClient over the same async client, for synchronous callers
+    such as the stats flush.
+    """
+
+    def __init__(self, async_client, table_name: str, max_workers: int = 64, **kwargs):
+        loop = asyncio.get_running_loop()
+        super().__init__(BlockingClient(async_client, loop), table_name, max_workers=max_workers, **kwargs)
+        self.async_client = async_client
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    async def _send_async(self, requests: list) -> dict:
+        """Issue one BatchWriteItem call, paced by the rate limiter and timed if configured."""
+        if not self.rate_limiter and not self.telemetry:
+            async with self._slots:
+                return await self.async_client.batch_write_item(RequestItems={self.table_name: requests})
+
+        items = [r["PutRequest"]["Item"] for r in requests]
+        reserved = sum(item_write_units(item) for item in items)
+        if self.rate_limiter:
+            await asyncio.sleep(self.rate_limiter.reserve(reserved))
+        async with self._slots:
+            start = time.perf_counter()
+            try:
+                response = await self.async_client.batch_write_item(
+                    RequestItems={self.table_name: requests}, ReturnConsumedCapacity="TOTAL"
+                )
+            except (BotoCoreError, ClientError):
+                self._settle(items, reserved, start)
+                raise
+        self._settle(items, reserved, start, response)
+        return response
+
+    async def write_batch_async(self, items: list) -> WriteResult:
+        """Write up to 25 items, retrying whatever DynamoDB hands back."""
+        result = WriteResult()
+        pending = [{"PutRequest": {"Item": item}} for item in items]
+        attempt = 0
+
+        while pending:
+            try:
+                response = await self._send_async(pending)
+            except (BotoCoreError, ClientError) as e:
+                if not self._handle_error(result, pending, e, attempt):
+                    return result
+            else:
+                pending = self._handle_response(result, pending, response, attempt)
+                if not pending:
+                    break
+            ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+            await asyncio.sleep(random.uniform(0, ceiling))
+            attempt += 1
+
+        return result
+
+
+class AsyncBulkSink(BulkSink):
+    """BulkSink writing its batches from an asyncio event loop.
+
+    `open_client` returns an async context manager yielding the client
+    (see async_client_factory); it is entered on the loop and exited on close.
+    """
+
+    def __init__(
+        self,
+        open_client,
+        table_name: str,
+        concurrency: int = 64,
+        max_in_flight: int = None,
+        manifest=None,
+        marshal=marshal_item,
+        aggregates=None,
+        **writer_options,
+    ):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-sink", daemon=True)
+        self._thread.start()
+        self._clients = contextlib.AsyncExitStack()
+        try:
+            writer = self._run(self._start(open_client, table_name, concurrency, writer_options))
+        except BaseException:
+            self._stop_loop()
+            raise
+        super().__init__(writer, manifest, marshal, aggregates, max_in_flight or concurrency * 2)
+
+    def _run(self, coroutine):
+        """Run a coroutine on the sink's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _start(self, open_client, table_name: str, concurrency: int, writer_options: dict):
+        client = await self._clients.enter_async_context(open_client())
+        return AsyncBatchWriter(client, table_name, max_workers=concurrency, **writer_options)
+
+    def _open(self):
+        """The loop is already running."""
+
+    def _submit(self, batch: list):
+        """Schedule one batch on the loop; returns its concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(self.writer.write_batch_async(batch), self._loop)
+
+    def _shutdown(self):
+        """Close the client and stop the loop once every batch is collected."""
+        try:
+            self._run(self._clients.aclose())
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,194 @@
+"""Retry-safe BatchWriteItem engine with UnprocessedItems handling."""
+
+import random
+import time
+from dataclasses import dataclass, field
+
+from botocore.exceptions import BotoCoreError, ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+
+from seedlib.marshal import item_key
+from seedlib.rate_limiter import consumed_units, item_write_units
+
+BATCH_SIZE = 25
+
+# Errors that mean "slow down and try again", not "this request is wrong"
+RETRYABLE_ERRORS = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+    "ServiceUnavailable",
+}
+
+# Transport failures (timeouts, refused or dropped connections), retried like throttles
+RETRYABLE_TRANSPORT_ERRORS = (BotocoreConnectionError, HTTPClientError)
+
+
+@dataclass
+class WriteResult:
+    """Outcome of a bulk write: every item ends up written, failed or skipped as unchanged."""
+
+    written: int = 0
+    retried: int = 0
+    failed: int = 0
+    skipped: int = 0
+    failed_items: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    def merge(self, other: "WriteResult"):
+        """Fold another result into this one."""
+        self.written += other.written
+        self.retried += other.retried
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.failed_items.extend(other.failed_items)
+        self.errors.extend(other.errors)
+
+
+class BatchWriter:
+    """Write 25-item batches to one table; safe to share across threads.
+
+    `max_workers` is the concurrency the caller (see seedlib.sink.BulkSink)
+    should run batches at. Unprocessed items, throttled requests and
+    transport errors are retried with full-jitter exponential backoff.
+    Items still unwritten after `max_retries` attempts are counted as
+    failed, so written + failed always equals items submitted.
+
+    With a `rate_limiter` (seedlib.rate_limiter.AdaptiveRateLimiter) every
+    call first reserves the batch's estimated WCU, asks for
+    ReturnConsumedCapacity and settles up with what DynamoDB reports;
+    throttles and unprocessed items slow the limiter down. With `telemetry`
+    (seedlib.telemetry.Telemetry) every call and its outcome are recorded.
+    """
+
+    def __init__(
+        self,
+        client,
+        table_name: str,
+        max_workers: int = 8,
+        max_retries: int = 8,
+        base_delay: float = 0.05,
+        max_delay: float = 5.0,
+        rate_limiter=None,
+        telemetry=None,
+    ):
+        self.client = client
+        self.table_name = table_name
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter
+        self.telemetry = telemetry
+
+    def _backoff(self, attempt: int):
+        """Sleep for a full-jitter exponential delay."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        time.sleep(random.uniform(0, ceiling))
+
+    def _send(self, requests: list) -> dict:
+        """Issue one BatchWriteItem call, paced by the rate limiter and timed if configured."""
+        if not self.rate_limiter and not self.telemetry:
+            return self.client.batch_write_item(RequestItems={self.table_name: requests})
+
+        items = [r["PutRequest"]["Item"] for r in requests]
+        reserved = sum(item_write_units(item) for item in items)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(reserved)
+        start = time.perf_counter()
+        try:
+            response = self.client.batch_write_item(
+                RequestItems={self.table_name: requests}, ReturnConsumedCapacity="TOTAL"
+            )
+        except (BotoCoreError, ClientError):
+            self._settle(items, reserved, start)
+            raise
+        self._settle(items, reserved, start, response)
+        return response
+
+    def _settle(self, items: list, reserved: float, start: float, response: dict = None):
+        """Record a call with the telemetry and settle its reservation; `response` is None if it failed."""
+        consumed = consumed_units(response, reserved) if response is not None else 0
+        if self.telemetry:
+            self.telemetry.record_call(
+                items, time.perf_counter() - start, consumed if response is not None else None
+            )
+        if self.rate_limiter:
+            self.rate_limiter.record(consumed, reserved)
+
+    def _record_written(self, sent: list, unprocessed: list):
+        """Report the items of a call that DynamoDB accepted."""
+        left = {item_key(r["PutRequest"]["Item"]) for r in unprocessed}
+        self.telemetry.record_written(
+            [r["PutRequest"]["Item"] for r in sent if item_key(r["PutRequest"]["Item"]) not in left]
+        )
+
+    def _give_up(self, result: WriteResult, requests: list):
+        """Count the items of `requests` as failed."""
+        items = [r["PutRequest"]["Item"] for r in requests]
+        result.failed += len(items)
+        result.failed_items.extend(items)
+        if self.telemetry:
+            self.telemetry.record_failed(items)
+
+    def _retry(self, result: WriteResult, requests: list):
+        """Count `requests` as retried and slow the rate limiter down."""
+        result.retried += len(requests)
+        if self.telemetry:
+            self.telemetry.record_retried([r["PutRequest"]["Item"] for r in requests])
+        if self.rate_limiter:
+            self.rate_limiter.throttled()
+
+    def _handle_error(self, result: WriteResult, pending: list, error: Exception, attempt: int) -> bool:
+        """Account for a failed call (a ClientError or BotoCoreError); returns whether to retry it."""
+        if isinstance(error, ClientError):
+            code = error.response.get("Error", {}).get("Code", "")
+            retryable = code in RETRYABLE_ERRORS
+        else:
+            code = type(error).__name__
+            retryable = isinstance(error, RETRYABLE_TRANSPORT_ERRORS)
+        if not retryable or attempt >= self.max_retries:
+            self._give_up(result, pending)
+            result.errors.append(f"{code}: {error}")
+            return False
+        self._retry(result, pending)
+        return True
+
+    def _handle_response(self, result: WriteResult, pending: list, response: dict, attempt: int) -> list:
+        """Account for a successful call; returns the requests still to retry."""
+        unprocessed = response.get("UnprocessedItems", {}).get(self.table_name, [])
+        result.written += len(pending) - len(unprocessed)
+        if self.telemetry:
+            self._record_written(pending, unprocessed)
+        if not unprocessed:
+            return []
+
+        if attempt >= self.max_retries:
+            self._give_up(result, unprocessed)
+            result.errors.append(f"{len(unprocessed)} items still unprocessed after {attempt} retries")
+            return []
+
+        self._retry(result, unprocessed)
+        return unprocessed
+
+    def write_batch(self, items: list) -> WriteResult:
+        """Write up to 25 items, retrying whatever DynamoDB hands back."""
+        result = WriteResult()
+        pending = [{"PutRequest": {"Item": item}} for item in items]
+        attempt = 0
+
+        while pending:
+            try:
+                response = self._send(pending)
+            except (BotoCoreError, ClientError) as e:
+                if not self._handle_error(result, pending, e, attempt):
+                    return result
+            else:
+                pending = self._handle_response(result, pending, response, attempt)
+                if not pending:
+                    break
+            self._backoff(attempt)
+            attempt += 1
+
+        return result
@@ -0,0 +1,158 @@
+"""Warm the API's Redis cache with the hot read models after seeding.
+
+`ReadModels` collects seeded partner, trend and report items and turns them
+into the list responses the API caches, one JSON value per key:
+
+- `<prefix>partners`: `{"partners": [...]}`, by name
+- `<prefix>trends:country:<country>`: `{"trends": [...]}`, newest first
+- `<prefix>reports:org:<orgId>`: `{"reports": [...]}`, the report index
+  rows (no content), most recently updated first
+
+`warm_cache` writes them with SET EX in non-transactional pipelines of
+`pipeline_size` commands, so the whole warm-up is a handful of round trips,
+each read model with its own TTL. Any client with redis-py's
+`pipeline(transaction=False)` interface works, including
+seedlib.fake_redis.FakeRedis.
+"""
+
+import json
+import time
+
+from seedlib.codec import decode_item
+
+try:
+    import redis
+except ImportError:  # optional: only the warm-up stage needs redis-py
+    redis = None
+
+DEFAULT_PREFIX = "treven:"
+DEFAULT_TTLS = {"partners": 86400, "trends": 3600, "reports": 300}
+
+# Errors that mean the cache is unavailable, not that the seed failed
+CACHE_ERRORS = (OSError,) + ((redis.RedisError,) if redis else ())
+
+
+def redis_client(url: str):
+    """redis-py client for a redis:// URL."""
+    if redis is None:
+        raise RuntimeError("the cache warm-up needs redis-py: pip install redis")
+    return redis.Redis.from_url(url)
+
+
+def _json_list(value) -> list:
+    """A list attribute stored natively or as a JSON string (the json item encoding)."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [value]
+    return list(value) if value else []
+
+
+def partner_row(item: dict) -> dict:
+    """Partner list entry of a plain Partner item."""
+    return {
+        "id": item.get("id"),
+        "name": item.get("name"),
+        "type": item.get("type"),
+        "accessLevel": item.get("accessLevel"),
+        "reportsShared": item.get("reportsShared", 0),
+        "createdAt": item.get("createdAt"),
+    }
+
+
+def trend_row(item: dict) -> dict:
+    """GET /api/trends entry of a plain Trend item."""
+    return {
+        "id": item.get("id"),
+        "title": item.get("title"),
+        "country": item.get("country"),
+        "exploitationType": item.get("exploitationType"),
+        "confidence": item.get("confidence"),
+        "summary": item.get("summary"),
+        "sources": _json_list(item.get("sources")),
+        "tags": _json_list(item.get("tags")),
+        "updatedAt": item.get("lastUpdated"),
+    }
+
+
+def report_row(item: dict) -> dict:
+    """GET /api/reports entry of a plain Report item."""
+    return {
+        "id": item.get("id"),
+        "title": item.get("title"),
+        "country": item.get("country"),
+        "sector": item.get("sector"),
+        "exploitationType": item.get("exploitationType"),
+        "status": item.get("status"),
+        "version": item.get("version"),
+        "wordCount": item.get("wordCount"),
+        "createdAt": item.get("createdAt"),
+        "updatedAt": item.get("updatedAt"),
+    }
+
+
+class ReadModels:
+    """Cached list responses built from seeded items; adding an item again replaces it."""
+
+    def __init__(self, prefix: str = DEFAULT_PREFIX):
+        self.prefix = prefix
+        self._partners = {}
+        self._trends = {}
+        self._reports = {}
+
+    def add(self, dynamo_item: dict):
+        """Take one typed item; entities without a read model are ignored."""
+        entity_type = dynamo_item.get("entityType", {}).get("S")
+        if entity_type not in ("Partner", "Trend", "Report"):
+            return
+        item = decode_item(dynamo_item)
+        if entity_type == "Partner":
+            self._partners[item["id"]] = partner_row(item)
+        elif entity_type == "Trend" and item.get("country"):
+            self._trends.setdefault(item["country"], {})[item["id"]] = trend_row(item)
+        elif entity_type == "Report" and item.get("orgId"):
+            self._reports.setdefault(item["orgId"], {})[item["id"]] = report_row(item)
+
+    def entries(self) -> list:
+        """(read model, key, JSON value) for every cache entry."""
+        entries = []
+        if self._partners:
+            partners = sorted(self._partners.values(), key=lambda row: row["name"] or "")
+            entries.append(("partners", f"{self.prefix}partners", {"partners": partners}))
+        for country, rows in sorted(self._trends.items()):
+            trends = sorted(rows.values(), key=lambda row: row["updatedAt"] or "", reverse=True)
+            entries.append(("trends", f"{self.prefix}trends:country:{country}", {"trends": trends}))
+        for org_id, rows in sorted(self._reports.items()):
+            reports = sorted(rows.values(), key=lambda row: row["updatedAt"] or "", reverse=True)
+            entries.append(("reports", f"{self.prefix}reports:org:{org_id}", {"reports": reports}))
+        return [(model, key, json.dumps(value, separators=(",", ":"))) for model, key, value in entries]
+
+
+def warm_cache(client, read_models: ReadModels, ttls: dict = None, pipeline_size: int = 500) -> dict:
+    """Write every read model with its TTL in pipelined batches.
+
+    Returns the keys written per read model plus `round_trips` and `seconds`.
+    """
+    ttls = {**DEFAULT_TTLS, **(ttls or {})}
+    counts = {model: 0 for model in DEFAULT_TTLS}
+    round_trips = 0
+    start = time.perf_counter()
+
+    pipe = client.pipeline(transaction=False)
+    queued = 0
+    for model, key, value in read_models.entries():
+        pipe.set(key, value, ex=ttls[model])
+        counts[model] += 1
+        queued += 1
+        if queued >= pipeline_size:
+            pipe.execute()
+            round_trips += 1
+            queued = 0
+    if queued:
+        pipe.execute()
+        round_trips += 1
+
+    counts["round_trips"] = round_trips
+    counts["seconds"] = time.perf_counter() - start
+    return counts
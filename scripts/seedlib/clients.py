@@ -0,0 +1,51 @@
+"""boto3 clients of the scripts, with one pool, timeout and retry policy.
+
+Every DynamoDB client, sync or async (seedlib.async_sink), is configured by
+`client_options`:
+
+- a connection pool of at least 10, sized to the caller's concurrency
+- DYNAMODB_CONNECT_TIMEOUT / DYNAMODB_READ_TIMEOUT seconds (default 5 / 20)
+- botocore's standard retry mode with DYNAMODB_MAX_ATTEMPTS attempts (default 3)
+
+The scripts keep their own region and endpoint settings and pass them in.
+"""
+
+import os
+
+import boto3
+from botocore.config import Config
+
+CONNECT_TIMEOUT = float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("DYNAMODB_READ_TIMEOUT", "20"))
+MAX_ATTEMPTS = int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "3"))
+
+
+def client_options(region_name: str, max_connections: int = 10) -> dict:
+    """botocore Config options of the DynamoDB clients: pool size, timeouts and retries."""
+    return {
+        "region_name": region_name,
+        "max_pool_connections": max(10, max_connections),
+        "connect_timeout": CONNECT_TIMEOUT,
+        "read_timeout": READ_TIMEOUT,
+        "retries": {"mode": "standard", "max_attempts": MAX_ATTEMPTS},
+    }
+
+
+def dynamodb_client(region_name: str, endpoint_url: str = None, max_connections: int = 10):
+    """DynamoDB client with `max_connections` pooled connections, on `endpoint_url` if given."""
+    config = Config(**client_options(region_name, max_connections))
+    if endpoint_url:
+        return boto3.client("dynamodb", endpoint_url=endpoint_url, config=config)
+    return boto3.client("dynamodb", config=config)
+
+
+def s3_client(region_name: str, endpoint_url: str = None, max_connections: int = 10):
+    """S3 client with `max_connections` pooled connections; path-style addressing on a custom endpoint (LocalStack)."""
+    config = Config(
+        region_name=region_name,
+        max_pool_connections=max(10, max_connections),
+        s3={"addressing_style": "path"} if endpoint_url else None,
+    )
+    if endpoint_url:
+        return boto3.client("s3", endpoint_url=endpoint_url, config=config)
+    return boto3.client("s3", config=config)
@@ -0,0 +1,244 @@
+"""Schema-compiled codecs for the seeded entity types.
+
+`marshal_item` picks a type per attribute with an isinstance chain and stores
+lists and dicts as JSON strings. An `EntityCodec` is compiled once from a
+declared schema instead, into one straight-line encode and decode function
+per entity, and lists/dicts become native L/M (or SS) attributes that
+readers get back without a second json.loads and that projections can reach
+into.
+
+Attributes missing from a schema still round-trip through the generic
+native encoder. None values and empty string sets are dropped, as DynamoDB
+requires.
+"""
+
+from seedlib.marshal import marshal_item
+
+ENCODINGS = ("json", "native")
+
+
+def _number(text: str):
+    """int for integral N values, float otherwise."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _encode_value(value) -> dict:
+    """Native attribute value for any plain Python value."""
+    if type(value) is str:
+        return {"S": value}
+    return _VALUE_ENCODERS[type(value)](value)
+
+
+def _decode_value(attr: dict):
+    """Plain Python value of any attribute value."""
+    for tag, value in attr.items():
+        if tag == "S":
+            return value
+        return _VALUE_DECODERS[tag](value)
+
+
+_VALUE_ENCODERS = {
+    str: lambda v: {"S": v},
+    bool: lambda v: {"BOOL": v},
+    int: lambda v: {"N": str(v)},
+    float: lambda v: {"N": str(v)},
+    bytes: lambda v: {"B": v},
+    bytearray: lambda v: {"B": bytes(v)},
+    list: lambda v: {"L": [_encode_value(x) for x in v]},
+    tuple: lambda v: {"L": [_encode_value(x) for x in v]},
+    dict: lambda v: {"M": {k: _encode_value(x) for k, x in v.items() if x is not None}},
+    type(None): lambda v: {"NULL": True},
+}
+
+_VALUE_DECODERS = {
+    "S": lambda v: v,
+    "N": _number,
+    "BOOL": lambda v: v,
+    "B": lambda v: v,
+    "SS": list,
+    "NS": lambda v: [_number(x) for x in v],
+    "L": lambda v: [_decode_value(x) for x in v],
+    "M": lambda v: {k: _decode_value(x) for k, x in v.items()},
+    "NULL": lambda v: None,
+}
+
+# Declared attribute type -> source template of its encoded attribute value,
+# and of the inner value's decoder (None = stored as-is)
+_FIELD_ENCODERS = {
+    "S": '{{"S": {v}}}',
+    "N": '{{"N": str({v})}}',
+    "BOOL": '{{"BOOL": {v}}}',
+    "B": '{{"B": {v}}}',
+    "SS": '{{"SS": sorted(set({v}))}}',
+    "L": "_encode_value({v})",
+    "M": "_encode_value({v})",
+}
+_FIELD_DECODERS = {"S": None, "N": "_number", "BOOL": None, "B": None, "SS": "list", "L": "_decode_L", "M": "_decode_M"}
+
+
+def _compile(source: str, name: str, namespace: dict):
+    """Define function `name` from generated source."""
+    exec(compile(source, f"<codec {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class EntityCodec:
+    """Encoder/decoder for one entity type, compiled from `{attribute: type}`.
+
+    Types are S, N, BOOL, B, SS, L and M. The schema is turned into straight-
+    line Python source once, one statement per attribute, so encoding and
+    decoding do no per-attribute type dispatch. L/M values and their members
+    are encoded natively by their Python type, so a declared list that turns
+    out to be a dict still lands as M rather than as its keys.
+    """
+
+    def __init__(self, entity_type: str, schema: dict):
+        for attr_type in schema.values():
+            if attr_type not in _FIELD_ENCODERS:
+                raise ValueError(f"unknown attribute type: {attr_type}")
+        self.entity_type = entity_type
+        self.schema = dict(schema)
+        namespace = {
+            "_encode_value": _encode_value,
+            "_decode_value": _decode_value,
+            "_number": _number,
+            "_decode_L": _VALUE_DECODERS["L"],
+            "_decode_M": _VALUE_DECODERS["M"],
+            "_FIELDS": frozenset(self.schema),
+        }
+        self.encode = _compile(self._encoder_source(), "encode", namespace)
+        self.decode = _compile(self._decoder_source(), "decode", namespace)
+
+    def _encoder_source(self) -> str:
+        lines = [
+            "def encode(item):",
+            '    """Typed item for a plain one, dropping None values."""',
+            "    out = {}",
+        ]
+        for name, attr_type in self.schema.items():
+            lines += [
+                f"    v = item.get({name!r})",
+                "    if v is not None" + (" and v:" if attr_type == "SS" else ":"),
+                f"        out[{name!r}] = {_FIELD_ENCODERS[attr_type].format(v='v')}",
+            ]
+        lines += [
+            "    if len(item) > len(out):",
+            "        for name in item.keys() - _FIELDS:",
+            "            if item[name] is not None:",
+            "                out[name] = _encode_value(item[name])",
+            "    return out",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _decoder_source(self) -> str:
+        lines = [
+            "def decode(dynamo_item):",
+            '    """Plain item for a typed one."""',
+            "    out = {}",
+        ]
+        for name, attr_type in self.schema.items():
+            decoder = _FIELD_DECODERS[attr_type]
+            value = f"v[{attr_type!r}]"
+            lines += [
+                f"    v = dynamo_item.get({name!r})",
+                "    if v is not None:",
+                f"        out[{name!r}] = {f'{decoder}({value})' if decoder else value} "
+                f"if {attr_type!r} in v else _decode_value(v)",
+            ]
+        lines += [
+            "    if len(dynamo_item) > len(out):",
+            "        for name in dynamo_item.keys() - _FIELDS:",
+            "            out[name] = _decode_value(dynamo_item[name])",
+            "    return out",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+_KEYS = {"PK": "S", "SK": "S", "entityType": "S"}
+
+CODECS = {
+    codec.entity_type: codec
+    for codec in (
+        EntityCodec("Partner", {
+            **_KEYS,
+            "id": "S",
+            "name": "S",
+            "type": "S",
+            "reportsShared": "N",
+            "accessLevel": "S",
+            "createdAt": "S",
+        }),
+        EntityCodec("Trend", {
+            **_KEYS,
+            "id": "S",
+            "country": "S",
+            "countryCode": "S",
+            "title": "S",
+            "confidence": "S",
+            "exploitationType": "S",
+            "summary": "S",
+            "sources": "L",
+            "lastUpdated": "S",
+        }),
+        EntityCodec("Report", {
+            **_KEYS,
+            "id": "S",
+            "orgId": "S",
+            "title": "S",
+            "country": "S",
+            "sector": "S",
+            "exploitationType": "S",
+            "status": "S",
+            "version": "N",
+            "wordCount": "N",
+            "s3Keys": "M",
+            "createdAt": "S",
+            "updatedAt": "S",
+        }),
+        EntityCodec("TahArticle", {
+            **_KEYS,
+            "docId": "S",
+            "url": "S",
+            "title": "S",
+            "article": "S",
+            "articleZ": "B",
+            "contentEncoding": "S",
+            "contentRef": "S",
+            "contentSha256": "S",
+            "summary": "S",
+            "region": "S",
+            "sourceType": "S",
+            "trfkType": "L",
+            "trfkSubtype": "L",
+            "recruitment": "L",
+            "coercion": "L",
+            "crawlDate": "S",
+            "publishDate": "S",
+        }),
+    )
+}
+
+_GENERIC = EntityCodec("", {})
+
+
+def encode_item(item: dict) -> dict:
+    """Typed item with native L/M/SS attributes, via the codec of its entityType."""
+    return CODECS.get(item.get("entityType"), _GENERIC).encode(item)
+
+
+def decode_item(dynamo_item: dict) -> dict:
+    """Plain item for a typed one, via the codec of its entityType."""
+    entity_type = dynamo_item.get("entityType", {}).get("S")
+    return CODECS.get(entity_type, _GENERIC).decode(dynamo_item)
+
+
+def get_marshaller(encoding: str = "json"):
+    """Plain-item -> typed-item function for an encoding: "json" (marshal_item) or "native"."""
+    if encoding == "native":
+        return encode_item
+    if encoding == "json":
+        return marshal_item
+    raise ValueError(f"unknown item encoding: {encoding}")
@@ -0,0 +1,135 @@
+"""Near-duplicate TAH article detection with MinHash and LSH.
+
+The article builders compute a MinHash signature of each article's word
+5-shingles in the transform workers (`minhash=True`). `NearDuplicateDetector`
+then looks each signature up in LSH band tables. If a remembered article is
+at least `threshold` similar by estimated Jaccard, the new one is written
+as a small alias item pointing at it (`alias_item`) instead of a second
+copy of the story.
+
+Memory is bounded: the detector remembers at most `max_docs` canonical
+signatures and forgets the oldest first, so a duplicate is caught as long
+as its original was among the last `max_docs` distinct articles.
+"""
+
+import random
+import re
+import zlib
+from array import array
+from collections import OrderedDict
+
+SHINGLE_WORDS = 5
+NUM_PERM = 64
+# 8 bands of 8 rows: pairs above ~0.77 similarity usually share a band
+BANDS = 8
+
+_PRIME = (1 << 31) - 1
+_WORD = re.compile(r"\w+")
+
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+ALIAS_ENTITY = "TahArticleAlias"
+
+
+def minhash(text: str):
+    """MinHash signature (NUM_PERM u32 values) of a text's word shingles, or None if it has no words."""
+    words = _WORD.findall(text.casefold()) if text else []
+    if not words:
+        return None
+    hashes = {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_WORDS]).encode("utf-8")) & _PRIME
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    }
+    return array("I", [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS])
+
+
+def similarity(a, b) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class NearDuplicateDetector:
+    """Streaming LSH index of the last `max_docs` distinct articles."""
+
+    def __init__(self, threshold: float = 0.8, max_docs: int = 100_000, bands: int = BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"{NUM_PERM} permutations do not split into {bands} bands")
+        self.threshold = threshold
+        self.max_docs = max_docs
+        self.rows = NUM_PERM // bands
+        self.seen = 0
+        self.duplicates = 0
+        self._signatures = OrderedDict()
+        self._buckets = [{} for _ in range(bands)]
+
+    @property
+    def ratio(self) -> float:
+        """Share of the articles seen that were near-duplicates."""
+        return self.duplicates / self.seen if self.seen else 0.0
+
+    def _band_keys(self, signature) -> list:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(len(self._buckets))]
+
+    def check(self, key: tuple, signature):
+        """(canonical key, similarity) if `key` near-duplicates a remembered article, else None.
+
+        An article that is not a duplicate is remembered as a canonical one.
+        Articles without a signature (no text) are never duplicates.
+        """
+        self.seen += 1
+        if signature is None:
+            return None
+        if key in self._signatures:
+            return None
+
+        band_keys = self._band_keys(signature)
+        best = None
+        for buckets, band_key in zip(self._buckets, band_keys):
+            for candidate in buckets.get(band_key, ()):
+                score = similarity(signature, self._signatures[candidate])
+                if score >= self.threshold and (best is None or score > best[1]):
+                    best = (candidate, score)
+        if best:
+            self.duplicates += 1
+            return best
+
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, []).append(key)
+        if len(self._signatures) > self.max_docs:
+            self._forget(*self._signatures.popitem(last=False))
+        return None
+
+    def _forget(self, key: tuple, signature):
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets.get(band_key)
+            if bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del buckets[band_key]
+
+
+def alias_item(dynamo_item: dict, canonical_key: tuple, score: float) -> dict:
+    """Small typed item written under a duplicate's own key, pointing at its canonical article."""
+    alias = {
+        "PK": dynamo_item["PK"],
+        "SK": dynamo_item["SK"],
+        "entityType": {"S": ALIAS_ENTITY},
+        "docId": dynamo_item["docId"],
+        "canonicalPK": {"S": canonical_key[0]},
+        "canonicalSK": {"S": canonical_key[1]},
+        "similarity": {"N": f"{score:.3f}"},
+    }
+    for name in ("url", "region", "crawlDate", "publishDate"):
+        if name in dynamo_item:
+            alias[name] = dynamo_item[name]
+    return alias
+
+
+def resolve_alias(client, table_name: str, dynamo_item: dict) -> dict:
+    """The canonical article item for an alias item; other items are returned unchanged."""
+    if dynamo_item.get("entityType", {}).get("S") != ALIAS_ENTITY:
+        return dynamo_item
+    key = {"PK": dynamo_item["canonicalPK"], "SK": dynamo_item["canonicalSK"]}
+    return client.get_item(TableName=table_name, Key=key).get("Item", dynamo_item)
@@ -0,0 +1,543 @@
+"""In-process stand-in for the DynamoDB client, for benchmarks and offline runs.
+
+Implements the subset of the boto3 DynamoDB client API the seed scripts call,
+with optional per-call latency and throttling so retry and concurrency paths
+can be exercised without LocalStack. `AsyncFakeDynamoDB` puts the
+aiobotocore-style async interface in front of one.
+"""
+
+import asyncio
+import math
+import random
+import re
+import threading
+import time
+import zlib
+
+from botocore.exceptions import ClientError
+
+from seedlib.rate_limiter import item_size, item_write_units
+
+MAX_BATCH_WRITE = 25
+
+# Query and Scan stop after reading this much, as DynamoDB does
+MAX_PAGE_BYTES = 1024 * 1024
+
+# Bytes per eventually consistent half read unit
+READ_UNIT_BYTES = 4096
+
+_CONDITION = re.compile(
+    r"^\s*(?:begins_with\(\s*(?P<bw_name>[#\w]+)\s*,\s*(?P<bw_value>:\w+)\s*\)"
+    r"|(?P<name>[#\w]+)\s*(?:(?P<op><=|>=|<|>|=)\s*(?P<value>:\w+)"
+    r"|BETWEEN\s+(?P<low>:\w+)\s+AND\s+(?P<high>:\w+)))\s*$",
+    re.IGNORECASE,
+)
+
+
+def _scalar(value: dict):
+    """Comparable Python value of an S or N attribute."""
+    if "N" in value:
+        return float(value["N"])
+    return next(iter(value.values()))
+
+
+def _split_conditions(expression: str) -> list:
+    """Split a key condition on AND, keeping BETWEEN x AND y together."""
+    parts = re.split(r"\s+AND\s+", expression, flags=re.IGNORECASE)
+    conditions = []
+    for part in parts:
+        if conditions and re.search(r"\bBETWEEN\s+:\w+\s*$", conditions[-1], re.IGNORECASE):
+            conditions[-1] = f"{conditions[-1]} AND {part}"
+        else:
+            conditions.append(part)
+    return conditions
+
+
+_COMPARE = {
+    "=": lambda a, b: a == b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _key_condition(expression: str, names: dict, values: dict):
+    """Compile a KeyConditionExpression into a predicate over items."""
+    checks = []
+    for condition in _split_conditions(expression):
+        match = _CONDITION.match(condition)
+        if not match:
+            raise ValueError(f"unsupported key condition: {condition}")
+
+        if match["bw_name"]:
+            attr = names.get(match["bw_name"], match["bw_name"])
+            prefix = _scalar(values[match["bw_value"]])
+
+            def check(v, prefix=prefix):
+                return isinstance(v, str) and v.startswith(prefix)
+
+        elif match["op"]:
+            attr = names.get(match["name"], match["name"])
+            operand, compare = _scalar(values[match["value"]]), _COMPARE[match["op"]]
+
+            def check(v, operand=operand, compare=compare):
+                return v is not None and compare(v, operand)
+
+        else:
+            attr = names.get(match["name"], match["name"])
+            low, high = _scalar(values[match["low"]]), _scalar(values[match["high"]])
+
+            def check(v, low=low, high=high):
+                return v is not None and low <= v <= high
+
+        checks.append((attr, check))
+
+    def predicate(item: dict) -> bool:
+        return all(check(_scalar(item[attr]) if attr in item else None) for attr, check in checks)
+
+    return predicate
+
+
+def _equality_value(expression: str, names: dict, values: dict, attr: str):
+    """The value a key condition requires `attr` to equal, or None."""
+    for condition in _split_conditions(expression):
+        match = _CONDITION.match(condition)
+        if match and match["op"] == "=" and names.get(match["name"], match["name"]) == attr:
+            return _scalar(values[match["value"]])
+    return None
+
+
+_UPDATE_CLAUSE = re.compile(r"\b(ADD|SET)\s+", re.IGNORECASE)
+
+
+def _update_actions(expression: str, names: dict, values: dict) -> list:
+    """("ADD"|"SET", attribute path, value) actions of an UpdateExpression with ADD and SET clauses.
+
+    A path is a tuple of names: ("s3Keys",) or, for `SET s3Keys.#fmt = :key`,
+    ("s3Keys", "pdf").
+    """
+    parts = _UPDATE_CLAUSE.split(expression)
+    if parts[0].strip():
+        raise ValueError(f"unsupported update expression: {expression}")
+    actions = []
+    for action, clause in zip(parts[1::2], parts[2::2]):
+        for assignment in clause.split(","):
+            tokens = assignment.replace("=", " ").split()
+            if len(tokens) != 2:
+                raise ValueError(f"unsupported update action: {assignment.strip()}")
+            name, value = tokens
+            path = tuple(names.get(part, part) for part in name.split("."))
+            actions.append((action.upper(), path, values[value]))
+    return actions
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    """Build the ClientError boto3 would raise."""
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+class FakeDynamoDB:
+    """Thread-safe in-memory tables keyed by (PK, SK).
+
+    `latency` is seconds slept per call (outside the lock, so concurrent
+    callers overlap as they would over the network). `throttle_rate` is the
+    chance that a call to one of `throttled_operations` is rejected outright
+    (by default only BatchWriteItem, since the seed scripts do their own
+    retries there and rely on botocore's for single-item calls);
+    `unprocessed_rate` is the chance that each item of a BatchWriteItem is
+    handed back in UnprocessedItems.
+
+    With `write_capacity` the tables are provisioned at that many WCU/s
+    (with one second of burst): BatchWriteItem hands back the items that do
+    not fit and is throttled outright when none do, and ConsumedCapacity is
+    reported when asked for.
+
+    Tables made with create_table/update_table carry their GSIs, which
+    Query can read through IndexName. Query and Scan page at 1 MB of data
+    read, apply FilterExpression after reading, and report the read units
+    they consumed, so index and filter access paths cost what they would.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        unprocessed_rate: float = 0.0,
+        seed: int = None,
+        throttled_operations=("BatchWriteItem",),
+        write_capacity: float = None,
+    ):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.throttled_operations = set(throttled_operations)
+        self.unprocessed_rate = unprocessed_rate
+        self.tables = {}
+        self.indexes = {}
+        self.calls = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self.write_capacity = write_capacity
+        self.consumed_wcu = 0.0
+        self.consumed_rcu = 0.0
+        self._wcu_tokens = write_capacity or 0.0
+        self._wcu_updated = time.monotonic()
+
+    def _call(self, operation: str):
+        """Account for one API call: latency, then maybe throttle."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            throttled = operation in self.throttled_operations and self._random.random() < self.throttle_rate
+        if throttled:
+            raise _client_error(
+                "ProvisionedThroughputExceededException",
+                "The level of configured provisioned throughput for the table was exceeded.",
+                operation,
+            )
+
+    def _take_wcu(self, units: int) -> bool:
+        """Consume write capacity if the provisioned bucket has it; call with the lock held."""
+        if self.write_capacity is None:
+            self.consumed_wcu += units
+            return True
+        now = time.monotonic()
+        self._wcu_tokens = min(
+            self.write_capacity, self._wcu_tokens + (now - self._wcu_updated) * self.write_capacity
+        )
+        self._wcu_updated = now
+        if units > self._wcu_tokens:
+            return False
+        self._wcu_tokens -= units
+        self.consumed_wcu += units
+        return True
+
+    @staticmethod
+    def _consumed(table_name: str, units: float) -> dict:
+        return {"TableName": table_name, "CapacityUnits": float(units)}
+
+    @staticmethod
+    def _key(item: dict) -> tuple:
+        return item["PK"]["S"], item["SK"]["S"]
+
+    def _request_key(self, request: dict) -> tuple:
+        if "PutRequest" in request:
+            return self._key(request["PutRequest"]["Item"])
+        return self._key(request["DeleteRequest"]["Key"])
+
+    def table(self, name: str) -> dict:
+        """The backing dict of a table, created on first use."""
+        with self._lock:
+            return self.tables.setdefault(name, {})
+
+    def create_table(self, TableName: str, GlobalSecondaryIndexes: list = (), **kwargs) -> dict:
+        """client.create_table; only the GSI definitions are kept"""
+        self._call("CreateTable")
+        with self._lock:
+            if TableName in self.indexes:
+                raise _client_error("ResourceInUseException", f"Table already exists: {TableName}", "CreateTable")
+            self.tables.setdefault(TableName, {})
+            self.indexes[TableName] = {index["IndexName"]: index for index in GlobalSecondaryIndexes}
+        return {"TableDescription": self._description(TableName)}
+
+    def update_table(self, TableName: str, GlobalSecondaryIndexUpdates: list = (), **kwargs) -> dict:
+        """client.update_table; GSI Create/Delete take effect at once"""
+        self._call("UpdateTable")
+        with self._lock:
+            indexes = self.indexes.setdefault(TableName, {})
+            for update in GlobalSecondaryIndexUpdates:
+                if "Create" in update:
+                    indexes[update["Create"]["IndexName"]] = update["Create"]
+                elif "Delete" in update:
+                    indexes.pop(update["Delete"]["IndexName"], None)
+        return {"TableDescription": self._description(TableName)}
+
+    def _description(self, table_name: str) -> dict:
+        if self.write_capacity is None:
+            table = {"TableName": table_name, "BillingModeSummary": {"BillingMode": "PAY_PER_REQUEST"}}
+        else:
+            throughput = {"ReadCapacityUnits": self.write_capacity, "WriteCapacityUnits": self.write_capacity}
+            table = {"TableName": table_name, "ProvisionedThroughput": throughput}
+        table["TableStatus"] = "ACTIVE"
+        indexes = self.indexes.get(table_name)
+        if indexes:
+            table["GlobalSecondaryIndexes"] = [{**index, "IndexStatus": "ACTIVE"} for index in indexes.values()]
+        return table
+
+    def describe_table(self, TableName: str, **kwargs) -> dict:
+        """client.describe_table, enough for the seed scripts' capacity and index lookups"""
+        self._call("DescribeTable")
+        return {"Table": self._description(TableName)}
+
+    def put_item(self, TableName: str, Item: dict, ReturnConsumedCapacity: str = "NONE", **kwargs) -> dict:
+        """client.put_item"""
+        self._call("PutItem")
+        table = self.table(TableName)
+        units = item_write_units(Item)
+        with self._lock:
+            if not self._take_wcu(units):
+                raise _client_error(
+                    "ProvisionedThroughputExceededException",
+                    "The level of configured provisioned throughput for the table was exceeded.",
+                    "PutItem",
+                )
+            table[self._key(Item)] = Item
+        if ReturnConsumedCapacity != "NONE":
+            return {"ConsumedCapacity": self._consumed(TableName, units)}
+        return {}
+
+    def get_item(self, TableName: str, Key: dict, **kwargs) -> dict:
+        """client.get_item"""
+        self._call("GetItem")
+        item = self.table(TableName).get(self._key(Key))
+        return {"Item": item} if item is not None else {}
+
+    def _index_schema(self, table_name: str, index_name: str, operation: str) -> tuple:
+        """(hash key, range key, projected attributes or None for ALL) of a GSI."""
+        index = self.indexes.get(table_name, {}).get(index_name)
+        if index is None:
+            raise _client_error(
+                "ValidationException",
+                f"The table does not have the specified index: {index_name}",
+                operation,
+            )
+        keys = {k["KeyType"]: k["AttributeName"] for k in index["KeySchema"]}
+        projection = index.get("Projection", {})
+        if projection.get("ProjectionType", "ALL") == "ALL":
+            projected = None
+        else:
+            projected = {"PK", "SK", *keys.values(), *projection.get("NonKeyAttributes", ())}
+        return keys["HASH"], keys.get("RANGE"), projected
+
+    def _read_page(
+        self,
+        table_name: str,
+        candidates: list,
+        order,
+        key_names: tuple,
+        descending: bool,
+        limit: int,
+        start_key: dict,
+        filter_expression: str,
+        names: dict,
+        values: dict,
+        return_consumed: str,
+    ) -> dict:
+        """Page through `candidates` in `order` as Query/Scan do: Limit, 1 MB, then the filter."""
+        candidates.sort(key=order, reverse=descending)
+        if start_key:
+            start = order(start_key)
+            candidates = [item for item in candidates if (order(item) < start if descending else order(item) > start)]
+
+        page, read_bytes = [], 0
+        for item in candidates:
+            if limit and len(page) >= limit or page and read_bytes >= MAX_PAGE_BYTES:
+                break
+            page.append(item)
+            read_bytes += item_size(item)
+
+        units = math.ceil(read_bytes / READ_UNIT_BYTES) * 0.5
+        with self._lock:
+            self.consumed_rcu += units
+
+        items = page
+        if filter_expression:
+            predicate = _key_condition(filter_expression, names or {}, values or {})
+            items = [item for item in page if predicate(item)]
+        response = {"Items": items, "Count": len(items), "ScannedCount": len(page)}
+        if len(page) < len(candidates):
+            last = page[-1]
+            response["LastEvaluatedKey"] = {name: last[name] for name in key_names}
+        if return_consumed != "NONE":
+            response["ConsumedCapacity"] = {"TableName": table_name, "CapacityUnits": units}
+        return response
+
+    def update_item(
+        self,
+        TableName: str,
+        Key: dict,
+        UpdateExpression: str,
+        ExpressionAttributeValues: dict,
+        ExpressionAttributeNames: dict = None,
+        **kwargs,
+    ) -> dict:
+        """client.update_item for ADD (numbers) and SET actions, creating the item if missing
+
+        SET may assign one key of an existing map attribute (`SET a.#b = :v`).
+        """
+        self._call("UpdateItem")
+        actions = _update_actions(UpdateExpression, ExpressionAttributeNames or {}, ExpressionAttributeValues)
+        table = self.table(TableName)
+        with self._lock:
+            item = dict(table.get(self._key(Key), Key))
+            for action, path, value in actions:
+                name = path[0]
+                if action == "ADD":
+                    total = _scalar(item[name]) + _scalar(value) if name in item else _scalar(value)
+                    item[name] = {"N": str(int(total) if total == int(total) else total)}
+                elif len(path) == 2 and "M" in item.get(name, {}):
+                    item[name] = {"M": {**item[name]["M"], path[1]: value}}
+                elif len(path) == 1:
+                    item[name] = value
+                else:
+                    raise _client_error(
+                        "ValidationException",
+                        "The document path provided in the update expression is invalid for update",
+                        "UpdateItem",
+                    )
+            self._take_wcu(item_write_units(item))
+            table[self._key(Key)] = item
+        return {}
+
+    def query(
+        self,
+        TableName: str,
+        KeyConditionExpression: str,
+        ExpressionAttributeValues: dict,
+        ExpressionAttributeNames: dict = None,
+        IndexName: str = None,
+        FilterExpression: str = None,
+        ScanIndexForward: bool = True,
+        Limit: int = None,
+        ExclusiveStartKey: dict = None,
+        ReturnConsumedCapacity: str = "NONE",
+        **kwargs,
+    ) -> dict:
+        """client.query on the table's PK/SK or on one of its GSIs"""
+        self._call("Query")
+        names = ExpressionAttributeNames or {}
+        predicate = _key_condition(KeyConditionExpression, names, ExpressionAttributeValues)
+        if IndexName:
+            hash_key, range_key, projected = self._index_schema(TableName, IndexName, "Query")
+        else:
+            hash_key, range_key, projected = "PK", "SK", None
+        table = self.table(TableName)
+        # Base-table partitions are found by key, without evaluating every item
+        pk = None if IndexName else _equality_value(KeyConditionExpression, names, ExpressionAttributeValues, "PK")
+        with self._lock:
+            items = table.values() if pk is None else [item for key, item in table.items() if key[0] == pk]
+            matches = [
+                item for item in items
+                if hash_key in item and (range_key is None or range_key in item) and predicate(item)
+            ]
+        if projected:
+            matches = [{k: v for k, v in item.items() if k in projected} for item in matches]
+
+        key_names = tuple(dict.fromkeys((hash_key, range_key, "PK", "SK")))
+        key_names = tuple(name for name in key_names if name)
+        return self._read_page(
+            TableName,
+            matches,
+            lambda item: tuple(_scalar(item[name]) for name in key_names[1:]),
+            key_names,
+            not ScanIndexForward,
+            Limit,
+            ExclusiveStartKey,
+            FilterExpression,
+            names,
+            ExpressionAttributeValues,
+            ReturnConsumedCapacity,
+        )
+
+    def scan(
+        self,
+        TableName: str,
+        Segment: int = 0,
+        TotalSegments: int = 1,
+        FilterExpression: str = None,
+        ExpressionAttributeNames: dict = None,
+        ExpressionAttributeValues: dict = None,
+        Limit: int = None,
+        ExclusiveStartKey: dict = None,
+        ReturnConsumedCapacity: str = "NONE",
+        **kwargs,
+    ) -> dict:
+        """client.scan, with parallel segments assigned by partition key"""
+        self._call("Scan")
+        table = self.table(TableName)
+        with self._lock:
+            matches = [
+                item for item in table.values()
+                if zlib.crc32(item["PK"]["S"].encode("utf-8")) % TotalSegments == Segment
+            ]
+        return self._read_page(
+            TableName,
+            matches,
+            self._key,
+            ("PK", "SK"),
+            False,
+            Limit,
+            ExclusiveStartKey,
+            FilterExpression,
+            ExpressionAttributeNames,
+            ExpressionAttributeValues,
+            ReturnConsumedCapacity,
+        )
+
+    def batch_write_item(self, RequestItems: dict, ReturnConsumedCapacity: str = "NONE", **kwargs) -> dict:
+        """client.batch_write_item"""
+        self._call("BatchWriteItem")
+        total = sum(len(requests) for requests in RequestItems.values())
+        if total > MAX_BATCH_WRITE:
+            raise _client_error("ValidationException", "Too many items requested for the BatchWriteItem call", "BatchWriteItem")
+
+        unprocessed = {}
+        consumed = {}
+        for table_name, requests in RequestItems.items():
+            keys = [self._request_key(r) for r in requests]
+            if len(set(keys)) != len(keys):
+                raise _client_error("ValidationException", "Provided list of item keys contains duplicates", "BatchWriteItem")
+
+            table = self.table(table_name)
+            with self._lock:
+                for request, key in zip(requests, keys):
+                    units = item_write_units(request["PutRequest"]["Item"]) if "PutRequest" in request else 1
+                    if self._random.random() < self.unprocessed_rate or not self._take_wcu(units):
+                        unprocessed.setdefault(table_name, []).append(request)
+                        continue
+                    consumed[table_name] = consumed.get(table_name, 0) + units
+                    if "PutRequest" in request:
+                        table[key] = request["PutRequest"]["Item"]
+                    else:
+                        table.pop(key, None)
+
+        if self.write_capacity is not None and not consumed:
+            raise _client_error(
+                "ProvisionedThroughputExceededException",
+                "The level of configured provisioned throughput for the table was exceeded.",
+                "BatchWriteItem",
+            )
+        response = {"UnprocessedItems": unprocessed}
+        if ReturnConsumedCapacity != "NONE":
+            response["ConsumedCapacity"] = [self._consumed(name, units) for name, units in consumed.items()]
+        return response
+
+
+class AsyncFakeDynamoDB:
+    """Async client over a FakeDynamoDB, used as `async with` like an aiobotocore client.
+
+    Wrap a FakeDynamoDB made without latency: here `latency` is awaited
+    rather than slept, so one event loop overlaps calls the way it would
+    over the network.
+    """
+
+    def __init__(self, fake: FakeDynamoDB, latency: float = 0.0):
+        self.fake = fake
+        self.latency = latency
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def __getattr__(self, name):
+        method = getattr(self.fake, name)
+
+        async def call(**kwargs):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return method(**kwargs)
+
+        return call
@@ -0,0 +1,99 @@
+"""In-process stand-in for the redis-py client, for the cache warm-up.
+
+Implements GET, SET with EX, TTL and non-transactional pipelines, with an
+optional `latency` slept per round trip so pipelining can be measured
+without a Redis server. Keys expire lazily when read.
+"""
+
+import threading
+import time
+
+
+class FakeRedis:
+    """Thread-safe in-memory key-value store with expiry."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.round_trips = 0
+        self._data = {}
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def _round_trip(self):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.round_trips += 1
+
+    def _expired(self, name: str) -> bool:
+        expires = self._expires.get(name)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+            return True
+        return False
+
+    def _set(self, name: str, value, ex: int = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        with self._lock:
+            self._data[name] = value
+            if ex is not None:
+                self._expires[name] = time.monotonic() + ex
+            else:
+                self._expires.pop(name, None)
+        return True
+
+    def set(self, name: str, value, ex: int = None) -> bool:
+        """SET name value [EX ex]."""
+        self._round_trip()
+        return self._set(name, value, ex)
+
+    def get(self, name: str):
+        """GET name; bytes or None."""
+        self._round_trip()
+        with self._lock:
+            return None if self._expired(name) else self._data.get(name)
+
+    def ttl(self, name: str) -> int:
+        """Seconds left before `name` expires; -1 without expiry, -2 if missing."""
+        self._round_trip()
+        with self._lock:
+            if self._expired(name) or name not in self._data:
+                return -2
+            expires = self._expires.get(name)
+            return -1 if expires is None else round(expires - time.monotonic())
+
+    def keys(self) -> list:
+        """Every live key (no pattern support)."""
+        with self._lock:
+            return [name for name in list(self._data) if not self._expired(name)]
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        """Queue commands and send them in one round trip on execute()."""
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Buffered SET commands of a FakeRedis; reusable after execute() like redis-py's."""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self._commands = []
+
+    def set(self, name: str, value, ex: int = None) -> "FakePipeline":
+        """Queue SET name value [EX ex]."""
+        self._commands.append((name, value, ex))
+        return self
+
+    def execute(self) -> list:
+        """Send the queued commands; returns their results."""
+        commands, self._commands = self._commands, []
+        self.client._round_trip()
+        return [self.client._set(*command) for command in commands]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
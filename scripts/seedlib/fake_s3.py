@@ -0,0 +1,192 @@
+"""In-process stand-in for the S3 client, for the artifact uploader.
+
+Implements the object and multipart calls seedlib.s3_upload makes, with
+S3's ETags (MD5 of the body, or of the part MD5s plus `-<parts>` for a
+multipart upload) and an optional `latency` slept per call so concurrent
+uploads can be measured without LocalStack. Buckets must be created first,
+as on LocalStack.
+"""
+
+import hashlib
+import io
+import threading
+import time
+import uuid
+
+from botocore.exceptions import ClientError
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def _client_error(code: str, message: str, operation: str, status: int = 400) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": status}}, operation
+    )
+
+
+def _read(body) -> bytes:
+    """Bytes of a Body argument (bytes, str or file-like)."""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return bytes(body)
+    return body.read()
+
+
+class FakeS3:
+    """Thread-safe in-memory buckets with multipart uploads."""
+
+    def __init__(self, latency: float = 0.0, min_part_size: int = MIN_PART_SIZE):
+        self.latency = latency
+        self.min_part_size = min_part_size
+        self.calls = {}
+        self.bytes_received = 0
+        self._buckets = {}
+        self._uploads = {}
+        self._lock = threading.Lock()
+
+    def _call(self, operation: str):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def _bucket(self, name: str, operation: str) -> dict:
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            raise _client_error("NoSuchBucket", "The specified bucket does not exist", operation, 404)
+        return bucket
+
+    def create_bucket(self, Bucket: str, **kwargs) -> dict:
+        """client.create_bucket"""
+        self._call("CreateBucket")
+        with self._lock:
+            self._buckets.setdefault(Bucket, {})
+        return {}
+
+    def put_object(self, Bucket: str, Key: str, Body=b"", ContentType: str = None, Metadata: dict = None, **kwargs):
+        """client.put_object"""
+        self._call("PutObject")
+        data = _read(Body)
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        with self._lock:
+            self._bucket(Bucket, "PutObject")[Key] = {
+                "Body": data,
+                "ETag": etag,
+                "ContentType": ContentType or "binary/octet-stream",
+                "Metadata": dict(Metadata or {}),
+            }
+            self.bytes_received += len(data)
+        return {"ETag": etag}
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+        """client.head_object"""
+        self._call("HeadObject")
+        with self._lock:
+            obj = self._bucket(Bucket, "HeadObject").get(Key)
+        if obj is None:
+            raise _client_error("404", "Not Found", "HeadObject", 404)
+        return {
+            "ETag": obj["ETag"],
+            "ContentLength": len(obj["Body"]),
+            "ContentType": obj["ContentType"],
+            "Metadata": obj["Metadata"],
+        }
+
+    def get_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+        """client.get_object; Body is a file-like object"""
+        self._call("GetObject")
+        with self._lock:
+            obj = self._bucket(Bucket, "GetObject").get(Key)
+        if obj is None:
+            raise _client_error("NoSuchKey", "The specified key does not exist.", "GetObject", 404)
+        return {"Body": io.BytesIO(obj["Body"]), "ETag": obj["ETag"], "ContentLength": len(obj["Body"])}
+
+    def list_objects_v2(
+        self, Bucket: str, Prefix: str = "", MaxKeys: int = 1000, ContinuationToken: str = None, **kwargs
+    ) -> dict:
+        """client.list_objects_v2, in key order with continuation tokens"""
+        self._call("ListObjectsV2")
+        with self._lock:
+            keys = sorted(key for key in self._bucket(Bucket, "ListObjectsV2") if key.startswith(Prefix))
+            bucket = self._buckets[Bucket]
+            if ContinuationToken:
+                keys = [key for key in keys if key > ContinuationToken]
+            page = keys[:MaxKeys]
+            contents = [{"Key": key, "ETag": bucket[key]["ETag"], "Size": len(bucket[key]["Body"])} for key in page]
+        response = {"Contents": contents, "KeyCount": len(contents), "IsTruncated": len(keys) > MaxKeys}
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+    def create_multipart_upload(self, Bucket: str, Key: str, ContentType: str = None, Metadata: dict = None, **kwargs):
+        """client.create_multipart_upload"""
+        self._call("CreateMultipartUpload")
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._bucket(Bucket, "CreateMultipartUpload")
+            self._uploads[upload_id] = {
+                "Bucket": Bucket,
+                "Key": Key,
+                "ContentType": ContentType,
+                "Metadata": dict(Metadata or {}),
+                "parts": {},
+            }
+        return {"Bucket": Bucket, "Key": Key, "UploadId": upload_id}
+
+    def _upload(self, upload_id: str, operation: str) -> dict:
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise _client_error("NoSuchUpload", "The specified upload does not exist.", operation, 404)
+        return upload
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body=b"", **kwargs) -> dict:
+        """client.upload_part"""
+        self._call("UploadPart")
+        data = _read(Body)
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        with self._lock:
+            self._upload(UploadId, "UploadPart")["parts"][PartNumber] = (data, etag)
+            self.bytes_received += len(data)
+        return {"ETag": etag}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict, **kwargs):
+        """client.complete_multipart_upload; parts must be listed in order with their ETags"""
+        self._call("CompleteMultipartUpload")
+        with self._lock:
+            upload = self._upload(UploadId, "CompleteMultipartUpload")
+            listed = MultipartUpload["Parts"]
+            numbers = [part["PartNumber"] for part in listed]
+            if numbers != sorted(set(numbers)):
+                raise _client_error("InvalidPartOrder", "Parts must be listed in ascending order.", "CompleteMultipartUpload")
+            chunks = []
+            for n, part in enumerate(listed):
+                data, etag = upload["parts"].get(part["PartNumber"], (None, None))
+                if data is None or etag != part["ETag"]:
+                    raise _client_error("InvalidPart", "A listed part was not uploaded.", "CompleteMultipartUpload")
+                if n < len(listed) - 1 and len(data) < self.min_part_size:
+                    raise _client_error("EntityTooSmall", "A part is smaller than the minimum.", "CompleteMultipartUpload")
+                chunks.append(data)
+            digests = b"".join(bytes.fromhex(upload["parts"][number][1].strip('"')) for number in numbers)
+            etag = f'"{hashlib.md5(digests).hexdigest()}-{len(numbers)}"'
+            self._bucket(Bucket, "CompleteMultipartUpload")[Key] = {
+                "Body": b"".join(chunks),
+                "ETag": etag,
+                "ContentType": upload["ContentType"] or "binary/octet-stream",
+                "Metadata": upload["Metadata"],
+            }
+            del self._uploads[UploadId]
+        return {"Bucket": Bucket, "Key": Key, "ETag": etag}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> dict:
+        """client.abort_multipart_upload"""
+        self._call("AbortMultipartUpload")
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {}
+
+    @property
+    def open_uploads(self) -> int:
+        """Multipart uploads neither completed nor aborted."""
+        with self._lock:
+            return len(self._uploads)
@@ -0,0 +1,162 @@
+"""Global secondary indexes of the single-table design.
+
+The base table's PK/SK serve lookups within one partition (an org's
+reports, a region's articles). Listing across partitions goes through three
+overloaded, sparse GSIs whose key attributes the seeders write on each item:
+
+- `EntityUpdatedIndex` (GSI1PK = entityType, GSI1SK = last-modified time) for
+  Partners, Trends, Reports and Conversations. A Report's sort key is
+  `<status>#<updatedAt>`, so `begins_with(GSI1SK, "approved#")` lists one
+  status in time order.
+- `CountryTypeIndex` (GSI2PK = country, GSI2SK =
+  `<exploitationType>#<entityType>#<id>`) for Trends and Reports.
+- `RegionCrawlIndex` (GSI3PK = the article's PK, GSI3SK =
+  `<crawlDate>#<docId>`) for TahArticles. It keeps the base table's write
+  sharding, so a sharded region is read with `query_sharded(..., index=...)`,
+  and it projects only the listing attributes, not the article bodies.
+
+An item only carries the keys of the indexes it belongs to; everything else
+stays out of them.
+"""
+
+import time
+from dataclasses import dataclass
+
+# Entity types listed by last-modified time; articles and messages are read by partition
+UPDATED_ENTITIES = ("Partner", "Trend", "Report", "Conversation")
+
+# Attributes RegionCrawlIndex carries besides its keys
+ARTICLE_LISTING_ATTRIBUTES = ("docId", "title", "url", "region", "sourceType", "trfkType", "crawlDate", "publishDate")
+
+
+@dataclass(frozen=True)
+class SecondaryIndex:
+    """A GSI with string hash and range keys."""
+
+    name: str
+    hash_key: str
+    range_key: str
+    projection: tuple = None
+
+    def definition(self) -> dict:
+        """The GlobalSecondaryIndexes entry for CreateTable/UpdateTable."""
+        if self.projection:
+            projection = {"ProjectionType": "INCLUDE", "NonKeyAttributes": list(self.projection)}
+        else:
+            projection = {"ProjectionType": "ALL"}
+        return {
+            "IndexName": self.name,
+            "KeySchema": [
+                {"AttributeName": self.hash_key, "KeyType": "HASH"},
+                {"AttributeName": self.range_key, "KeyType": "RANGE"},
+            ],
+            "Projection": projection,
+        }
+
+
+ENTITY_UPDATED = SecondaryIndex("EntityUpdatedIndex", "GSI1PK", "GSI1SK")
+COUNTRY_TYPE = SecondaryIndex("CountryTypeIndex", "GSI2PK", "GSI2SK")
+REGION_CRAWL = SecondaryIndex("RegionCrawlIndex", "GSI3PK", "GSI3SK", ARTICLE_LISTING_ATTRIBUTES)
+
+INDEXES = (ENTITY_UPDATED, COUNTRY_TYPE, REGION_CRAWL)
+
+
+def _index_keys(get) -> dict:
+    """Index key attributes of an item whose string attributes `get(name)` returns."""
+    keys = {}
+    entity_type = get("entityType")
+
+    if entity_type in UPDATED_ENTITIES:
+        updated = get("updatedAt") or get("lastUpdated") or get("createdAt")
+        if updated:
+            if entity_type == "Report":
+                updated = f"{get('status')}#{updated}"
+            keys[ENTITY_UPDATED.hash_key] = entity_type
+            keys[ENTITY_UPDATED.range_key] = updated
+
+    country, exploitation_type = get("country"), get("exploitationType")
+    if country and exploitation_type:
+        keys[COUNTRY_TYPE.hash_key] = country
+        keys[COUNTRY_TYPE.range_key] = f"{exploitation_type}#{entity_type}#{get('id')}"
+
+    if entity_type == "TahArticle" and get("crawlDate"):
+        keys[REGION_CRAWL.hash_key] = get("PK")
+        keys[REGION_CRAWL.range_key] = f"{get('crawlDate')}#{get('docId')}"
+
+    return keys
+
+
+def index_attributes(item: dict) -> dict:
+    """Index key attributes for a plain item."""
+    return _index_keys(lambda name: item.get(name) if isinstance(item.get(name), str) else None)
+
+
+def add_index_keys(dynamo_item: dict) -> dict:
+    """A typed item with its index key attributes added."""
+    keys = _index_keys(lambda name: dynamo_item.get(name, {}).get("S"))
+    if not keys:
+        return dynamo_item
+    return {**dynamo_item, **{name: {"S": value} for name, value in keys.items()}}
+
+
+def attribute_definitions() -> list:
+    """AttributeDefinitions for the table keys and every index key."""
+    names = ["PK", "SK"] + [key for index in INDEXES for key in (index.hash_key, index.range_key)]
+    return [{"AttributeName": name, "AttributeType": "S"} for name in names]
+
+
+def create_table(client, table_name: str):
+    """Create the on-demand single table with all its indexes."""
+    client.create_table(
+        TableName=table_name,
+        AttributeDefinitions=attribute_definitions(),
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        GlobalSecondaryIndexes=[index.definition() for index in INDEXES],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def ensure_indexes(client, table_name: str, poll_seconds: float = 5.0, progress=print) -> list:
+    """Add the indexes a table is missing, one at a time, waiting for each backfill.
+
+    DynamoDB creates one GSI per UpdateTable call. Provisioned tables give
+    new indexes the table's own throughput. Returns the names created.
+    """
+    table = client.describe_table(TableName=table_name)["Table"]
+    existing = {index["IndexName"] for index in table.get("GlobalSecondaryIndexes", [])}
+    provisioned = table.get("BillingModeSummary", {}).get("BillingMode") != "PAY_PER_REQUEST" and table.get(
+        "ProvisionedThroughput", {}
+    ).get("WriteCapacityUnits")
+
+    created = []
+    for index in INDEXES:
+        if index.name in existing:
+            continue
+        definition = index.definition()
+        if provisioned:
+            throughput = table["ProvisionedThroughput"]
+            definition["ProvisionedThroughput"] = {
+                "ReadCapacityUnits": throughput["ReadCapacityUnits"],
+                "WriteCapacityUnits": throughput["WriteCapacityUnits"],
+            }
+        progress(f"  Creating index {index.name}...")
+        client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=attribute_definitions(),
+            GlobalSecondaryIndexUpdates=[{"Create": definition}],
+        )
+        while not _index_active(client, table_name, index.name):
+            time.sleep(poll_seconds)
+        created.append(index.name)
+    return created
+
+
+def _index_active(client, table_name: str, index_name: str) -> bool:
+    table = client.describe_table(TableName=table_name)["Table"]
+    for index in table.get("GlobalSecondaryIndexes", []):
+        if index["IndexName"] == index_name:
+            return index.get("IndexStatus") == "ACTIVE" and not index.get("Backfilling")
+    return False
@@ -0,0 +1,79 @@
+"""Incremental reader for large top-level JSON arrays."""
+
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can continue a number, e.g. the ".5" after "1" or "e10" after "2"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+def iter_json_array(path, chunk_size: int = CHUNK_SIZE):
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the current element and one read chunk are held in memory, and the
+    file is closed as soon as the caller stops iterating, so taking the first
+    N elements costs the same whatever the file size.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill(min_size: int) -> bool:
+            """Append at least one more chunk; False at end of file."""
+            nonlocal buf, pos, eof
+            if eof:
+                return False
+            data = f.read(max(chunk_size, min_size))
+            if not data:
+                eof = True
+                return False
+            buf = buf[pos:] + data
+            pos = 0
+            return True
+
+        def skip(chars: str):
+            """Advance past any of `chars`, reading more input as needed."""
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in chars:
+                    pos += 1
+                if pos < len(buf) or not fill(0):
+                    return
+
+        skip(_WHITESPACE)
+        if pos >= len(buf) or buf[pos] != "[":
+            raise ValueError(f"{path}: expected a top-level JSON array")
+        pos += 1
+
+        while True:
+            skip(_WHITESPACE + ",")
+            if pos >= len(buf):
+                raise ValueError(f"{path}: unterminated JSON array")
+            if buf[pos] == "]":
+                return
+
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element is split across chunks; grow the buffer and retry.
+                # Reading at least the current buffer length keeps huge
+                # elements linear rather than quadratic.
+                if not fill(len(buf) - pos):
+                    raise
+                continue
+
+            truncated = end == len(buf) or (isinstance(value, (int, float)) and buf[end] in _NUMBER_CHARS)
+            if truncated and fill(0):
+                # A number ending at the chunk edge, or stopped by a character
+                # that could continue it, may be cut off; decode it again
+                # with the next chunk.
+                continue
+
+            pos = end
+            yield value
@@ -0,0 +1,165 @@
+"""Parallel whole-file ingestion of large JSONL datasets.
+
+The file is memory-mapped and cut into byte ranges that start and end on
+line boundaries. Each range is parsed, transformed and written by its own
+worker process, which opens its own client and sink. There are several
+ranges per worker, so completions double as progress reports.
+
+Line numbers stay global (they seed fallback docIds such as `synth-<n>`),
+so a range knows the index of its first line; the parent counts newlines
+once over the mapping to work them out.
+
+A builder may return `(typed item, counts)` instead of a bare item; the
+counts (e.g. PII hits by type) are summed per range and over the whole
+file, since the parent cannot see what happened in the workers.
+"""
+
+import mmap
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from seedlib.batch_writer import WriteResult
+from seedlib.telemetry import Telemetry
+
+COUNT_CHUNK = 64 * 1024 * 1024
+
+
+@dataclass
+class LineRange:
+    """Bytes [start, end) of a JSONL file, whose first line is line `first_line`."""
+
+    start: int
+    end: int
+    first_line: int
+
+
+@dataclass
+class RangeResult:
+    """Outcome of ingesting one LineRange."""
+
+    lines: int = 0
+    items: int = 0
+    rejected: int = 0
+    write: WriteResult = field(default_factory=WriteResult)
+    entities: dict = field(default_factory=dict)
+    counts: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "RangeResult"):
+        """Fold another result into this one (telemetry is merged separately)."""
+        self.lines += other.lines
+        self.items += other.items
+        self.rejected += other.rejected
+        self.write.merge(other.write)
+        self.counts.update(other.counts)
+
+
+def line_ranges(path, parts: int) -> list:
+    """Split a file into up to `parts` line-aligned ranges of similar size."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = [0]
+        for i in range(1, parts):
+            cut = mm.find(b"\n", max(bounds[-1], size * i // parts))
+            if cut == -1:
+                break
+            if cut + 1 < size and cut + 1 > bounds[-1]:
+                bounds.append(cut + 1)
+        bounds.append(size)
+
+        ranges = []
+        line = 0
+        for start, end in zip(bounds, bounds[1:]):
+            ranges.append(LineRange(start, end, line))
+            for chunk_start in range(start, end, COUNT_CHUNK):
+                line += mm[chunk_start:min(end, chunk_start + COUNT_CHUNK)].count(b"\n")
+    return ranges
+
+
+def iter_range_lines(path, line_range: LineRange):
+    """Yield (line number, raw line bytes) for every line of a range."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = line_range.start
+        number = line_range.first_line
+        while pos < line_range.end:
+            newline = mm.find(b"\n", pos, line_range.end)
+            stop = line_range.end if newline == -1 else newline
+            yield number, mm[pos:stop]
+            number += 1
+            pos = stop + 1
+
+
+def ingest_range(path, line_range: LineRange, build_item, open_sink, entity: str) -> RangeResult:
+    """Parse, transform and write one range in the current process.
+
+    `build_item((index, line))` returns a typed item, a (typed item, counts)
+    pair or None for a rejected line; `open_sink(telemetry)` returns a fresh
+    sink. Blank lines are skipped without counting as rejected.
+    """
+    telemetry = Telemetry()
+    result = RangeResult()
+    with open_sink(telemetry) as sink:
+        for record in telemetry.timed(entity, "parse", iter_range_lines(path, line_range)):
+            if not record[1].strip():
+                continue
+            result.lines += 1
+            with telemetry.stage(entity, "transform"):
+                dynamo_item = build_item(record)
+            if dynamo_item is None:
+                result.rejected += 1
+                continue
+            if isinstance(dynamo_item, tuple):
+                dynamo_item, counts = dynamo_item
+                result.counts.update(counts)
+            with telemetry.stage(entity, "sink"):
+                sink.put_typed(dynamo_item)
+            result.items += 1
+    result.write = sink.close()
+    result.entities = telemetry.entities
+    return result
+
+
+def parallel_ingest(
+    path,
+    build_item,
+    open_sink,
+    workers: int,
+    entity: str,
+    ranges_per_worker: int = 4,
+    telemetry: Telemetry = None,
+    progress=print,
+) -> RangeResult:
+    """Ingest a whole JSONL file with `workers` processes; returns the totals.
+
+    `build_item` and `open_sink` are shipped to the workers, so they must be
+    picklable (top-level functions or functools.partial of them).
+    """
+    workers = max(1, workers)
+    ranges = line_ranges(path, workers * ranges_per_worker)
+    total_bytes = sum(r.end - r.start for r in ranges)
+    totals = RangeResult()
+    done_bytes = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(ingest_range, path, line_range, build_item, open_sink, entity): line_range
+            for line_range in ranges
+        }
+        for future in as_completed(futures):
+            line_range = futures[future]
+            result = future.result()
+            totals.merge(result)
+            if telemetry:
+                telemetry.merge(result.entities)
+            done_bytes += line_range.end - line_range.start
+            elapsed = time.perf_counter() - start
+            progress(
+                f"  {done_bytes / total_bytes:6.1%} of {total_bytes / 1e6:.1f} MB: {totals.lines} lines, "
+                f"{totals.items} items, {totals.rejected} rejected, {totals.items / elapsed:.0f} items/s"
+            )
+    return totals
@@ -0,0 +1,252 @@
+"""Inverted keyword index over TAH articles, built while they are seeded.
+
+The article builders tokenize title, summary and body in the transform
+workers (`keywords=True`), and `KeywordIndexBuilder` collects the term
+frequencies and writes them to one file:
+
+    MAGIC | u32 header length | header JSON | u32 arrays and UTF-8 blobs
+
+The arrays are the document lengths, the offsets of the document keys
+(`<PK>\\t<docId>`), the offsets of the byte-sorted terms, and per term the
+offset of its postings: parallel arrays of document numbers and term
+frequencies. `KeywordIndex` maps the file and reads it in place, finding a
+term by binary search and ranking the documents with BM25, so a lookup
+touches only the postings of the query terms.
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+MAGIC = b"TAHKWIDX1\n"
+_HEADER_LEN = struct.Struct("<I")
+
+# Title terms count this many times over, summary terms SUMMARY_WEIGHT times
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+_TOKEN = re.compile(r"\w+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his in into is it its of on or "
+    "said she that the their there they this to was were which who will with would".split()
+)
+
+_SECTIONS = (
+    "doc_lengths",
+    "doc_key_offsets",
+    "doc_keys",
+    "term_offsets",
+    "terms",
+    "posting_offsets",
+    "posting_docs",
+    "posting_tfs",
+)
+
+
+def tokenize(text: str) -> list:
+    """Lower-cased word tokens of `text`, without stopwords and single characters."""
+    if not text:
+        return []
+    return [token for token in _TOKEN.findall(text.casefold()) if len(token) > 1 and token not in STOPWORDS]
+
+
+def article_terms(title: str, summary: str, article: str) -> dict:
+    """Weighted term frequencies of one article."""
+    counts = {}
+    for text, weight in ((title, TITLE_WEIGHT), (summary, SUMMARY_WEIGHT), (article, 1)):
+        for token in tokenize(text):
+            counts[token] = counts.get(token, 0) + weight
+    return counts
+
+
+class KeywordIndexBuilder:
+    """Collects the terms of seeded articles and writes the index file.
+
+    Adding a document again replaces it, as rewriting the item does.
+    """
+
+    def __init__(self):
+        self._docs = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, pk: str, doc_id: str, terms: dict):
+        """Index the article stored under `pk` / `ARTICLE#<doc_id>`."""
+        self._docs[(pk, doc_id)] = terms
+
+    def write(self, path) -> dict:
+        """Write the index to `path` (atomically); returns the header."""
+        doc_lengths = array("I")
+        doc_key_offsets = array("I", [0])
+        doc_keys = bytearray()
+        postings = {}
+        for number, ((pk, doc_id), terms) in enumerate(self._docs.items()):
+            doc_keys += f"{pk}\t{doc_id}".encode("utf-8")
+            doc_key_offsets.append(len(doc_keys))
+            doc_lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                numbers, tfs = postings.get(term) or postings.setdefault(term, (array("I"), array("I")))
+                numbers.append(number)
+                tfs.append(tf)
+
+        term_offsets = array("I", [0])
+        terms_blob = bytearray()
+        posting_offsets = array("I", [0])
+        posting_docs = array("I")
+        posting_tfs = array("I")
+        for term in sorted(postings, key=lambda term: term.encode("utf-8")):
+            numbers, tfs = postings[term]
+            terms_blob += term.encode("utf-8")
+            term_offsets.append(len(terms_blob))
+            posting_docs.extend(numbers)
+            posting_tfs.extend(tfs)
+            posting_offsets.append(len(posting_docs))
+
+        blobs = [
+            doc_lengths.tobytes(),
+            doc_key_offsets.tobytes(),
+            bytes(doc_keys),
+            term_offsets.tobytes(),
+            bytes(terms_blob),
+            posting_offsets.tobytes(),
+            posting_docs.tobytes(),
+            posting_tfs.tobytes(),
+        ]
+        sections = {}
+        offset = 0
+        for name, blob in zip(_SECTIONS, blobs):
+            sections[name] = [offset, len(blob)]
+            offset += len(blob) + (-len(blob) % 4)
+
+        header = {
+            "docs": len(self._docs),
+            "terms": len(postings),
+            "postings": len(posting_docs),
+            "avg_doc_length": (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0,
+            "byteorder": sys.byteorder,
+            "sections": sections,
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        # Pad the header so every u32 section starts 4-byte aligned
+        encoded += b" " * (-(len(MAGIC) + _HEADER_LEN.size + len(encoded)) % 4)
+
+        path = str(path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LEN.pack(len(encoded)))
+            f.write(encoded)
+            for blob in blobs:
+                f.write(blob)
+                f.write(b"\0" * (-len(blob) % 4))
+        os.replace(tmp_path, path)
+        return header
+
+
+class KeywordIndex:
+    """Read-only, memory-mapped keyword index; use as a context manager or close()."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buf[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"not a keyword index: {path}")
+        (length,) = _HEADER_LEN.unpack_from(self._buf, len(MAGIC))
+        start = len(MAGIC) + _HEADER_LEN.size
+        self.header = json.loads(bytes(self._buf[start:start + length]))
+        if self.header["byteorder"] != sys.byteorder:
+            self.close()
+            raise ValueError(f"keyword index {path} was written on a {self.header['byteorder']}-endian machine")
+
+        data = memoryview(self._buf)[start + length:]
+        self._views = [data]
+        for name, (offset, size) in self.header["sections"].items():
+            view = data[offset:offset + size]
+            if name not in ("doc_keys", "terms"):
+                view = view.cast("I")
+            self._views.append(view)
+            setattr(self, f"_{name}", view)
+
+    def close(self):
+        """Release the views and unmap the file."""
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._buf.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _term_number(self, term: bytes):
+        """Position of `term` in the sorted term table, or None."""
+        low, high = 0, self.header["terms"]
+        while low < high:
+            middle = (low + high) // 2
+            candidate = bytes(self._terms[self._term_offsets[middle]:self._term_offsets[middle + 1]])
+            if candidate == term:
+                return middle
+            if candidate < term:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def doc_key(self, number: int) -> tuple:
+        """(PK, docId) of document `number`."""
+        key = bytes(self._doc_keys[self._doc_key_offsets[number]:self._doc_key_offsets[number + 1]])
+        pk, doc_id = key.decode("utf-8").split("\t", 1)
+        return pk, doc_id
+
+    def postings(self, term: str) -> tuple:
+        """(document numbers, term frequencies) of a term; empty if it is not indexed."""
+        number = self._term_number(term.encode("utf-8"))
+        if number is None:
+            return (), ()
+        start, end = self._posting_offsets[number], self._posting_offsets[number + 1]
+        return self._posting_docs[start:end], self._posting_tfs[start:end]
+
+    def search(self, query: str, limit: int = 10, require_all: bool = False) -> list:
+        """Top `limit` (score, PK, docId) for a free-text query, ranked by BM25.
+
+        With `require_all` only documents containing every query term count.
+        """
+        docs = self.header["docs"]
+        avg_length = self.header["avg_doc_length"] or 1.0
+        lengths = self._doc_lengths
+        scores = {}
+        matched = {}
+        terms = list(dict.fromkeys(tokenize(query)))
+        for term in terms:
+            numbers, tfs = self.postings(term)
+            if not len(numbers):
+                if require_all:
+                    return []
+                continue
+            df = len(numbers)
+            idf = math.log(1 + (docs - df + 0.5) / (df + 0.5))
+            for number, tf in zip(numbers, tfs):
+                norm = K1 * (1 - B + B * lengths[number] / avg_length)
+                scores[number] = scores.get(number, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+                matched[number] = matched.get(number, 0) + 1
+
+        if require_all:
+            scores = {number: score for number, score in scores.items() if matched[number] == len(terms)}
+        top = heapq.nlargest(limit, scores.items(), key=lambda entry: entry[1])
+        return [(score, *self.doc_key(number)) for number, score in top]
@@ -0,0 +1,157 @@
+"""Local content-hash manifest for incremental, resumable seeding.
+
+The manifest is a SQLite file recording, per target table and PK/SK, the hash
+of the item last written there. Sinks skip items whose hash is unchanged and
+record each batch only after DynamoDB has accepted it, so an interrupted run
+resumes from the last committed batch.
+
+For `seedlib.aggregates` it also keeps the stats counters each item was
+last counted under, and the counter deltas not yet applied to the table.
+"""
+
+import base64
+import hashlib
+import json
+import sqlite3
+
+from seedlib.marshal import item_key
+
+
+def _encode_binary(value):
+    """JSON stand-in for the bytes of a B attribute."""
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def content_hash(dynamo_item: dict) -> str:
+    """Stable SHA-256 of a whole typed item.
+
+    Every attribute counts, timestamps and index keys included, so the
+    seeders take their timestamps from the source data rather than the clock.
+    """
+    encoded = json.dumps(dynamo_item, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_encode_binary)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """PK/SK -> content hash of what has been written to one table."""
+
+    def __init__(self, path, target: str, full: bool = False):
+        """Open (or create) the manifest at `path` for `target`, e.g. "<endpoint>/<table>".
+
+        With `full=True` existing hashes are ignored, so every item is
+        rewritten, but the manifest is still updated.
+        """
+        self.target = target
+        self.full = full
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS items (
+                target TEXT NOT NULL,
+                pk TEXT NOT NULL,
+                sk TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (target, pk, sk)
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS counted (
+                target TEXT NOT NULL,
+                pk TEXT NOT NULL,
+                sk TEXT NOT NULL,
+                counters TEXT NOT NULL,
+                PRIMARY KEY (target, pk, sk)
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS pending_counters (
+                target TEXT NOT NULL,
+                stats_pk TEXT NOT NULL,
+                stats_sk TEXT NOT NULL,
+                name TEXT NOT NULL,
+                delta INTEGER NOT NULL,
+                PRIMARY KEY (target, stats_pk, stats_sk, name)
+            )"""
+        )
+        self.conn.commit()
+
+    def is_current(self, dynamo_item: dict) -> bool:
+        """True if this exact item content was already written."""
+        if self.full:
+            return False
+        pk, sk = item_key(dynamo_item)
+        row = self.conn.execute(
+            "SELECT hash FROM items WHERE target = ? AND pk = ? AND sk = ?",
+            (self.target, pk, sk),
+        ).fetchone()
+        return row is not None and row[0] == content_hash(dynamo_item)
+
+    def record_batch(self, batch: list, result):
+        """Commit the hashes of the items in `batch` that were written."""
+        failed = {item_key(item) for item in result.failed_items}
+        rows = [
+            (self.target, *item_key(item), content_hash(item))
+            for item in batch
+            if item_key(item) not in failed
+        ]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)", rows)
+
+    def record_counters(self, contributions: dict) -> dict:
+        """Store the counters each item now counts under; returns and queues the deltas.
+
+        `contributions` maps item keys to lists of (stats PK, stats SK,
+        counter) triples. An item counted before contributes the difference
+        from its previous counters, so rewriting it changes nothing and
+        changing it moves its count.
+        """
+        deltas = {}
+        with self.conn:
+            for (pk, sk), counters in contributions.items():
+                row = self.conn.execute(
+                    "SELECT counters FROM counted WHERE target = ? AND pk = ? AND sk = ?",
+                    (self.target, pk, sk),
+                ).fetchone()
+                previous = [tuple(counter) for counter in json.loads(row[0])] if row else []
+                for counter in previous:
+                    deltas[counter] = deltas.get(counter, 0) - 1
+                for counter in counters:
+                    deltas[counter] = deltas.get(counter, 0) + 1
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO counted VALUES (?, ?, ?, ?)",
+                [(self.target, pk, sk, json.dumps(counters)) for (pk, sk), counters in contributions.items()],
+            )
+            deltas = {counter: delta for counter, delta in deltas.items() if delta}
+            self._queue_counters(deltas)
+        return deltas
+
+    def _queue_counters(self, deltas: dict):
+        self.conn.executemany(
+            """INSERT INTO pending_counters VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT (target, stats_pk, stats_sk, name) DO UPDATE SET delta = delta + excluded.delta""",
+            [(self.target, *counter, delta) for counter, delta in deltas.items()],
+        )
+
+    def requeue_counters(self, deltas: dict):
+        """Put back deltas taken with take_pending_counters that could not be applied."""
+        with self.conn:
+            self._queue_counters(deltas)
+
+    def take_pending_counters(self) -> dict:
+        """Remove and return every queued (stats PK, stats SK, counter) -> delta."""
+        with self.conn:
+            # Taken under a write lock so a concurrent worker cannot queue in between
+            self.conn.execute("BEGIN IMMEDIATE")
+            rows = self.conn.execute(
+                "SELECT stats_pk, stats_sk, name, delta FROM pending_counters WHERE target = ? AND delta != 0",
+                (self.target,),
+            ).fetchall()
+            self.conn.execute("DELETE FROM pending_counters WHERE target = ?", (self.target,))
+        return {(pk, sk, name): delta for pk, sk, name, delta in rows}
+
+    def close(self):
+        """Close the underlying database."""
+        self.conn.close()
@@ -0,0 +1,31 @@
+"""Conversion of plain Python items to DynamoDB attribute maps."""
+
+import json
+
+
+def marshal_item(item: dict) -> dict:
+    """Convert a plain item to DynamoDB typed JSON, dropping None values."""
+    dynamo_item = {}
+    for key, value in item.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            dynamo_item[key] = {"S": value}
+        elif isinstance(value, (bytes, bytearray)):
+            dynamo_item[key] = {"B": bytes(value)}
+        elif isinstance(value, bool):
+            dynamo_item[key] = {"BOOL": value}
+        elif isinstance(value, int):
+            dynamo_item[key] = {"N": str(value)}
+        elif isinstance(value, float):
+            dynamo_item[key] = {"N": str(value)}
+        elif isinstance(value, list):
+            dynamo_item[key] = {"S": json.dumps(value)}
+        elif isinstance(value, dict):
+            dynamo_item[key] = {"S": json.dumps(value)}
+    return dynamo_item
+
+
+def item_key(dynamo_item: dict) -> tuple:
+    """Return the (PK, SK) primary key of a typed item."""
+    return dynamo_item["PK"]["S"], dynamo_item["SK"]["S"]
@@ -0,0 +1,94 @@
+"""Time-ordered conversation message keys and a paginated history reader.
+
+The seed files key messages as `ORG#<orgId>` / `MESSAGE#<conversationId>#<uuid>`,
+so the messages of a conversation come back in random order. `rekey_message`
+moves them to the layout of docs/data-model.md: one partition per
+conversation, sorted by creation time.
+
+    PK = ORG#<orgId>#CONV#<conversationId>
+    SK = MSG#<UTC createdAt, fixed width>#<messageId>
+
+The message id suffix keeps keys unique when two messages share a
+timestamp. `message_history` then reads the last N messages with a single
+descending Query and pages further back with an opaque cursor.
+"""
+
+import base64
+import json
+import re
+from datetime import datetime, timezone
+
+LEGACY_PREFIX = "MESSAGE#"
+SK_PREFIX = "MSG#"
+
+_TIMESTAMP = re.compile(
+    r"^(?P<seconds>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(?P<fraction>\d+))?(?P<offset>Z|[+-]\d{2}:?\d{2})?$"
+)
+
+
+def sortable_timestamp(created_at: str) -> str:
+    """ISO 8601 timestamp as fixed-width UTC with nanoseconds, e.g. 2026-01-15T09:35:36.526937596Z."""
+    match = _TIMESTAMP.match(created_at.strip())
+    if not match:
+        raise ValueError(f"not an ISO 8601 timestamp: {created_at!r}")
+    offset = match["offset"] or "Z"
+    moment = datetime.fromisoformat(match["seconds"] + ("+00:00" if offset == "Z" else offset))
+    utc = moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{utc}.{(match['fraction'] or '')[:9].ljust(9, '0')}Z"
+
+
+def conversation_pk(org_id: str, conversation_id: str) -> str:
+    """Partition key of a conversation's messages."""
+    return f"ORG#{org_id}#CONV#{conversation_id}"
+
+
+def message_sk(created_at: str, message_id: str) -> str:
+    """Time-sortable sort key of one message."""
+    return f"{SK_PREFIX}{sortable_timestamp(created_at)}#{message_id}"
+
+
+def rekey_message(dynamo_item: dict) -> dict:
+    """Typed Message item under the time-ordered key; items already rekeyed are returned unchanged."""
+    sk = dynamo_item["SK"]["S"]
+    if not sk.startswith(LEGACY_PREFIX):
+        return dynamo_item
+    org_id = dynamo_item.get("orgId", {}).get("S") or dynamo_item["PK"]["S"].removeprefix("ORG#")
+    conversation_id = dynamo_item["conversationId"]["S"]
+    message_id = dynamo_item.get("id", {}).get("S") or sk.rsplit("#", 1)[1]
+    return {
+        **dynamo_item,
+        "PK": {"S": conversation_pk(org_id, conversation_id)},
+        "SK": {"S": message_sk(dynamo_item["createdAt"]["S"], message_id)},
+        "orgId": {"S": org_id},
+    }
+
+
+def encode_cursor(last_key: dict) -> str:
+    """Opaque cursor for a LastEvaluatedKey."""
+    return base64.urlsafe_b64encode(json.dumps(last_key, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """ExclusiveStartKey of a cursor from encode_cursor."""
+    return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+
+
+def message_history(
+    client, table_name: str, org_id: str, conversation_id: str, limit: int = 20, cursor: str = None
+) -> tuple:
+    """One page of a conversation's messages, newest first: (typed items, next cursor or None)."""
+    params = {
+        "TableName": table_name,
+        "KeyConditionExpression": "PK = :pk AND begins_with(SK, :prefix)",
+        "ExpressionAttributeValues": {
+            ":pk": {"S": conversation_pk(org_id, conversation_id)},
+            ":prefix": {"S": SK_PREFIX},
+        },
+        "ScanIndexForward": False,
+        "Limit": limit,
+    }
+    if cursor:
+        params["ExclusiveStartKey"] = decode_cursor(cursor)
+    response = client.query(**params)
+    last_key = response.get("LastEvaluatedKey")
+    return response["Items"], encode_cursor(last_key) if last_key else None
@@ -0,0 +1,138 @@
+"""Capacity-aware write rate limiting for provisioned tables.
+
+`AdaptiveRateLimiter` is a token bucket of write capacity units. Writers
+reserve their estimated WCU before each call, then settle up with the
+ConsumedCapacity DynamoDB reports. The refill rate starts at the table's
+provisioned WCU times a target utilisation. It is halved on every throttle
+and climbs back additively (AIMD) while writes succeed, so a backfill takes
+the headroom it is given and leaves the rest to live traffic.
+"""
+
+import math
+import threading
+import time
+
+ITEM_WRITE_UNIT_BYTES = 1024
+
+
+def _attr_size(attr: dict) -> int:
+    """Approximate stored size of one attribute value in bytes."""
+    (tag, value), = attr.items()
+    if tag == "S":
+        return len(value.encode("utf-8"))
+    if tag == "B":
+        return len(value)
+    if tag == "N":
+        return len(value) // 2 + 1
+    if tag in ("BOOL", "NULL"):
+        return 1
+    if tag == "L":
+        return 3 + sum(1 + _attr_size(x) for x in value)
+    if tag == "M":
+        return 3 + sum(1 + len(k) + _attr_size(x) for k, x in value.items())
+    return 3 + sum(len(str(x)) for x in value)
+
+
+def item_size(dynamo_item: dict) -> int:
+    """Approximate stored size of a typed item in bytes, as DynamoDB bills it."""
+    return sum(len(name) + _attr_size(attr) for name, attr in dynamo_item.items())
+
+
+def item_write_units(dynamo_item: dict) -> int:
+    """WCU a standard write of this typed item consumes (1 per started KB)."""
+    return max(1, math.ceil(item_size(dynamo_item) / ITEM_WRITE_UNIT_BYTES))
+
+
+def consumed_units(response: dict, reserved: float) -> float:
+    """Total ConsumedCapacity of a response; the reservation if the endpoint reports none."""
+    if "ConsumedCapacity" not in response:
+        return reserved
+    consumed = response["ConsumedCapacity"]
+    if isinstance(consumed, dict):
+        return consumed.get("CapacityUnits", 0)
+    return sum(c.get("CapacityUnits", 0) for c in consumed)
+
+
+def provisioned_write_capacity(client, table_name: str):
+    """Provisioned WCU of a table, or None for on-demand tables."""
+    table = client.describe_table(TableName=table_name)["Table"]
+    if table.get("BillingModeSummary", {}).get("BillingMode") == "PAY_PER_REQUEST":
+        return None
+    units = table.get("ProvisionedThroughput", {}).get("WriteCapacityUnits") or 0
+    return units or None
+
+
+def table_rate_limiter(client, table_name: str, target_utilisation: float, capacity: float = None):
+    """Limiter for a table at `target_utilisation` of `capacity` or of its provisioned WCU.
+
+    Returns None (write unthrottled) for on-demand tables when no capacity
+    is given.
+    """
+    if capacity is None:
+        capacity = provisioned_write_capacity(client, table_name)
+    if not capacity:
+        return None
+    return AdaptiveRateLimiter(capacity, target_utilisation)
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD token bucket of write capacity units.
+
+    `capacity` is the table's WCU and `target_utilisation` the share of it
+    this loader may use, which is also the ceiling the rate recovers to.
+    Up to `burst_seconds` of unused rate can be banked; each successful call
+    adds back `recovery` times the ceiling after a throttle has halved it.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        target_utilisation: float = 0.5,
+        burst_seconds: float = 1.0,
+        min_rate: float = 1.0,
+        recovery: float = 0.02,
+    ):
+        if not 0 < target_utilisation <= 1:
+            raise ValueError(f"target utilisation must be in (0, 1], got {target_utilisation}")
+        self.ceiling = capacity * target_utilisation
+        self.rate = self.ceiling
+        self.burst_seconds = burst_seconds
+        self.min_rate = min(min_rate, self.ceiling)
+        self.recovery = recovery
+        self.consumed = 0.0
+        self.throttles = 0
+        self._tokens = self.rate * burst_seconds
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.rate * self.burst_seconds, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, units: float) -> float:
+        """Reserve `units` WCU; returns the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= units
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self, units: float):
+        """Reserve `units` WCU, sleeping until the bucket covers them."""
+        wait = self.reserve(units)
+        if wait:
+            time.sleep(wait)
+
+    def record(self, consumed: float, reserved: float):
+        """Settle a reservation against the capacity actually consumed, and recover rate."""
+        with self._lock:
+            self._tokens -= consumed - reserved
+            self.consumed += consumed
+            self.rate = min(self.ceiling, self.rate + self.ceiling * self.recovery)
+
+    def throttled(self):
+        """Halve the rate after a throttling response."""
+        with self._lock:
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
@@ -0,0 +1,222 @@
+"""Concurrent S3 uploads with multipart for large bodies and ETag skip checks.
+
+`S3Uploader` writes artifacts, which are files or in-memory bodies, to one
+bucket through a single client. The client is thread-safe, so its
+connection pool is shared by every upload. A body of at least
+`multipart_threshold` bytes is sent as a multipart upload. Its parts are
+read from disk and uploaded concurrently, so only about `max_workers`
+parts are held in memory at once. Smaller bodies take one PutObject.
+
+Before uploading, the uploader computes the ETag S3 would give the object
+with the same part size: the MD5 of the body, or the MD5 of the part MD5s
+followed by `-<parts>`. It compares that with the ETags read by
+`load_remote` from one ListObjectsV2 page per 1000 keys and skips
+unchanged objects. A rerun over the same files therefore only lists the
+bucket.
+"""
+
+import hashlib
+import math
+import mimetypes
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+MB = 1024 * 1024
+PART_SIZE = 8 * MB
+MULTIPART_THRESHOLD = 8 * MB
+MAX_PARTS = 10_000
+
+_CONTENT_TYPES = {
+    ".md": "text/markdown; charset=utf-8",
+    ".json": "application/json",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def content_type_for(name: str) -> str:
+    """Content-Type for a key or file name."""
+    suffix = Path(name).suffix.lower()
+    return _CONTENT_TYPES.get(suffix) or mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+@dataclass
+class Artifact:
+    """One object to upload: a file streamed from `path`, or `body` held in memory."""
+
+    key: str
+    path: Path = None
+    body: bytes = None
+    content_type: str = None
+
+    def __post_init__(self):
+        if (self.path is None) == (self.body is None):
+            raise ValueError(f"{self.key}: give exactly one of path and body")
+        if self.content_type is None:
+            self.content_type = content_type_for(self.key)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) if self.body is not None else self.path.stat().st_size
+
+    def read(self, offset: int = 0, length: int = None) -> bytes:
+        """`length` bytes from `offset` (everything by default)."""
+        if self.body is not None:
+            return self.body[offset:None if length is None else offset + length]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(-1 if length is None else length)
+
+
+@dataclass
+class UploadResult:
+    """Outcome of an upload run: every artifact ends up uploaded, skipped as unchanged or failed."""
+
+    uploaded: int = 0
+    multipart: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes: int = 0
+    errors: list = field(default_factory=list)
+
+
+def part_size_for(size: int, part_size: int = PART_SIZE) -> int:
+    """Part size for a multipart body, raised if needed to stay within S3's 10,000 parts."""
+    return max(part_size, math.ceil(size / MAX_PARTS))
+
+
+def expected_etag(artifact: Artifact, part_size: int = PART_SIZE, multipart_threshold: int = MULTIPART_THRESHOLD) -> str:
+    """The quoted ETag S3 gives `artifact` when uploaded with these settings."""
+    size = artifact.size
+    if size < multipart_threshold:
+        return f'"{hashlib.md5(artifact.read()).hexdigest()}"'
+    part_size = part_size_for(size, part_size)
+    digests = b"".join(
+        hashlib.md5(artifact.read(offset, part_size)).digest() for offset in range(0, size, part_size)
+    )
+    return f'"{hashlib.md5(digests).hexdigest()}-{math.ceil(size / part_size)}"'
+
+
+class S3Uploader:
+    """Upload artifacts to `bucket` on `max_workers` threads, skipping objects whose ETag matches."""
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        max_workers: int = 16,
+        part_size: int = PART_SIZE,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.max_workers = max_workers
+        self.part_size = part_size
+        self.multipart_threshold = max(multipart_threshold, 1)
+        self.remote = {}
+        self.result = UploadResult()
+        # Separate pools, so an upload waiting on its parts never holds a thread they need
+        self._files = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-upload")
+        self._parts = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-part")
+
+    def load_remote(self, prefix: str = "") -> int:
+        """Read the ETags of the objects under `prefix`; returns how many there are."""
+        params = {"Bucket": self.bucket, "Prefix": prefix}
+        count = 0
+        while True:
+            response = self.client.list_objects_v2(**params)
+            for obj in response.get("Contents", []):
+                self.remote[obj["Key"]] = obj["ETag"]
+                count += 1
+            if not response.get("IsTruncated"):
+                return count
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+    def upload(self, artifact: Artifact) -> str:
+        """Upload one artifact unless unchanged; returns "skipped", "put" or "multipart"."""
+        etag = expected_etag(artifact, self.part_size, self.multipart_threshold)
+        if self.remote.get(artifact.key) == etag:
+            return "skipped"
+        if artifact.size >= self.multipart_threshold:
+            self._upload_multipart(artifact)
+            return "multipart"
+        self.client.put_object(
+            Bucket=self.bucket, Key=artifact.key, Body=artifact.read(), ContentType=artifact.content_type
+        )
+        return "put"
+
+    def _upload_multipart(self, artifact: Artifact):
+        """Upload the parts concurrently, aborting the upload if any fails."""
+        size = artifact.size
+        part_size = part_size_for(size, self.part_size)
+        upload_id = self.client.create_multipart_upload(
+            Bucket=self.bucket, Key=artifact.key, ContentType=artifact.content_type
+        )["UploadId"]
+        futures = []
+        try:
+            for number, offset in enumerate(range(0, size, part_size), start=1):
+                futures.append(self._parts.submit(self._upload_part, artifact, upload_id, number, offset, part_size))
+            parts = [future.result() for future in futures]
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket, Key=artifact.key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=artifact.key, UploadId=upload_id)
+            raise
+
+    def _upload_part(self, artifact: Artifact, upload_id: str, number: int, offset: int, part_size: int) -> dict:
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=artifact.key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=artifact.read(offset, part_size),
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    def upload_all(self, artifacts):
+        """Upload every artifact, at most 2 * max_workers in flight; yields (artifact, status or None).
+
+        Failures are counted and kept in `result.errors` rather than raised,
+        and yield a None status.
+        """
+        pending = deque()
+
+        def collect(future, artifact):
+            try:
+                status = future.result()
+            except Exception as error:
+                self.result.failed += 1
+                self.result.errors.append(f"s3://{self.bucket}/{artifact.key}: {error}")
+                return artifact, None
+            if status == "skipped":
+                self.result.skipped += 1
+            else:
+                self.result.uploaded += 1
+                self.result.multipart += status == "multipart"
+                self.result.bytes += artifact.size
+            return artifact, status
+
+        for artifact in artifacts:
+            pending.append((self._files.submit(self.upload, artifact), artifact))
+            if len(pending) > self.max_workers * 2:
+                wait([pending[0][0]])
+            while pending and pending[0][0].done():
+                yield collect(*pending.popleft())
+        while pending:
+            yield collect(*pending.popleft())
+
+    def close(self):
+        """Stop the upload threads."""
+        self._files.shutdown()
+        self._parts.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,205 @@
+"""Binary cache of the DynamoDB-JSON seed files.
+
+`scripts/build-seed-cache.py` compiles each `seed-data/*.json` file into
+`seed-data/.cache/<name>.bin`, or `<cache_dir>/<name>.bin` when the seed
+files are read-only (as mounted into LocalStack):
+
+    MAGIC | u32 header length | header JSON | batch payloads
+
+The header records the source file's size, mtime and SHA-256 plus the
+offset/length of every 25-item batch. Each batch is a pickled list of typed
+items, read straight out of an mmap. A cache is used only while it matches
+its source; otherwise loaders fall back to parsing the JSON.
+
+The cache directory may be a writable volume, so the batches are not
+trusted: they are unpickled with `DataUnpickler`, which refuses every global
+and so can rebuild only dicts, lists, strings, bytes, numbers and booleans,
+never call anything. A batch that needs more is rejected like a stale cache.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+
+from seedlib.batch_writer import BATCH_SIZE
+
+MAGIC = b"SEEDCACHE1\n"
+CACHE_DIRNAME = ".cache"
+_HEADER_LEN = struct.Struct("<I")
+
+
+class DataUnpickler(pickle.Unpickler):
+    """Unpickler for plain data: any class or function lookup raises UnpicklingError."""
+
+    def find_class(self, module: str, name: str):
+        raise pickle.UnpicklingError(f"seed cache batch refers to {module}.{name}; only plain data is allowed")
+
+
+def _load_batch(payload: bytes) -> list:
+    """Unpickle one cached batch of typed items with DataUnpickler."""
+    return DataUnpickler(io.BytesIO(payload)).load()
+
+
+def _binary_hook(obj: dict) -> dict:
+    """json object_hook turning base64 {"B": ...} values, as exported, back into bytes."""
+    if len(obj) == 1 and "B" in obj and isinstance(obj["B"], str):
+        return {"B": base64.b64decode(obj["B"])}
+    return obj
+
+
+def load_json_items(source: Path) -> list:
+    """Parse a DynamoDB-JSON seed file (a JSON array of typed items)."""
+    with open(source, "r") as f:
+        return json.load(f, object_hook=_binary_hook)
+
+
+def cache_path_for(source: Path, cache_dir: Path = None) -> Path:
+    """Location of the cache file for a seed file, next to it unless `cache_dir` is given."""
+    directory = Path(cache_dir) if cache_dir else source.parent / CACHE_DIRNAME
+    return directory / f"{source.stem}.bin"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_cache(source: Path, cache_path: Path = None, cache_dir: Path = None) -> Path:
+    """Compile one DynamoDB-JSON seed file into its binary cache."""
+    source = Path(source)
+    cache_path = Path(cache_path) if cache_path else cache_path_for(source, cache_dir)
+    stat = source.stat()
+
+    items = load_json_items(source)
+
+    payloads = [
+        pickle.dumps(items[i:i + BATCH_SIZE], protocol=pickle.HIGHEST_PROTOCOL)
+        for i in range(0, len(items), BATCH_SIZE)
+    ]
+    batches = []
+    offset = 0
+    for i, payload in enumerate(payloads):
+        count = min(BATCH_SIZE, len(items) - i * BATCH_SIZE)
+        batches.append([offset, len(payload), count])
+        offset += len(payload)
+
+    header = json.dumps({
+        "source": source.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_sha256(source),
+        "items": len(items),
+        "batches": batches,
+    }).encode("utf-8")
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for payload in payloads:
+            f.write(payload)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def _read_header(buf) -> tuple:
+    """Parse the header of a mapped cache file; returns (header, payload start)."""
+    if buf[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a seed cache file")
+    start = len(MAGIC) + _HEADER_LEN.size
+    (length,) = _HEADER_LEN.unpack_from(buf, len(MAGIC))
+    header = json.loads(bytes(buf[start:start + length]))
+    return header, start + length
+
+
+def is_fresh(header: dict, source: Path) -> bool:
+    """True if the cache header still describes `source`.
+
+    Size and mtime are checked first; if the mtime moved (checkout, copy) the
+    content hash decides.
+    """
+    stat = source.stat()
+    if stat.st_size != header["size"]:
+        return False
+    if stat.st_mtime_ns == header["mtime_ns"]:
+        return True
+    return file_sha256(source) == header["sha256"]
+
+
+def _open_cache(source: Path, cache_dir: Path = None):
+    """Map the cache of `source`; returns (file, mmap, header, payload start) or None if missing or stale."""
+    cache_path = cache_path_for(source, cache_dir)
+    if not cache_path.exists():
+        return None
+
+    f = open(cache_path, "rb")
+    try:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        f.close()
+        return None
+    try:
+        header, data_start = _read_header(buf)
+        if is_fresh(header, source):
+            return f, buf, header, data_start
+    except (OSError, ValueError, KeyError):
+        pass
+    buf.close()
+    f.close()
+    return None
+
+
+def cache_is_fresh(source: Path, cache_dir: Path = None) -> bool:
+    """True if `source` has a cache that can be used as-is."""
+    opened = _open_cache(Path(source), cache_dir)
+    if opened is None:
+        return False
+    f, buf, _header, _start = opened
+    buf.close()
+    f.close()
+    return True
+
+
+def iter_cached_batches(source: Path, cache_dir: Path = None):
+    """Yield 25-item batches from the cache of `source`, or return None if it is missing or stale.
+
+    A batch that is not plain data raises pickle.UnpicklingError.
+    """
+    opened = _open_cache(Path(source), cache_dir)
+    if opened is None:
+        return None
+    f, buf, header, data_start = opened
+
+    def batches():
+        try:
+            for offset, length, _count in header["batches"]:
+                start = data_start + offset
+                yield _load_batch(buf[start:start + length])
+        finally:
+            buf.close()
+            f.close()
+
+    return batches()
+
+
+def load_items(source: Path, cache_dir: Path = None) -> list:
+    """Load typed items from the cache when fresh and plain data, otherwise from the JSON file."""
+    batches = iter_cached_batches(source, cache_dir)
+    if batches is None:
+        return load_json_items(source)
+    try:
+        return [item for batch in batches for item in batch]
+    except pickle.UnpicklingError:
+        return load_json_items(source)
@@ -0,0 +1,98 @@
+"""Write sharding for hot TAH region partitions.
+
+With sharding enabled an article of region R is written under
+`TAH#<R>#<n>`, where n = crc32(docId) % shards, instead of the single
+`TAH#<R>` partition. Readers use `query_sharded` to fan a Query out over every
+shard and merge the results back into sort-key order.
+"""
+
+import heapq
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+def shard_for(doc_id: str, shards: int) -> int:
+    """Stable shard number for a docId (same in every process and run)."""
+    return zlib.crc32(doc_id.encode("utf-8")) % shards
+
+
+def sharded_pk(base_pk: str, doc_id: str, shards: int) -> str:
+    """Partition key for a docId; unchanged when sharding is off (shards <= 1)."""
+    if shards <= 1:
+        return base_pk
+    return f"{base_pk}#{shard_for(doc_id, shards)}"
+
+
+def shard_pks(base_pk: str, shards: int) -> list:
+    """Every partition key a sharded base key is spread over."""
+    if shards <= 1:
+        return [base_pk]
+    return [f"{base_pk}#{n}" for n in range(shards)]
+
+
+def _query_partition(
+    client, table_name: str, pk: str, sk_prefix: str, limit: int, ascending: bool, index=None, sk_between=None
+) -> list:
+    """Read up to `limit` items of one partition in sort-key order, following pagination."""
+    hash_key, range_key = (index.hash_key, index.range_key) if index else ("PK", "SK")
+    values = {":pk": {"S": pk}}
+    if sk_between:
+        sk_condition = "#sk BETWEEN :low AND :high"
+        values[":low"], values[":high"] = {"S": sk_between[0]}, {"S": sk_between[1]}
+    else:
+        sk_condition = "begins_with(#sk, :sk)"
+        values[":sk"] = {"S": sk_prefix}
+    params = {
+        "TableName": table_name,
+        "KeyConditionExpression": f"#pk = :pk AND {sk_condition}",
+        "ExpressionAttributeNames": {"#pk": hash_key, "#sk": range_key},
+        "ExpressionAttributeValues": values,
+        "ScanIndexForward": ascending,
+    }
+    if index:
+        params["IndexName"] = index.name
+    items = []
+    while True:
+        if limit:
+            params["Limit"] = limit - len(items)
+        response = client.query(**params)
+        items.extend(response.get("Items", []))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key or (limit and len(items) >= limit):
+            return items
+        params["ExclusiveStartKey"] = last_key
+
+
+def query_sharded(
+    client,
+    table_name: str,
+    base_pk: str,
+    shards: int,
+    sk_prefix: str = "ARTICLE#",
+    limit: int = None,
+    ascending: bool = True,
+    max_workers: int = 8,
+    index=None,
+    sk_between: tuple = None,
+) -> list:
+    """Query all shards of `base_pk` in parallel and merge them by sort key.
+
+    Each shard is already sorted, so the merge is a k-way heap merge. With
+    `limit`, no shard is read past `limit` items, since no more than that
+    many can make the global first `limit`. `index` (a
+    seedlib.indexes.SecondaryIndex keyed on the sharded PK, such as
+    REGION_CRAWL) queries that index instead of the table, and `sk_between`
+    (low, high) replaces the sort-key prefix with an inclusive range.
+    """
+    pks = shard_pks(base_pk, shards)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pks))) as pool:
+        parts = list(pool.map(
+            lambda pk: _query_partition(client, table_name, pk, sk_prefix, limit, ascending, index, sk_between),
+            pks,
+        ))
+
+    range_key = index.range_key if index else "SK"
+    merged = heapq.merge(*parts, key=lambda item: item[range_key]["S"], reverse=not ascending)
+    if limit:
+        return [item for _, item in zip(range(limit), merged)]
+    return list(merged)
@@ -0,0 +1,172 @@
+"""Item sinks that seed producers write into.
+
+Producers call `sink.put(item)` with plain Python items and never talk to
+DynamoDB directly. `BulkSink` buffers items into 25-item batches and flushes
+them concurrently; `PutItemSink` is the one-request-per-item debug path.
+Both count what they write into `aggregates` (seedlib.aggregates.Aggregates)
+when given one and apply the stats counters when closed.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from seedlib.batch_writer import BATCH_SIZE, BatchWriter, WriteResult
+from seedlib.marshal import item_key, marshal_item
+from seedlib.rate_limiter import consumed_units, item_write_units
+
+
+class PutItemSink:
+    """Write each item synchronously with PutItem (debug mode)."""
+
+    def __init__(
+        self,
+        client,
+        table_name: str,
+        manifest=None,
+        marshal=marshal_item,
+        rate_limiter=None,
+        telemetry=None,
+        aggregates=None,
+    ):
+        self.client = client
+        self.table_name = table_name
+        self.manifest = manifest
+        self.marshal = marshal
+        self.rate_limiter = rate_limiter
+        self.telemetry = telemetry
+        self.aggregates = aggregates
+        self.result = WriteResult()
+
+    def put(self, item: dict):
+        """Write one plain item immediately."""
+        self.put_typed(self.marshal(item))
+
+    def put_typed(self, dynamo_item: dict):
+        """Write one already-marshalled item immediately."""
+        if self.manifest and self.manifest.is_current(dynamo_item):
+            self.result.skipped += 1
+            return
+        if self.rate_limiter or self.telemetry:
+            reserved = item_write_units(dynamo_item)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(reserved)
+            start = time.perf_counter()
+            response = self.client.put_item(
+                TableName=self.table_name, Item=dynamo_item, ReturnConsumedCapacity="TOTAL"
+            )
+            consumed = consumed_units(response, reserved)
+            if self.rate_limiter:
+                self.rate_limiter.record(consumed, reserved)
+            if self.telemetry:
+                self.telemetry.record_call([dynamo_item], time.perf_counter() - start, consumed)
+                self.telemetry.record_written([dynamo_item])
+        else:
+            self.client.put_item(TableName=self.table_name, Item=dynamo_item)
+        self.result.written += 1
+        if self.aggregates:
+            self.aggregates.record_batch([dynamo_item], WriteResult(written=1))
+        if self.manifest:
+            self.manifest.record_batch([dynamo_item], WriteResult(written=1))
+
+    def close(self) -> WriteResult:
+        """Apply the stats counters and return the write counts."""
+        if self.aggregates:
+            self.aggregates.flush(self.client, self.table_name)
+        return self.result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BulkSink:
+    """Buffer items into full batches and flush them on a worker pool.
+
+    At most `max_in_flight` batches (default twice the writer's workers) are
+    queued or being written; `put` waits for one to finish beyond that.
+    """
+
+    def __init__(
+        self, writer: BatchWriter, manifest=None, marshal=marshal_item, aggregates=None, max_in_flight: int = None
+    ):
+        self.writer = writer
+        self.manifest = manifest
+        self.marshal = marshal
+        self.aggregates = aggregates
+        self.result = WriteResult()
+        # Keyed by (PK, SK): a batch may not contain the same key twice, and
+        # the last put wins just as it would with PutItem.
+        self._buffer = {}
+        self.max_in_flight = max_in_flight or writer.max_workers * 2
+        self._in_flight = {}
+        self._closed = False
+        self._open()
+
+    def _open(self):
+        """Start the pool batches are written on."""
+        self._pool = ThreadPoolExecutor(max_workers=self.writer.max_workers)
+
+    def _submit(self, batch: list):
+        """Start writing one batch; returns its concurrent.futures.Future."""
+        return self._pool.submit(self.writer.write_batch, batch)
+
+    def _shutdown(self):
+        """Stop the pool once every batch is collected."""
+        self._pool.shutdown()
+
+    def put(self, item: dict):
+        """Queue one plain item, flushing when a batch is full."""
+        self.put_typed(self.marshal(item))
+
+    def put_typed(self, dynamo_item: dict):
+        """Queue one already-marshalled item, flushing when a batch is full."""
+        if self.manifest and self.manifest.is_current(dynamo_item):
+            self.result.skipped += 1
+            return
+        self._buffer[item_key(dynamo_item)] = dynamo_item
+        if len(self._buffer) >= BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        """Hand the current buffer to the pool, waiting if too many batches are in flight."""
+        if not self._buffer:
+            return
+        batch = list(self._buffer.values())
+        self._buffer = {}
+
+        if len(self._in_flight) >= self.max_in_flight:
+            done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._collect(future)
+        self._in_flight[self._submit(batch)] = batch
+
+    def _collect(self, future):
+        """Merge a finished batch into the totals and commit it to the manifest."""
+        batch = self._in_flight.pop(future)
+        result = future.result()
+        self.result.merge(result)
+        if self.aggregates:
+            self.aggregates.record_batch(batch, result)
+        if self.manifest:
+            self.manifest.record_batch(batch, result)
+
+    def close(self) -> WriteResult:
+        """Flush the remainder, wait for every batch, apply the stats counters and return the counts."""
+        if self._closed:
+            return self.result
+        self._flush()
+        for future in list(self._in_flight):
+            self._collect(future)
+        if self.aggregates:
+            self.aggregates.flush(self.writer.client, self.writer.table_name)
+        self._shutdown()
+        self._closed = True
+        return self.result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
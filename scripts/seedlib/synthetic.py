@@ -0,0 +1,296 @@
+"""Deterministic synthetic scale-out data built from the seed-data templates.
+
+The seed files hold a handful of reports, partners, trends and
+conversations. `generate_chunk` turns them into as many typed items as a
+scale test needs, spread over `orgs` organisations, plus TAH articles in
+the shape of synthetic_tah_dataset.jsonl:
+
+- Report: `ORG#<org>` / `REPORT#<id>` with its index keys
+- Partner: `PARTNERS` / `PARTNER#<id>`
+- Trend: `TRENDS` / `TREND#<countryCode>#<id>`
+- Conversation: `ORG#<org>` / `CONVERSATION#<id>`, followed by its
+  messages under the time-ordered keys of seedlib.messages
+- TahArticle: built by seedlib.articles.synthetic_article_item
+
+Organisations and article regions are drawn from a Zipf distribution, so
+`org_skew` / `region_skew` of 0 spread items evenly and larger values
+concentrate them on a few hot orgs and regions. Every item gets its own
+RNG seeded from (seed, kind, index), so the output does not depend on the
+chunk size or the number of worker processes, and the same config always
+produces the same items.
+"""
+
+import bisect
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+
+from seedlib.articles import synthetic_article_item
+from seedlib.codec import decode_item, get_marshaller
+from seedlib.indexes import index_attributes
+from seedlib.messages import conversation_pk, message_sk
+
+KINDS = ("partners", "trends", "reports", "conversations", "articles")
+REGIONS = ("Asia-Pacific", "Europe", "Africa", "Americas", "Middle East", "GLOBAL")
+TRAFFICKING_TYPES = ("labour", "sexual", "domestic_servitude", "forced_marriage", "child_labour", "criminal")
+CHUNK_ITEMS = 1000
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SPAN_SECONDS = 365 * 86400
+
+TEMPLATE_FILES = {
+    "reports": "reports.json",
+    "partners": "partners.json",
+    "trends": "trends.json",
+    "conversations": "conversations.json",
+    "messages": "messages.json",
+}
+
+
+@dataclass(frozen=True)
+class ScaleConfig:
+    """How much to generate and how skewed; picklable so workers get their own copy."""
+
+    templates_dir: str
+    seed: int = 42
+    orgs: int = 100
+    partners: int = 1000
+    trends: int = 1000
+    reports: int = 100_000
+    conversations: int = 10_000
+    messages_per_conversation: int = 10
+    articles: int = 100_000
+    org_skew: float = 1.1
+    region_skew: float = 1.1
+    tah_shards: int = 0
+    article_words: int = 300
+    encoding: str = "json"
+
+    def describe(self) -> dict:
+        """The config as a plain dict, for reports."""
+        return asdict(self)
+
+
+class SkewedChoice:
+    """Pick from `values` with Zipf weights 1 / rank ** skew (skew 0 is uniform)."""
+
+    def __init__(self, values, skew: float):
+        self.values = list(values)
+        self._cumulative = list(accumulate(1.0 / (rank ** skew) for rank in range(1, len(self.values) + 1)))
+
+    def share(self, top: int = 1) -> float:
+        """Expected fraction of picks landing on the `top` most popular values."""
+        top = min(top, len(self.values))
+        return self._cumulative[top - 1] / self._cumulative[-1] if top else 0.0
+
+    def pick(self, rng: random.Random):
+        """One value."""
+        index = bisect.bisect_right(self._cumulative, rng.random() * self._cumulative[-1])
+        return self.values[min(index, len(self.values) - 1)]
+
+
+def org_ids(count: int) -> list:
+    """Synthetic organisation ids, most popular first."""
+    return [f"org-{n:05d}" for n in range(count)]
+
+
+@lru_cache(maxsize=4)
+def load_templates(templates_dir: str) -> dict:
+    """Plain template items per kind plus the word list article text is drawn from."""
+    root = Path(templates_dir)
+    # Sorted attributes, so items come out byte-identical whatever the hash seed
+    templates = {
+        kind: [dict(sorted(decode_item(item).items())) for item in json.loads((root / filename).read_text())]
+        for kind, filename in TEMPLATE_FILES.items()
+    }
+    for kind, items in templates.items():
+        if not items:
+            raise ValueError(f"{root / TEMPLATE_FILES[kind]} has no template items")
+    text = " ".join(
+        str(item.get(field) or "")
+        for kind in ("reports", "trends", "messages")
+        for item in templates[kind]
+        for field in ("title", "summary", "content")
+    )
+    templates["words"] = sorted({word.strip(".,:;*()[]-#!?\"'").lower() for word in text.split()} - {""})
+    templates["roles"] = {
+        role: [item for item in templates["messages"] if item.get("role") == role] or templates["messages"]
+        for role in ("user", "assistant")
+    }
+    templates["countries"] = sorted({item["country"] for item in templates["reports"] + templates["trends"]})
+    return templates
+
+
+@lru_cache(maxsize=4)
+def _samplers(config: ScaleConfig) -> tuple:
+    """(org sampler, region sampler) of a config, built once per process."""
+    return SkewedChoice(org_ids(config.orgs), config.org_skew), SkewedChoice(REGIONS, config.region_skew)
+
+
+def _rng(config: ScaleConfig, kind: str, index: int) -> random.Random:
+    return random.Random(f"{config.seed}/{kind}/{index}")
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _timestamp(rng: random.Random) -> datetime:
+    return EPOCH + timedelta(seconds=rng.uniform(0, SPAN_SECONDS))
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _words(rng: random.Random, words: list, count: int) -> str:
+    return " ".join(rng.choices(words, k=count))
+
+
+def _typed(config: ScaleConfig, item: dict) -> dict:
+    item.update(index_attributes(item))
+    return get_marshaller(config.encoding)(item)
+
+
+def report_item(config: ScaleConfig, index: int) -> dict:
+    """Typed Report item number `index`."""
+    rng = _rng(config, "reports", index)
+    templates = load_templates(config.templates_dir)
+    template = rng.choice(templates["reports"])
+    org_id = _samplers(config)[0].pick(rng)
+    report_id = f"report-{index:09d}"
+    created = _timestamp(rng)
+    return _typed(config, {
+        **template,
+        "PK": f"ORG#{org_id}",
+        "SK": f"REPORT#{report_id}",
+        "id": report_id,
+        "orgId": org_id,
+        "title": f"{template['title']} ({index})",
+        "country": rng.choice(templates["countries"]),
+        "version": rng.randint(1, 5),
+        "wordCount": rng.randint(500, 5000),
+        "createdAt": _iso(created),
+        "updatedAt": _iso(created + timedelta(days=rng.randint(0, 30))),
+    })
+
+
+def partner_item(config: ScaleConfig, index: int) -> dict:
+    """Typed Partner item number `index`."""
+    rng = _rng(config, "partners", index)
+    template = rng.choice(load_templates(config.templates_dir)["partners"])
+    partner_id = f"partner-{index:07d}"
+    return _typed(config, {
+        **template,
+        "PK": "PARTNERS",
+        "SK": f"PARTNER#{partner_id}",
+        "id": partner_id,
+        "name": f"{template['name']} {index}",
+        "reportsShared": rng.randint(0, 200),
+        "createdAt": _iso(_timestamp(rng)),
+    })
+
+
+def trend_item(config: ScaleConfig, index: int) -> dict:
+    """Typed Trend item number `index`."""
+    rng = _rng(config, "trends", index)
+    template = rng.choice(load_templates(config.templates_dir)["trends"])
+    trend_id = f"trend-{index:07d}"
+    return _typed(config, {
+        **template,
+        "SK": f"TREND#{template['countryCode']}#{trend_id}",
+        "id": trend_id,
+        "title": f"{template['title']} ({index})",
+        "confidence": rng.choice(("low", "medium", "high")),
+        "lastUpdated": _iso(_timestamp(rng)),
+    })
+
+
+def conversation_items(config: ScaleConfig, index: int) -> list:
+    """Typed Conversation item number `index` followed by its messages."""
+    rng = _rng(config, "conversations", index)
+    templates = load_templates(config.templates_dir)
+    template = rng.choice(templates["conversations"])
+    org_id = _samplers(config)[0].pick(rng)
+    conversation_id = _uuid(rng)
+    created = _timestamp(rng)
+    items = [_typed(config, {
+        **template,
+        "PK": f"ORG#{org_id}",
+        "SK": f"CONVERSATION#{conversation_id}",
+        "id": conversation_id,
+        "orgId": org_id,
+        "createdAt": _iso(created),
+        "updatedAt": _iso(created),
+    })]
+    sent = created
+    for n in range(config.messages_per_conversation):
+        role = "user" if n % 2 == 0 else "assistant"
+        message = rng.choice(templates["roles"][role])
+        message_id = _uuid(rng)
+        sent += timedelta(seconds=rng.randint(1, 120))
+        created_at = _iso(sent)
+        items.append(_typed(config, {
+            **message,
+            "PK": conversation_pk(org_id, conversation_id),
+            "SK": message_sk(created_at, message_id),
+            "id": message_id,
+            "orgId": org_id,
+            "conversationId": conversation_id,
+            "role": role,
+            "createdAt": created_at,
+        }))
+    return items
+
+
+def article_item(config: ScaleConfig, index: int) -> dict:
+    """Typed TahArticle item number `index`, from a synthetic_tah_dataset.jsonl-shaped record."""
+    rng = _rng(config, "articles", index)
+    words = load_templates(config.templates_dir)["words"]
+    record = {
+        "doc_id": f"scale-{index:09d}",
+        "title": _words(rng, words, rng.randint(4, 10)).capitalize(),
+        "article": _words(rng, words, max(1, int(rng.uniform(0.5, 1.5) * config.article_words))),
+        "region": _samplers(config)[1].pick(rng),
+        "trfk_type": rng.sample(TRAFFICKING_TYPES, rng.randint(1, 2)),
+        "crawl_date": _timestamp(rng).strftime("%Y-%m-%d"),
+    }
+    return synthetic_article_item((index, json.dumps(record)), shards=config.tah_shards, encoding=config.encoding)
+
+
+_BUILDERS = {
+    "partners": partner_item,
+    "trends": trend_item,
+    "reports": report_item,
+    "articles": article_item,
+}
+
+
+def kind_count(config: ScaleConfig, kind: str) -> int:
+    """Units of a kind; a conversation unit is the conversation and its messages."""
+    return getattr(config, kind)
+
+
+def chunk_plan(config: ScaleConfig, kinds=KINDS, chunk_items: int = CHUNK_ITEMS) -> list:
+    """(kind, start, stop) work units covering every item of `kinds`, in order."""
+    plan = []
+    for kind in kinds:
+        count = kind_count(config, kind)
+        # Keep conversation chunks near chunk_items items, messages included
+        step = chunk_items // (1 + config.messages_per_conversation) if kind == "conversations" else chunk_items
+        step = max(1, step)
+        plan.extend((kind, start, min(start + step, count)) for start in range(0, count, step))
+    return plan
+
+
+def generate_chunk(config: ScaleConfig, task: tuple) -> list:
+    """Typed items of one (kind, start, stop) work unit; a top-level function for seedlib.transform."""
+    kind, start, stop = task
+    if kind == "conversations":
+        return [item for index in range(start, stop) for item in conversation_items(config, index)]
+    build = _BUILDERS[kind]
+    return [build(config, index) for index in range(start, stop)]
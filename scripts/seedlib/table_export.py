@@ -0,0 +1,158 @@
+"""Segmented parallel Scan of a table into per-entityType seed files.
+
+Every Scan segment runs on its own thread and streams each page straight
+into the output files, so memory holds one page per segment rather than the
+table. The files have the same layout as `scripts/seed-data/*.json`: a JSON
+array of typed items, indented by 2. Binary values are base64, as in the
+AWS CLI's DynamoDB JSON, and `seedlib.seed_cache` decodes them on load.
+Output goes to temporary files that replace the old ones only once the whole
+scan has succeeded.
+
+Items the seeders derive from others (the STATS# counters and the alias items
+of deduplicated articles) are left out: re-seeding writes them again, and
+importing them as well would count every item twice.
+"""
+
+import base64
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+ALL_ITEMS_FILE = "all-items.json"
+DERIVED_ENTITY_TYPES = frozenset({"Stats", "TahArticleAlias"})
+ENTITY_FILENAMES = {
+    "Conversation": "conversations.json",
+    "Message": "messages.json",
+    "Partner": "partners.json",
+    "Report": "reports.json",
+    "TahArticle": "tah-articles.json",
+    "Trend": "trends.json",
+}
+
+
+def entity_filename(entity_type: str) -> str:
+    """Seed file for an entityType: Partner -> partners.json, TahArticle -> tah-articles.json.
+
+    Types missing from ENTITY_FILENAMES get their kebab-cased name, unpluralised.
+    """
+    if not entity_type:
+        return "unknown.json"
+    if entity_type in ENTITY_FILENAMES:
+        return ENTITY_FILENAMES[entity_type]
+    return re.sub(r"(?<!^)(?=[A-Z])", "-", entity_type).lower() + ".json"
+
+
+def _json_default(value):
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonArrayWriter:
+    """Thread-safe incremental writer of one JSON array file."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.count = 0
+        self._tmp_path = f"{self.path}.tmp"
+        self._file = open(self._tmp_path, "w")
+        self._file.write("[")
+        self._lock = threading.Lock()
+
+    def write_many(self, items: list):
+        """Append items, encoded outside the lock."""
+        if not items:
+            return
+        chunks = [
+            "\n  " + json.dumps(item, indent=2, default=_json_default).replace("\n", "\n  ")
+            for item in items
+        ]
+        with self._lock:
+            separator = "," if self.count else ""
+            self._file.write(separator + ",".join(chunks))
+            self.count += len(items)
+
+    def commit(self):
+        """Finish the array and move it over the destination."""
+        self._file.write("\n]\n" if self.count else "]\n")
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Drop the partial output, leaving any existing file untouched."""
+        self._file.close()
+        os.unlink(self._tmp_path)
+
+
+def scan_segment(client, table_name: str, segment: int, total_segments: int, page_size: int = None):
+    """Yield the pages (lists of typed items) of one Scan segment."""
+    params = {"TableName": table_name, "Segment": segment, "TotalSegments": total_segments}
+    if page_size:
+        params["Limit"] = page_size
+    while True:
+        response = client.scan(**params)
+        yield response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        params["ExclusiveStartKey"] = last_key
+
+
+def export_table(
+    client,
+    table_name: str,
+    out_dir,
+    segments: int = 8,
+    page_size: int = None,
+    all_items: bool = True,
+    progress=print,
+) -> dict:
+    """Scan `table_name` with `segments` parallel segments into `out_dir`; returns item counts per file.
+
+    DERIVED_ENTITY_TYPES are skipped, and so not counted.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    writers = {}
+    writers_lock = threading.Lock()
+    all_writer = JsonArrayWriter(os.path.join(out_dir, ALL_ITEMS_FILE)) if all_items else None
+
+    def writer_for(filename: str) -> JsonArrayWriter:
+        with writers_lock:
+            if filename not in writers:
+                writers[filename] = JsonArrayWriter(os.path.join(out_dir, filename))
+            return writers[filename]
+
+    def run(segment: int) -> int:
+        scanned = skipped = 0
+        for page in scan_segment(client, table_name, segment, segments, page_size):
+            by_file = {}
+            kept = []
+            for item in page:
+                entity_type = item.get("entityType", {}).get("S")
+                if entity_type in DERIVED_ENTITY_TYPES:
+                    skipped += 1
+                    continue
+                by_file.setdefault(entity_filename(entity_type), []).append(item)
+                kept.append(item)
+            for filename, items in by_file.items():
+                writer_for(filename).write_many(items)
+            if all_writer:
+                all_writer.write_many(kept)
+            scanned += len(page)
+        progress(f"  Segment {segment + 1}/{segments}: {scanned} items, {skipped} derived skipped")
+        return scanned
+
+    try:
+        with ThreadPoolExecutor(max_workers=segments) as pool:
+            list(pool.map(run, range(segments)))
+    except BaseException:
+        for writer in list(writers.values()) + ([all_writer] if all_writer else []):
+            writer.abort()
+        raise
+
+    everything = list(writers.values()) + ([all_writer] if all_writer else [])
+    for writer in everything:
+        writer.commit()
+    return {os.path.basename(writer.path): writer.count for writer in everything}
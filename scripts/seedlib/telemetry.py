@@ -0,0 +1,259 @@
+"""Per-entity ingestion telemetry for the seed pipeline.
+
+`Telemetry` collects, per entityType: items and bytes written, consumed
+WCU, retries and failures, a histogram of write-call latency, and the time
+spent in the parse, transform and sink stages. Writers report each call
+with `record_call` and its outcome with `record_written`, `record_retried`
+and `record_failed`; seeders wrap their stages with `stage()` or `timed()`.
+Stage times are exclusive, so when a transform pulls records from a timed
+parse iterator the parse time is not counted twice. Work done in transform
+worker processes (e.g. json.loads of synthetic articles) shows up as
+transform time. The sink stage is the time the seeder spent handing items
+to the sink, which only buffers them, plus any wait on in-flight batches;
+the time DynamoDB took is the write-call latency histogram, recorded by the
+writer around each call.
+
+`write_prometheus` emits the Prometheus text format (for node_exporter's
+textfile collector or a push gateway) and `write_json` a summary. Both
+write a temporary file and move it into place, so a scraper never reads a
+half-written file.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+from seedlib.rate_limiter import item_size, item_write_units
+
+STAGES = ("parse", "transform", "sink")
+
+# Upper bounds, in seconds, of the write-call latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class EntityStats:
+    """Counters for one entity type."""
+
+    items: int = 0
+    bytes: int = 0
+    consumed_wcu: float = 0.0
+    retries: int = 0
+    failed: int = 0
+    calls: int = 0
+    latency_sum: float = 0.0
+    latency_buckets: list = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    stage_seconds: dict = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+
+    def observe_latency(self, seconds: float):
+        """Add one call to the latency histogram."""
+        self.calls += 1
+        self.latency_sum += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+                break
+
+    def latency_quantile(self, q: float):
+        """Upper bucket bound below which a fraction q of the calls fell, or None past the last bucket.
+
+        None rather than infinity, so the JSON summary stays valid JSON (null).
+        """
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets):
+            seen += count
+            if seen >= rank and count:
+                return bound
+        return None if self.calls else 0.0
+
+
+def _entity_of(dynamo_item: dict) -> str:
+    """entityType of a typed item."""
+    return dynamo_item.get("entityType", {}).get("S", "Unknown")
+
+
+def _replace_file(path, text: str):
+    """Write `text` next to `path`, then move it over `path` in one step."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class Telemetry:
+    """Thread-safe per-entity metrics for one seeding run."""
+
+    def __init__(self):
+        self.entities = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stats(self, entity: str) -> EntityStats:
+        stats = self.entities.get(entity)
+        if stats is None:
+            stats = self.entities[entity] = EntityStats()
+        return stats
+
+    def merge(self, entities: dict):
+        """Fold in the `entities` of another Telemetry, e.g. one from a worker process."""
+        with self._lock:
+            for entity, other in entities.items():
+                stats = self._stats(entity)
+                stats.items += other.items
+                stats.bytes += other.bytes
+                stats.consumed_wcu += other.consumed_wcu
+                stats.retries += other.retries
+                stats.failed += other.failed
+                stats.calls += other.calls
+                stats.latency_sum += other.latency_sum
+                stats.latency_buckets = [a + b for a, b in zip(stats.latency_buckets, other.latency_buckets)]
+                for stage, seconds in other.stage_seconds.items():
+                    stats.stage_seconds[stage] += seconds
+
+    def record_call(self, items: list, seconds: float, consumed: float = None):
+        """Account for one write call carrying typed `items`.
+
+        The call's latency counts once for every entity type in it; consumed
+        WCU is split between entities by their items' estimated write units.
+        """
+        units = {}
+        for item in items:
+            entity = _entity_of(item)
+            units[entity] = units.get(entity, 0) + item_write_units(item)
+        total_units = sum(units.values()) or 1
+
+        with self._lock:
+            for entity, entity_units in units.items():
+                stats = self._stats(entity)
+                stats.observe_latency(seconds)
+                if consumed:
+                    stats.consumed_wcu += consumed * entity_units / total_units
+
+    def record_written(self, items: list):
+        """Count items DynamoDB accepted."""
+        with self._lock:
+            for item in items:
+                stats = self._stats(_entity_of(item))
+                stats.items += 1
+                stats.bytes += item_size(item)
+
+    def record_retried(self, items: list):
+        """Count items that are being resubmitted."""
+        with self._lock:
+            for item in items:
+                self._stats(_entity_of(item)).retries += 1
+
+    def record_failed(self, items: list):
+        """Count items that were given up on."""
+        with self._lock:
+            for item in items:
+                self._stats(_entity_of(item)).failed += 1
+
+    @contextmanager
+    def stage(self, entity: str, name: str):
+        """Time a block as stage `name` of `entity`, excluding nested stages."""
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self._stats(entity).stage_seconds[name] += elapsed - nested
+
+    def timed(self, entity: str, name: str, iterable):
+        """Yield from `iterable`, timing each next() as stage `name` of `entity`."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(entity, name):
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    return
+            yield value
+
+    def summary(self) -> dict:
+        """JSON-ready summary of the run."""
+        with self._lock:
+            entities = {}
+            for entity, stats in sorted(self.entities.items()):
+                data = asdict(stats)
+                data["latency_buckets"] = dict(zip(map(str, LATENCY_BUCKETS), stats.latency_buckets))
+                data["latency_p50"] = stats.latency_quantile(0.5)
+                data["latency_p99"] = stats.latency_quantile(0.99)
+                data["bottleneck_stage"] = max(stats.stage_seconds, key=stats.stage_seconds.get)
+                entities[entity] = data
+        return {"started": self.started, "seconds": time.time() - self.started, "entities": entities}
+
+    def table(self) -> list:
+        """One human-readable line per entity type, for the end of a run."""
+        lines = []
+        for entity, data in self.summary()["entities"].items():
+            p99 = data["latency_p99"]
+            p99 = f"<= {p99 * 1000:.1f}" if p99 is not None else f"> {LATENCY_BUCKETS[-1] * 1000:.0f}"
+            lines.append(
+                f"  {entity:<14} {data['items']:>7} items {data['bytes'] / 1024:>9.1f} KiB "
+                f"{data['consumed_wcu']:>8.1f} WCU {data['retries']:>5} retries "
+                f"p99 {p99} ms, bottleneck: {data['bottleneck_stage']}"
+            )
+        return lines
+
+    def prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        counters = [
+            ("seed_items_written_total", "Items accepted by DynamoDB", "items"),
+            ("seed_bytes_written_total", "Approximate bytes of the items written", "bytes"),
+            ("seed_consumed_wcu_total", "Write capacity units consumed", "consumed_wcu"),
+            ("seed_retries_total", "Items resubmitted after throttling or UnprocessedItems", "retries"),
+            ("seed_items_failed_total", "Items given up on", "failed"),
+        ]
+        lines = []
+        with self._lock:
+            entities = sorted(self.entities.items())
+            for name, help_text, attr in counters:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                lines += [f'{name}{{entity="{e}"}} {getattr(s, attr)}' for e, s in entities]
+
+            name = "seed_stage_seconds_total"
+            lines += [f"# HELP {name} Time spent per pipeline stage", f"# TYPE {name} counter"]
+            for entity, stats in entities:
+                for stage, seconds in stats.stage_seconds.items():
+                    lines.append(f'{name}{{entity="{entity}",stage="{stage}"}} {seconds:.6f}')
+
+            name = "seed_write_call_latency_seconds"
+            lines += [f"# HELP {name} Latency of write calls", f"# TYPE {name} histogram"]
+            for entity, stats in entities:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.latency_buckets):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{entity="{entity}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{entity="{entity}",le="+Inf"}} {stats.calls}')
+                lines.append(f'{name}_sum{{entity="{entity}"}} {stats.latency_sum:.6f}')
+                lines.append(f'{name}_count{{entity="{entity}"}} {stats.calls}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write the Prometheus text file."""
+        _replace_file(path, self.prometheus())
+
+    def write_json(self, path):
+        """Write the JSON summary."""
+        _replace_file(path, json.dumps(self.summary(), indent=2) + "\n")
+
+    def export(self, directory) -> list:
+        """Write seed-metrics.prom and seed-metrics.json into `directory`; returns their paths."""
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, "seed-metrics.prom")
+        json_path = os.path.join(directory, "seed-metrics.json")
+        self.write_prometheus(prom_path)
+        self.write_json(json_path)
+        return [prom_path, json_path]
@@ -0,0 +1,49 @@
+"""Ordered, chunked process-pool transform stage."""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+CHUNK_SIZE = 64
+
+
+def default_workers() -> int:
+    """Transform processes to use when none are configured."""
+    return int(os.getenv("SEED_TRANSFORM_WORKERS", os.cpu_count() or 1))
+
+
+def _apply_chunk(func, chunk: list) -> list:
+    """Run `func` over one work unit inside a worker process."""
+    return [func(record) for record in chunk]
+
+
+def transform_ordered(func, records, workers: int = 0, chunk_size: int = CHUNK_SIZE):
+    """Yield func(record) for every record, in input order.
+
+    With workers > 1 the records are cut into chunks of `chunk_size` and
+    mapped on a process pool. At most 2 * workers chunks are pending, so the
+    input iterable is consumed lazily and a consumer that stops early (e.g.
+    on reaching a limit) does not pay for the rest of the file. `func` must
+    be a picklable top-level function or functools.partial.
+    """
+    if workers <= 1:
+        for record in records:
+            yield func(record)
+        return
+
+    records = iter(records)
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_apply_chunk, func, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
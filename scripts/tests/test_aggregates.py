@@ -0,0 +1,75 @@
+"""STATS#... counters (seedlib.aggregates)."""
+
+from seedlib.aggregates import Aggregates, article_stats_key, get_stats, item_counters, partner_stats_key, report_stats_key
+from seedlib.batch_writer import WriteResult
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.manifest import Manifest
+from seedlib.marshal import marshal_item
+
+TABLE = "stats-test"
+
+
+def report(report_id: str, status: str) -> dict:
+    return marshal_item({
+        "PK": "ORG#stt",
+        "SK": f"REPORT#{report_id}",
+        "entityType": "Report",
+        "id": report_id,
+        "orgId": "stt",
+        "status": status,
+    })
+
+
+def write(aggregates: Aggregates, client, items: list):
+    aggregates.record_batch(items, WriteResult(written=len(items)))
+    aggregates.flush(client, TABLE)
+
+
+def test_item_counters():
+    article = marshal_item({
+        "PK": "REGION#APAC",
+        "SK": "ARTICLE#a-1",
+        "entityType": "TahArticle",
+        "region": "APAC",
+        "trfkType": ["labour", "sexual", "labour"],
+    })
+    partner = marshal_item({"PK": "PARTNERS", "SK": "PARTNER#p-1", "entityType": "Partner", "type": "ngo"})
+
+    assert item_counters(report("r-1", "draft")) == [
+        (*report_stats_key("stt"), "total"),
+        (*report_stats_key("stt"), "status#draft"),
+    ]
+    assert item_counters(article) == [
+        (*article_stats_key("APAC"), "total"),
+        (*article_stats_key("APAC"), "trfkType#labour"),
+        (*article_stats_key("APAC"), "trfkType#sexual"),
+    ]
+    assert item_counters(partner) == [(*partner_stats_key(), "total"), (*partner_stats_key(), "type#ngo")]
+    assert item_counters(marshal_item({"PK": "X", "SK": "Y", "entityType": "Message"})) == []
+
+
+def test_manifest_counts_reruns_once_and_moves_changed_items(tmp_path):
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    manifest = Manifest(tmp_path / "manifest.db", f"fake/{TABLE}")
+    aggregates = Aggregates(manifest)
+
+    write(aggregates, client, [report("r-1", "draft"), report("r-2", "draft")])
+    write(aggregates, client, [report("r-1", "draft"), report("r-2", "draft")])
+    write(aggregates, client, [report("r-1", "approved")])
+    manifest.close()
+
+    assert get_stats(client, TABLE, report_stats_key("stt")) == {"total": 2, "status#draft": 1, "status#approved": 1}
+
+
+def test_failed_items_are_not_counted():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    aggregates = Aggregates()
+    items = [report("r-1", "draft"), report("r-2", "draft")]
+
+    aggregates.record_batch(items, WriteResult(written=1, failed=1, failed_items=[items[1]]))
+    aggregates.flush(client, TABLE)
+
+    assert get_stats(client, TABLE, report_stats_key("stt")) == {"total": 1, "status#draft": 1}
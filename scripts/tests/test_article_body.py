@@ -0,0 +1,63 @@
+"""Article body storage modes and S3 offload (seedlib.article_body)."""
+
+import random
+import string
+
+import pytest
+
+from seedlib.article_body import ARTICLE_MAX_CHARS, OffloadSink, body_attributes, read_article
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.fake_s3 import FakeS3
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+from seedlib.sink import BulkSink
+
+TABLE = "body-test"
+BUCKET = "bodies"
+
+
+def text(length: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + " ") for _ in range(length))
+
+
+def article_item(doc_id: str, body: str, mode: str) -> dict:
+    return marshal_item({
+        "PK": "TAH#APAC",
+        "SK": f"ARTICLE#{doc_id}",
+        "entityType": "TahArticle",
+        "docId": doc_id,
+        **body_attributes(body, "A summary", mode),
+    })
+
+
+def test_truncate_cuts_the_body_and_compress_keeps_it_whole():
+    body = text(ARTICLE_MAX_CHARS * 2)
+
+    assert read_article(article_item("d-1", body, "truncate")) == body[:ARTICLE_MAX_CHARS]
+    compressed = article_item("d-1", body, "compress")
+    assert "article" not in compressed and compressed["contentEncoding"] == {"S": "zlib"}
+    assert read_article(compressed) == body
+    with pytest.raises(ValueError):
+        body_attributes(body, None, "gzip")
+
+
+def test_offload_moves_only_large_bodies_to_s3():
+    client, s3 = FakeDynamoDB(), FakeS3()
+    create_table(client, TABLE)
+    s3.create_bucket(Bucket=BUCKET)
+    small, large = text(200), text(60000, seed=1)
+
+    with OffloadSink(BulkSink(BatchWriter(client, TABLE)), s3, BUCKET, threshold=1024) as sink:
+        for i, body in enumerate([small, large, small]):
+            sink.put_typed(article_item(f"d-{i}", body, "offload"))
+    result = sink.close()
+
+    stored = client.table(TABLE)
+    offloaded = stored[("TAH#APAC", "ARTICLE#d-1")]
+    assert (result.written, sink.offloaded) == (3, 1)
+    assert offloaded["contentRef"] == {"S": f"s3://{BUCKET}/tah-articles/d-1.zlib"}
+    assert "articleZ" not in offloaded
+    assert read_article(offloaded, s3) == large
+    assert read_article(stored[("TAH#APAC", "ARTICLE#d-0")]) == small
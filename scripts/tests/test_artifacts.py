@@ -0,0 +1,49 @@
+"""Recording uploaded artifacts on their items (seedlib.artifacts)."""
+
+from seedlib.artifacts import report_update
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+
+TABLE = "artifacts-test"
+KEY = {"PK": {"S": "ORG#stt"}, "SK": {"S": "REPORT#report-001"}}
+PREFIX = "stt/reports/report-001/v3/"
+
+
+def stored_report(client, s3_keys: dict = None) -> dict:
+    item = {**KEY, "entityType": {"S": "Report"}, "id": {"S": "report-001"}}
+    if s3_keys:
+        item["s3Keys"] = {"M": {fmt: {"S": key} for fmt, key in s3_keys.items()}}
+    client.put_item(TableName=TABLE, Item=item)
+    return item
+
+
+def s3_keys(client) -> dict:
+    item = client.get_item(TableName=TABLE, Key=KEY)["Item"]
+    return {fmt: value["S"] for fmt, value in item["s3Keys"]["M"].items()}
+
+
+def test_failed_formats_keep_their_recorded_keys():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    item = stored_report(client, {"markdown": f"{PREFIX}report.md", "pdf": f"{PREFIX}report.pdf"})
+
+    # This run only uploaded the docx; the markdown and pdf uploads failed
+    client.update_item(TableName=TABLE, **report_update(item, {"docx": f"{PREFIX}report.docx"}))
+
+    assert s3_keys(client) == {
+        "markdown": f"{PREFIX}report.md",
+        "pdf": f"{PREFIX}report.pdf",
+        "docx": f"{PREFIX}report.docx",
+    }
+
+
+def test_first_upload_creates_the_map_and_reruns_write_nothing():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    item = stored_report(client)
+    keys = {"markdown": f"{PREFIX}report.md"}
+
+    client.update_item(TableName=TABLE, **report_update(item, keys))
+
+    assert s3_keys(client) == keys
+    assert report_update(client.get_item(TableName=TABLE, Key=KEY)["Item"], keys) is None
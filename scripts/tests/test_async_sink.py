@@ -0,0 +1,70 @@
+"""asyncio bulk sink (seedlib.async_sink)."""
+
+import asyncio
+
+from seedlib.aggregates import Aggregates, get_stats, partner_stats_key
+from seedlib.async_sink import AsyncBulkSink
+from seedlib.fake_dynamodb import AsyncFakeDynamoDB, FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.manifest import Manifest
+
+TABLE = "async-test"
+
+
+class PeakClient(AsyncFakeDynamoDB):
+    """AsyncFakeDynamoDB recording the most BatchWriteItem calls in flight at once."""
+
+    def __init__(self, fake: FakeDynamoDB, latency: float):
+        super().__init__(fake, latency)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def batch_write_item(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self.fake.batch_write_item(**kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+def fake_table(**options) -> FakeDynamoDB:
+    fake = FakeDynamoDB(**options)
+    create_table(fake, TABLE)
+    return fake
+
+
+def test_batches_overlap_up_to_the_concurrency():
+    client = PeakClient(fake_table(), latency=0.01)
+    with AsyncBulkSink(lambda: client, TABLE, concurrency=4) as sink:
+        for i in range(500):
+            sink.put({"PK": "P", "SK": f"S#{i}"})
+    result = sink.close()
+
+    assert (result.written, result.failed) == (500, 0)
+    assert len(client.fake.table(TABLE)) == 500
+    assert 1 < client.peak <= 4
+
+
+def test_throttles_and_unprocessed_items_are_retried():
+    fake = fake_table(throttle_rate=0.3, unprocessed_rate=0.2, seed=5)
+    with AsyncBulkSink(lambda: AsyncFakeDynamoDB(fake), TABLE, concurrency=8, base_delay=0, max_retries=20) as sink:
+        for i in range(300):
+            sink.put({"PK": "P", "SK": f"S#{i}"})
+    result = sink.close()
+
+    assert (result.written, result.failed) == (300, 0)
+    assert result.retried > 0
+
+
+def test_stats_are_flushed_through_the_blocking_client(tmp_path):
+    fake = fake_table()
+    manifest = Manifest(tmp_path / "manifest.db", f"fake/{TABLE}")
+    sink = AsyncBulkSink(lambda: AsyncFakeDynamoDB(fake), TABLE, manifest=manifest, aggregates=Aggregates(manifest))
+    with sink:
+        for i in range(3):
+            sink.put({"PK": "PARTNERS", "SK": f"PARTNER#p-{i}", "entityType": "Partner", "type": "ngo"})
+    manifest.close()
+
+    assert get_stats(fake, TABLE, partner_stats_key()) == {"total": 3, "type#ngo": 3}
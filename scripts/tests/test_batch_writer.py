@@ -0,0 +1,150 @@
+"""BatchWriter retries and failure accounting (seedlib.batch_writer)."""
+
+from botocore.exceptions import ClientError, EndpointConnectionError, ParamValidationError, ReadTimeoutError
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+
+TABLE = "writer-test"
+ITEMS = [marshal_item({"PK": "P", "SK": f"S#{i}", "n": i}) for i in range(25)]
+
+
+class FlakyClient:
+    """FakeDynamoDB whose first `failures` BatchWriteItem calls raise `error`."""
+
+    def __init__(self, error: Exception, failures: int):
+        self.fake = FakeDynamoDB()
+        create_table(self.fake, TABLE)
+        self.error = error
+        self.failures = failures
+
+    def batch_write_item(self, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        return self.fake.batch_write_item(**kwargs)
+
+
+class StubClient:
+    """BatchWriteItem stand-in replaying scripted outcomes, then accepting everything.
+
+    An outcome is a number of requests to hand back as UnprocessedItems (the
+    last ones of the call) or an exception to raise.
+    """
+
+    def __init__(self, outcomes: list):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.stored = {}
+
+    def batch_write_item(self, RequestItems: dict, **kwargs):
+        requests = RequestItems[TABLE]
+        self.calls.append(len(requests))
+        outcome = self.outcomes.pop(0) if self.outcomes else 0
+        if isinstance(outcome, Exception):
+            raise outcome
+        accepted, unprocessed = requests[: len(requests) - outcome], requests[len(requests) - outcome :]
+        for request in accepted:
+            item = request["PutRequest"]["Item"]
+            self.stored[(item["PK"]["S"], item["SK"]["S"])] = item
+        return {"UnprocessedItems": {TABLE: unprocessed} if unprocessed else {}}
+
+
+def throttle(code: str = "ProvisionedThroughputExceededException") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": "slow down"}}, "BatchWriteItem")
+
+
+class LedgerLimiter:
+    """Rate limiter stand-in recording what was reserved and settled."""
+
+    def __init__(self):
+        self.reserved = 0.0
+        self.settled = 0.0
+
+    def acquire(self, units: float):
+        self.reserved += units
+
+    def record(self, consumed: float, reserved: float):
+        self.settled += reserved
+
+    def throttled(self):
+        pass
+
+
+def test_transport_errors_are_retried_and_settled():
+    client = FlakyClient(ReadTimeoutError(endpoint_url="http://localhost:4566"), failures=2)
+    limiter = LedgerLimiter()
+    writer = BatchWriter(client, TABLE, base_delay=0, rate_limiter=limiter)
+
+    result = writer.write_batch(ITEMS)
+
+    assert (result.written, result.retried, result.failed) == (25, 50, 0)
+    assert len(client.fake.table(TABLE)) == 25
+    assert limiter.settled == limiter.reserved
+
+
+def test_transport_errors_fail_the_batch_once_retries_run_out():
+    client = FlakyClient(EndpointConnectionError(endpoint_url="http://localhost:4566"), failures=100)
+    limiter = LedgerLimiter()
+    writer = BatchWriter(client, TABLE, max_retries=3, base_delay=0, rate_limiter=limiter)
+
+    result = writer.write_batch(ITEMS)
+
+    assert (result.written, result.failed) == (0, 25)
+    assert len(result.failed_items) == 25
+    assert result.errors and result.errors[0].startswith("EndpointConnectionError")
+    assert limiter.settled == limiter.reserved
+
+
+def test_other_botocore_errors_are_not_retried():
+    client = FlakyClient(ParamValidationError(report="bad item"), failures=100)
+    result = BatchWriter(client, TABLE, base_delay=0).write_batch(ITEMS)
+
+    assert (result.written, result.retried, result.failed) == (0, 0, 25)
+
+
+def test_unprocessed_items_are_redriven():
+    client = StubClient([10, 4])
+    result = BatchWriter(client, TABLE, base_delay=0).write_batch(ITEMS)
+
+    assert client.calls == [25, 10, 4]
+    assert (result.written, result.retried, result.failed) == (25, 14, 0)
+    assert len(client.stored) == 25
+
+
+def test_throttled_calls_are_retried():
+    client = StubClient([throttle(), throttle("ThrottlingException"), 3])
+    result = BatchWriter(client, TABLE, base_delay=0).write_batch(ITEMS)
+
+    assert client.calls == [25, 25, 25, 3]
+    assert (result.written, result.retried, result.failed) == (25, 53, 0)
+    assert not result.errors
+
+
+def test_unprocessed_items_fail_once_retries_run_out():
+    client = StubClient([5] * 10)
+    result = BatchWriter(client, TABLE, max_retries=3, base_delay=0).write_batch(ITEMS)
+
+    assert client.calls == [25, 5, 5, 5]
+    assert (result.written, result.retried, result.failed) == (20, 15, 5)
+    assert result.failed_items == ITEMS[20:]
+    assert result.errors == ["5 items still unprocessed after 3 retries"]
+
+
+def test_throttles_fail_the_batch_once_retries_run_out():
+    client = StubClient([throttle()] * 10)
+    result = BatchWriter(client, TABLE, max_retries=2, base_delay=0).write_batch(ITEMS)
+
+    assert client.calls == [25, 25, 25]
+    assert (result.written, result.retried, result.failed) == (0, 50, 25)
+    assert result.errors[0].startswith("ProvisionedThroughputExceededException")
+
+
+def test_validation_errors_are_not_retried():
+    client = StubClient([throttle("ValidationException")])
+    result = BatchWriter(client, TABLE, base_delay=0).write_batch(ITEMS)
+
+    assert client.calls == [25]
+    assert (result.written, result.retried, result.failed) == (0, 0, 25)
@@ -0,0 +1,80 @@
+"""Redis cache warm-up after seeding (seedlib.cache_warmup)."""
+
+import json
+
+from conftest import load_script
+
+from seedlib.cache_warmup import ReadModels, warm_cache
+from seedlib.codec import encode_item
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.fake_redis import FakeRedis
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+
+
+def trend(trend_id: str, updated: str) -> dict:
+    return marshal_item({
+        "PK": "TRENDS",
+        "SK": f"TREND#{trend_id}",
+        "entityType": "Trend",
+        "id": trend_id,
+        "country": "India",
+        "sources": ["ILO"],
+        "lastUpdated": updated,
+    })
+
+
+def test_read_models_are_the_api_list_responses():
+    models = ReadModels("t:")
+    models.add(trend("t-1", "2026-01-01"))
+    models.add(trend("t-2", "2026-02-01"))
+    models.add(trend("t-1", "2026-03-01"))
+    models.add(encode_item({"PK": "PARTNERS", "SK": "PARTNER#b", "entityType": "Partner", "id": "b", "name": "B"}))
+    models.add(marshal_item({"PK": "PARTNERS", "SK": "PARTNER#a", "entityType": "Partner", "id": "a", "name": "A"}))
+    models.add(marshal_item({"PK": "ORG#stt", "SK": "MESSAGE#m", "entityType": "Message"}))
+
+    entries = {key: (model, json.loads(value)) for model, key, value in models.entries()}
+
+    assert sorted(entries) == ["t:partners", "t:trends:country:India"]
+    trends = entries["t:trends:country:India"][1]["trends"]
+    assert [(row["id"], row["updatedAt"]) for row in trends] == [("t-1", "2026-03-01"), ("t-2", "2026-02-01")]
+    assert trends[0]["sources"] == ["ILO"]
+    assert [row["id"] for row in entries["t:partners"][1]["partners"]] == ["a", "b"]
+
+
+def test_warm_cache_pipelines_the_writes_with_their_ttls():
+    models = ReadModels("t:")
+    for i in range(5):
+        models.add(marshal_item({
+            "PK": f"ORG#org-{i}", "SK": "REPORT#r", "entityType": "Report", "id": "r", "orgId": f"org-{i}",
+        }))
+    redis = FakeRedis()
+
+    counts = warm_cache(redis, models, {"reports": 60}, pipeline_size=2)
+
+    assert (counts["reports"], counts["round_trips"]) == (5, 3)
+    assert redis.round_trips == 3
+    assert 58 <= redis.ttl("t:reports:org:org-0") <= 60
+    assert json.loads(redis.get("t:reports:org:org-4"))["reports"][0]["id"] == "r"
+
+
+def test_seed_all_warms_the_cache_and_survives_redis_being_down(monkeypatch, capsys):
+    seed_all = load_script("seed-all")
+    fake = FakeDynamoDB()
+    create_table(fake, seed_all.TABLE_NAME)
+    redis = FakeRedis()
+    monkeypatch.setattr(seed_all, "dynamodb_client", lambda *args: fake)
+    monkeypatch.setattr(seed_all, "FAILURES", [])
+    monkeypatch.setattr(seed_all, "READ_MODELS", None)
+    monkeypatch.setattr(seed_all, "get_redis_client", lambda url: redis)
+    monkeypatch.setattr("sys.argv", ["seed-all.py", "--no-stats", "--warm-cache"])
+
+    seed_all.main()
+    assert f"{seed_all.CACHE_PREFIX}partners" in redis.keys()
+
+    def unavailable(url):
+        raise ConnectionRefusedError("redis is down")
+
+    monkeypatch.setattr(seed_all, "get_redis_client", unavailable)
+    seed_all.main()
+    assert "Cache warm-up skipped, Redis unavailable" in capsys.readouterr().out
@@ -0,0 +1,56 @@
+"""Schema-compiled item codecs (seedlib.codec)."""
+
+import pytest
+
+from seedlib.codec import EntityCodec, decode_item, encode_item, get_marshaller
+from seedlib.marshal import marshal_item
+
+TREND = {
+    "PK": "TRENDS",
+    "SK": "TREND#t-1",
+    "entityType": "Trend",
+    "id": "t-1",
+    "title": "Debt bondage",
+    "sources": ["ILO", {"name": "UNODC", "year": 2025}],
+    "confidence": None,
+    "extra": {"nested": [1, 2.5, True]},
+}
+
+
+def test_declared_lists_and_maps_are_native_attributes():
+    encoded = encode_item(TREND)
+
+    assert encoded["sources"] == {"L": [{"S": "ILO"}, {"M": {"name": {"S": "UNODC"}, "year": {"N": "2025"}}}]}
+    assert encoded["extra"] == {"M": {"nested": {"L": [{"N": "1"}, {"N": "2.5"}, {"BOOL": True}]}}}
+    assert "confidence" not in encoded
+
+
+def test_round_trip_drops_only_none_values():
+    expected = {k: v for k, v in TREND.items() if v is not None}
+
+    assert decode_item(encode_item(TREND)) == expected
+    report = {"PK": "ORG#stt", "SK": "REPORT#r", "entityType": "Report", "version": 3, "s3Keys": {"pdf": "k"}}
+    assert decode_item(encode_item(report)) == report
+
+
+def test_codec_matches_the_generic_encoder_for_undeclared_types():
+    item = {"PK": "X", "SK": "Y", "entityType": "Unknown", "tags": ["a"], "n": 4}
+
+    assert decode_item(encode_item(item)) == item
+    assert encode_item(item)["tags"] == {"L": [{"S": "a"}]}
+
+
+def test_string_sets_skip_empty_values():
+    codec = EntityCodec("Tagged", {"PK": "S", "tags": "SS"})
+
+    assert codec.encode({"PK": "p", "tags": ["a", "b"]}) == {"PK": {"S": "p"}, "tags": {"SS": ["a", "b"]}}
+    assert codec.encode({"PK": "p", "tags": []}) == {"PK": {"S": "p"}}
+    with pytest.raises(ValueError):
+        EntityCodec("Bad", {"x": "Q"})
+
+
+def test_get_marshaller():
+    assert get_marshaller("json") is marshal_item
+    assert get_marshaller("native") is encode_item
+    with pytest.raises(ValueError):
+        get_marshaller("xml")
@@ -0,0 +1,33 @@
+"""Table creation from seedlib.indexes (create-table.py)."""
+
+from conftest import load_script
+
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import INDEXES
+
+create_table_script = load_script("create-table")
+
+TABLE = "create-test"
+
+
+def index_names(client) -> set:
+    table = client.describe_table(TableName=TABLE)["Table"]
+    return {index["IndexName"] for index in table.get("GlobalSecondaryIndexes", [])}
+
+
+def test_creates_the_table_with_every_index():
+    client = FakeDynamoDB()
+
+    assert create_table_script.create_or_update(client, TABLE, poll_seconds=0, progress=lambda line: None)
+    assert index_names(client) == {index.name for index in INDEXES}
+
+
+def test_existing_table_gets_only_the_missing_indexes():
+    client = FakeDynamoDB()
+    create_table_script.create_or_update(client, TABLE, poll_seconds=0, progress=lambda line: None)
+    client.update_table(TableName=TABLE, GlobalSecondaryIndexUpdates=[{"Delete": {"IndexName": INDEXES[-1].name}}])
+    lines = []
+
+    assert not create_table_script.create_or_update(client, TABLE, poll_seconds=0, progress=lines.append)
+    assert index_names(client) == {index.name for index in INDEXES}
+    assert lines[-1] == f"Indexes created: {INDEXES[-1].name}"
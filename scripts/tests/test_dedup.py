@@ -0,0 +1,71 @@
+"""Near-duplicate article detection (seedlib.dedup)."""
+
+import random
+
+from seedlib.dedup import ALIAS_ENTITY, NearDuplicateDetector, alias_item, minhash, resolve_alias, similarity
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+
+TABLE = "dedup-test"
+WORDS = "worker debt kiln factory passport wage recruiter broker fleet farm police rescue court shelter".split()
+
+
+def story(seed: int, length: int = 200) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def edited(text: str) -> str:
+    words = text.split()
+    words[100] = "amended"
+    return " ".join(words)
+
+
+def test_signatures_estimate_jaccard_similarity():
+    original = minhash(story(1))
+
+    assert similarity(original, minhash(story(1))) == 1.0
+    assert similarity(original, minhash(edited(story(1)))) > 0.8
+    assert similarity(original, minhash(story(2))) < 0.3
+    assert minhash("") is None
+
+
+def test_detector_flags_near_duplicates_of_remembered_articles():
+    detector = NearDuplicateDetector(threshold=0.8)
+
+    assert detector.check(("TAH#APAC", "ARTICLE#a"), minhash(story(1))) is None
+    assert detector.check(("TAH#APAC", "ARTICLE#b"), minhash(story(2))) is None
+    canonical, score = detector.check(("TAH#APAC", "ARTICLE#c"), minhash(edited(story(1))))
+
+    assert canonical == ("TAH#APAC", "ARTICLE#a") and score >= 0.8
+    assert detector.check(("TAH#APAC", "ARTICLE#a"), minhash(story(1))) is None
+    assert (detector.seen, detector.duplicates) == (4, 1)
+    assert detector.ratio == 0.25
+
+
+def test_detector_forgets_the_oldest_articles_first():
+    detector = NearDuplicateDetector(max_docs=2)
+    for seed in (1, 2, 3):
+        detector.check(("P", f"S{seed}"), minhash(story(seed)))
+
+    assert detector.check(("P", "again-1"), minhash(story(1))) is None
+    assert detector.check(("P", "again-3"), minhash(story(3)))[0] == ("P", "S3")
+
+
+def test_alias_items_resolve_to_their_canonical_article():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    canonical = marshal_item({"PK": "TAH#APAC", "SK": "ARTICLE#a", "entityType": "TahArticle", "docId": "a"})
+    duplicate = marshal_item({
+        "PK": "TAH#APAC", "SK": "ARTICLE#b", "entityType": "TahArticle", "docId": "b", "region": "APAC",
+        "article": story(1),
+    })
+    client.put_item(TableName=TABLE, Item=canonical)
+
+    alias = alias_item(duplicate, ("TAH#APAC", "ARTICLE#a"), 0.9)
+
+    assert alias["entityType"] == {"S": ALIAS_ENTITY}
+    assert "article" not in alias and alias["region"] == {"S": "APAC"}
+    assert resolve_alias(client, TABLE, alias) == canonical
+    assert resolve_alias(client, TABLE, canonical) is canonical
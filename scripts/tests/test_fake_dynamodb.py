@@ -0,0 +1,104 @@
+"""Offline DynamoDB stand-in (seedlib.fake_dynamodb) and the ingest benchmark (bench-ingest.py)."""
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from conftest import load_script
+
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+
+TABLE = "fake-test"
+
+
+def put_reports(client, count: int):
+    for i in range(count):
+        client.put_item(TableName=TABLE, Item=marshal_item({"PK": "ORG#stt", "SK": f"REPORT#{i:03d}", "n": i}))
+
+
+@pytest.fixture
+def client():
+    fake = FakeDynamoDB(seed=1)
+    create_table(fake, TABLE)
+    return fake
+
+
+def test_query_key_conditions_and_pagination(client):
+    put_reports(client, 30)
+    query = {
+        "TableName": TABLE,
+        "KeyConditionExpression": "PK = :pk AND SK BETWEEN :low AND :high",
+        "ExpressionAttributeValues": {":pk": {"S": "ORG#stt"}, ":low": {"S": "REPORT#005"}, ":high": {"S": "REPORT#024"}},
+        "Limit": 8,
+        "ScanIndexForward": False,
+    }
+    seen = []
+    while True:
+        page = client.query(**query)
+        seen += [item["SK"]["S"] for item in page["Items"]]
+        if "LastEvaluatedKey" not in page:
+            break
+        query["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+
+    assert seen == [f"REPORT#{i:03d}" for i in range(24, 4, -1)]
+
+    prefix = client.query(
+        TableName=TABLE,
+        KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
+        ExpressionAttributeValues={":pk": {"S": "ORG#stt"}, ":prefix": {"S": "REPORT#01"}},
+    )
+    assert prefix["Count"] == 10
+
+
+def test_scan_segments_cover_the_table_once(client):
+    for i in range(40):
+        client.put_item(TableName=TABLE, Item=marshal_item({"PK": f"P#{i}", "SK": "S"}))
+
+    keys = [
+        item["PK"]["S"]
+        for segment in range(4)
+        for item in client.scan(TableName=TABLE, Segment=segment, TotalSegments=4)["Items"]
+    ]
+
+    assert sorted(keys) == sorted(f"P#{i}" for i in range(40))
+
+
+def test_batch_write_validates_like_dynamodb(client):
+    item = marshal_item({"PK": "P", "SK": "S"})
+    with pytest.raises(ClientError):
+        client.batch_write_item(RequestItems={TABLE: [{"PutRequest": {"Item": item}}] * 2})
+    with pytest.raises(ClientError):
+        client.batch_write_item(RequestItems={TABLE: [
+            {"PutRequest": {"Item": marshal_item({"PK": "P", "SK": f"S{i}"})}} for i in range(26)
+        ]})
+
+
+def test_throttling_and_unprocessed_items_are_injected():
+    throttled = FakeDynamoDB(throttle_rate=1.0)
+    with pytest.raises(ClientError) as error:
+        throttled.batch_write_item(RequestItems={TABLE: []})
+    assert error.value.response["Error"]["Code"] == "ProvisionedThroughputExceededException"
+
+    lossy = FakeDynamoDB(unprocessed_rate=1.0)
+    requests = [{"PutRequest": {"Item": marshal_item({"PK": "P", "SK": f"S{i}"})}} for i in range(5)]
+    assert lossy.batch_write_item(RequestItems={TABLE: requests})["UnprocessedItems"] == {TABLE: requests}
+
+
+def test_bench_ingest_reports_every_path(tmp_path, monkeypatch):
+    bench = load_script("bench-ingest")
+    output = tmp_path / "bench.json"
+    monkeypatch.setattr("sys.argv", [
+        "bench-ingest.py", "--paths", "put_item", "bulk", "batch_write_items",
+        "--latency-ms", "0", "--limit", "5", "--dataset-dir", str(tmp_path), "-o", str(output),
+    ])
+
+    bench.main()
+
+    report = json.loads(output.read_text())
+    paths = {result["path"] for result in report["results"]}
+    assert paths == {"put_item", "bulk", "batch_write_items"}
+    partners = {r["path"]: r["items"] for r in report["results"] if r["entity"] == "Partner"}
+    assert partners["put_item"] == partners["bulk"] == 8
@@ -0,0 +1,65 @@
+"""Secondary index key layout (seedlib.indexes)."""
+
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import COUNTRY_TYPE, ENTITY_UPDATED, add_index_keys, create_table, index_attributes
+from seedlib.marshal import marshal_item
+
+TABLE = "index-test"
+
+REPORT = {
+    "PK": "ORG#stt",
+    "SK": "REPORT#r-1",
+    "entityType": "Report",
+    "id": "r-1",
+    "status": "approved",
+    "country": "India",
+    "exploitationType": "child_labour",
+    "updatedAt": "2026-01-05T11:00:00Z",
+}
+
+
+def test_index_keys_per_entity_type():
+    article = {"PK": "TAH#APAC#2", "SK": "ARTICLE#d", "entityType": "TahArticle", "docId": "d", "crawlDate": "2026-01-02"}
+    message = {"PK": "ORG#stt", "SK": "MESSAGE#c#m", "entityType": "Message", "createdAt": "2026-01-01T00:00:00Z"}
+
+    assert index_attributes(REPORT) == {
+        "GSI1PK": "Report",
+        "GSI1SK": "approved#2026-01-05T11:00:00Z",
+        "GSI2PK": "India",
+        "GSI2SK": "child_labour#Report#r-1",
+    }
+    assert index_attributes(article) == {"GSI3PK": "TAH#APAC#2", "GSI3SK": "2026-01-02#d"}
+    assert index_attributes(message) == {}
+
+
+def test_typed_and_plain_items_get_the_same_keys():
+    typed = add_index_keys(marshal_item(REPORT))
+
+    assert {name: typed[name]["S"] for name in ("GSI1PK", "GSI1SK", "GSI2PK", "GSI2SK")} == index_attributes(REPORT)
+    message = marshal_item({"PK": "ORG#stt", "SK": "MESSAGE#c#m", "entityType": "Message"})
+    assert add_index_keys(message) is message
+
+
+def test_status_listing_through_the_entity_index():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    for i, status in enumerate(["approved", "draft", "approved", "approved"]):
+        report = {**REPORT, "SK": f"REPORT#r-{i}", "id": f"r-{i}", "status": status, "updatedAt": f"2026-01-0{i + 1}"}
+        client.put_item(TableName=TABLE, Item=add_index_keys(marshal_item(report)))
+
+    response = client.query(
+        TableName=TABLE,
+        IndexName=ENTITY_UPDATED.name,
+        KeyConditionExpression="GSI1PK = :type AND begins_with(GSI1SK, :status)",
+        ExpressionAttributeValues={":type": {"S": "Report"}, ":status": {"S": "approved#"}},
+        ScanIndexForward=False,
+    )
+    by_country = client.query(
+        TableName=TABLE,
+        IndexName=COUNTRY_TYPE.name,
+        KeyConditionExpression="GSI2PK = :country",
+        ExpressionAttributeValues={":country": {"S": "India"}},
+    )
+
+    assert [item["id"]["S"] for item in response["Items"]] == ["r-3", "r-2", "r-0"]
+    assert by_country["Count"] == 4
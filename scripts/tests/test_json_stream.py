@@ -0,0 +1,46 @@
+"""Streaming top-level JSON arrays (seedlib.json_stream)."""
+
+import json
+
+import pytest
+
+from seedlib.json_stream import iter_json_array
+
+DOCUMENTS = [
+    "[]",
+    " [ ] ",
+    "[1.5]",
+    "[2e10]",
+    "[ 1.5 ]",
+    "[-0.25E-3, 42, 7]",
+    '[1, "two", true, false, null, 1e2]',
+    '[{"id": "a", "n": 12.75, "tags": ["x", "y"]}, {"id": "b", "nested": {"deep": [1, 2.5, -3]}}]',
+    '[\n  {"text": "commas, ] and [ brackets \\" inside"},\n  123456789012345678901234567890\n]\n',
+]
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7, 16, 64 * 1024])
+def test_elements_match_json_load_for_every_chunk_size(tmp_path, text, chunk_size):
+    path = tmp_path / "items.json"
+    path.write_text(text, encoding="utf-8")
+
+    assert list(iter_json_array(path, chunk_size=chunk_size)) == json.loads(text)
+
+
+def test_stops_reading_when_the_caller_stops(tmp_path):
+    path = tmp_path / "items.json"
+    path.write_text("[1, 2, 3, " + "x" * 100, encoding="utf-8")
+
+    elements = iter_json_array(path, chunk_size=4)
+
+    assert [next(elements), next(elements)] == [1, 2]
+
+
+@pytest.mark.parametrize("text", ['{"a": 1}', "[1, 2", "[1.5e]"])
+def test_rejects_malformed_input(tmp_path, text):
+    path = tmp_path / "items.json"
+    path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, chunk_size=2))
@@ -0,0 +1,84 @@
+"""Range-parallel JSONL ingestion (seedlib.jsonl_ingest)."""
+
+import json
+from functools import partial
+
+from seedlib.articles import item_with_pii, synthetic_article_item
+from seedlib.batch_writer import WriteResult
+from seedlib.jsonl_ingest import RangeResult, ingest_range, iter_range_lines, line_ranges, parallel_ingest
+from seedlib.telemetry import Telemetry
+
+
+class ListSink:
+    """Sink stand-in keeping the items put into it."""
+
+    def __init__(self, telemetry=None):
+        self.items = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def put_typed(self, dynamo_item: dict):
+        self.items.append(dynamo_item)
+
+    def close(self) -> WriteResult:
+        return WriteResult(written=len(self.items))
+
+
+def write_dataset(path, articles: list):
+    path.write_text("".join(json.dumps(article) + "\n" for article in articles))
+
+
+def test_redacting_workers_report_their_pii_hits(tmp_path):
+    dataset = tmp_path / "articles.jsonl"
+    write_dataset(dataset, [
+        {"doc_id": "a-1", "title": "Call 555-123-4567", "article": "Mail a@example.org or b@example.org"},
+        {"doc_id": "a-2", "title": "Clean", "article": "Nothing to see"},
+        {"doc_id": "a-3", "title": "SSN", "article": "ID 123-45-6789"},
+    ])
+    build_item = partial(item_with_pii, partial(synthetic_article_item, redact=True))
+
+    totals = RangeResult()
+    for line_range in line_ranges(dataset, 2):
+        totals.merge(ingest_range(dataset, line_range, build_item, ListSink, "TahArticle"))
+
+    assert (totals.lines, totals.items, totals.write.written) == (3, 3, 3)
+    assert totals.counts == {"email": 2, "phone": 1, "ssn": 1}
+
+
+def test_ranges_split_on_line_boundaries_and_number_lines_globally(tmp_path):
+    dataset = tmp_path / "lines.jsonl"
+    dataset.write_bytes(b"".join(b'{"n": %d}\n' % i for i in range(1000)) + b'{"n": 1000}')
+
+    ranges = line_ranges(dataset, 7)
+    lines = [record for line_range in ranges for record in iter_range_lines(dataset, line_range)]
+
+    assert len(ranges) == 7
+    assert ranges[0].start == 0 and ranges[-1].end == dataset.stat().st_size
+    assert all(a.end == b.start for a, b in zip(ranges, ranges[1:]))
+    assert [number for number, _ in lines] == list(range(1001))
+    assert [json.loads(line)["n"] for _, line in lines] == list(range(1001))
+
+
+def test_empty_file_has_no_ranges(tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.touch()
+
+    assert line_ranges(empty, 4) == []
+
+
+def test_parallel_ingest_counts_every_line_once(tmp_path):
+    dataset = tmp_path / "articles.jsonl"
+    articles = [{"doc_id": f"d-{i}", "title": f"T{i}", "article": "body"} for i in range(200)]
+    dataset.write_text("".join(json.dumps(a) + "\n" for a in articles) + "\n{broken\n")
+    telemetry = Telemetry()
+
+    totals = parallel_ingest(
+        dataset, synthetic_article_item, ListSink, 3, "TahArticle", telemetry=telemetry, progress=lambda line: None
+    )
+
+    assert (totals.lines, totals.items, totals.rejected, totals.write.written) == (201, 200, 1, 200)
+    assert telemetry.entities["TahArticle"].stage_seconds["transform"] > 0
@@ -0,0 +1,59 @@
+"""Inverted keyword index over TAH articles (seedlib.keyword_index)."""
+
+import pytest
+
+from seedlib.keyword_index import KeywordIndex, KeywordIndexBuilder, article_terms, tokenize
+
+ARTICLES = {
+    "d-1": ("Brick kiln debt bondage", "Workers held in debt bondage", "A brick kiln in Punjab kept families."),
+    "d-2": ("Fishing fleet abuse", "Forced labour at sea", "Crews on the fleet were never paid."),
+    "d-3": ("Debt in garment factories", None, "Recruitment fees left workers in debt."),
+    "d-4": ("Café workers", None, "Kitchen staff at the café had passports taken."),
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    builder = KeywordIndexBuilder()
+    for doc_id, (title, summary, body) in ARTICLES.items():
+        builder.add("TAH#APAC", doc_id, article_terms(title, summary, body))
+    builder.add("TAH#APAC", "d-2", article_terms(*ARTICLES["d-2"]))
+    path = tmp_path / "tah.idx"
+    header = builder.write(path)
+    assert header["docs"] == 4
+    with KeywordIndex(path) as opened:
+        yield opened
+
+
+def test_tokenize_drops_stopwords_and_single_characters():
+    assert tokenize("The Kiln, a KILN and 5 kilns") == ["kiln", "kiln", "kilns"]
+    assert tokenize(None) == []
+
+
+def test_title_terms_weigh_more_than_body_terms():
+    terms = article_terms("Debt bondage", "bondage", "debt debt")
+
+    assert terms == {"debt": 3 + 2, "bondage": 3 + 2}
+
+
+def test_search_ranks_by_bm25(index):
+    results = index.search("debt bondage")
+
+    assert [doc_id for _, _, doc_id in results] == ["d-1", "d-3"]
+    assert results[0][0] > results[1][0]
+    assert results[0][1] == "TAH#APAC"
+
+
+def test_require_all_and_unknown_terms(index):
+    assert [doc_id for _, _, doc_id in index.search("debt kiln", require_all=True)] == ["d-1"]
+    assert index.search("debt zeppelin", require_all=True) == []
+    assert [doc_id for _, _, doc_id in index.search("café")] == ["d-4"]
+    assert index.postings("zeppelin") == ((), ())
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "not.idx"
+    path.write_bytes(b"something else entirely")
+
+    with pytest.raises(ValueError):
+        KeywordIndex(path)
@@ -0,0 +1,64 @@
+"""Incremental seeding with a manifest (seedlib.manifest)."""
+
+from conftest import load_script
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table, index_attributes
+from seedlib.manifest import Manifest
+from seedlib.sink import BulkSink
+
+TABLE = "seed-test"
+
+
+def seed(client, manifest_path, seeders):
+    manifest = Manifest(manifest_path, f"fake/{TABLE}")
+    try:
+        sink = BulkSink(BatchWriter(client, TABLE, max_workers=2, base_delay=0), manifest=manifest)
+        for seeder in seeders:
+            seeder(sink)
+        return sink.close()
+    finally:
+        manifest.close()
+
+
+def report(updated_at: str) -> dict:
+    item = {
+        "PK": "ORG#stt",
+        "SK": "REPORT#report-001",
+        "entityType": "Report",
+        "id": "report-001",
+        "status": "approved",
+        "createdAt": "2026-01-10T10:00:00Z",
+        "updatedAt": updated_at,
+    }
+    item.update(index_attributes(item))
+    return item
+
+
+def test_rerun_of_the_seeders_writes_nothing(tmp_path):
+    seed_dynamodb = load_script("seed-dynamodb")
+    seeders = (seed_dynamodb.seed_partners, seed_dynamodb.seed_trends, seed_dynamodb.seed_reports)
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+
+    first = seed(client, tmp_path / "manifest.db", seeders)
+    second = seed(client, tmp_path / "manifest.db", seeders)
+
+    assert (first.written, first.failed) == (18, 0)
+    assert (second.written, second.skipped) == (0, 18)
+
+
+def test_changed_timestamp_rewrites_the_item(tmp_path):
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    key = {"PK": {"S": "ORG#stt"}, "SK": {"S": "REPORT#report-001"}}
+
+    seed(client, tmp_path / "manifest.db", [lambda sink: sink.put(report("2026-01-12T14:30:00Z"))])
+    unchanged = seed(client, tmp_path / "manifest.db", [lambda sink: sink.put(report("2026-01-12T14:30:00Z"))])
+    changed = seed(client, tmp_path / "manifest.db", [lambda sink: sink.put(report("2026-02-01T09:00:00Z"))])
+
+    assert (unchanged.written, unchanged.skipped) == (0, 1)
+    assert (changed.written, changed.skipped) == (1, 0)
+    stored = client.get_item(TableName=TABLE, Key=key)["Item"]
+    assert stored["GSI1SK"] == {"S": "approved#2026-02-01T09:00:00Z"}
@@ -0,0 +1,55 @@
+"""Time-ordered message keys and the history reader (seedlib.messages)."""
+
+import pytest
+
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+from seedlib.messages import message_history, message_sk, rekey_message, sortable_timestamp
+
+TABLE = "messages-test"
+
+
+def legacy_message(message_id: str, created_at: str) -> dict:
+    return marshal_item({
+        "PK": "ORG#stt",
+        "SK": f"MESSAGE#conv-1#{message_id}",
+        "entityType": "Message",
+        "id": message_id,
+        "conversationId": "conv-1",
+        "createdAt": created_at,
+    })
+
+
+def test_timestamps_sort_as_utc_instants():
+    assert sortable_timestamp("2026-01-15T09:35:36.526937596+00:00") == "2026-01-15T09:35:36.526937596Z"
+    assert sortable_timestamp("2026-01-15T10:35:36.5+01:00") == "2026-01-15T09:35:36.500000000Z"
+    assert sortable_timestamp("2026-01-15T09:35:36") == "2026-01-15T09:35:36.000000000Z"
+    assert message_sk("2026-01-15T09:00:00Z", "b") > message_sk("2026-01-15T09:00:00Z", "a")
+    with pytest.raises(ValueError):
+        sortable_timestamp("15/01/2026")
+
+
+def test_rekey_moves_messages_into_their_conversation_partition():
+    rekeyed = rekey_message(legacy_message("m-1", "2026-01-15T09:35:36Z"))
+
+    assert rekeyed["PK"] == {"S": "ORG#stt#CONV#conv-1"}
+    assert rekeyed["SK"] == {"S": "MSG#2026-01-15T09:35:36.000000000Z#m-1"}
+    assert rekeyed["orgId"] == {"S": "stt"}
+    assert rekey_message(rekeyed) is rekeyed
+
+
+def test_history_pages_back_from_the_newest_message():
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    for i in range(7):
+        client.put_item(TableName=TABLE, Item=rekey_message(legacy_message(f"m-{i}", f"2026-01-15T09:00:0{i}Z")))
+
+    pages, cursor = [], None
+    while True:
+        items, cursor = message_history(client, TABLE, "stt", "conv-1", limit=3, cursor=cursor)
+        pages.append([item["id"]["S"] for item in items])
+        if cursor is None:
+            break
+
+    assert pages == [["m-6", "m-5", "m-4"], ["m-3", "m-2", "m-1"], ["m-0"]]
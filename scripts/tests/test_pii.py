@@ -0,0 +1,54 @@
+"""Redaction of direct identifiers from article text (seedlib.pii)."""
+
+from collections import Counter
+
+import pytest
+
+from seedlib.pii import format_counts, redact_article, redact_text, redact_text_naive
+
+SAMPLES = [
+    "Write to jane.doe@example.org or call (555) 123-4567.",
+    "SSN 123-45-6789, card 4111 1111 1111 1111, host 10.0.0.12",
+    "Helpline +91 98765 43210 opens at 9.",
+    "Version 1.2.3 ships in 2024 with 300 pages.",
+    "",
+]
+
+
+def test_redact_text_replaces_and_counts_each_type():
+    counts = Counter()
+
+    text = redact_text(SAMPLES[0] + " " + SAMPLES[1], counts)
+
+    assert text == "Write to [EMAIL] or call [PHONE]. SSN [ID], card [ID], host [ID]"
+    assert counts == {"email": 1, "phone": 1, "ssn": 1, "credit_card": 1, "ip_address": 1}
+
+
+def test_redact_text_leaves_plain_numbers_alone():
+    counts = Counter()
+    assert redact_text(SAMPLES[3], counts) == SAMPLES[3]
+    assert redact_text("", counts) == ""
+    assert not counts
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_single_pass_matches_the_naive_baseline(text):
+    fast, naive = Counter(), Counter()
+    assert redact_text(text, fast) == redact_text_naive(text, naive)
+    assert fast == naive
+
+
+def test_redact_article_copies_only_text_fields():
+    article = {"docId": "a-1", "title": "Mail me: a@b.io", "article": SAMPLES[2], "views": 555_123_4567}
+
+    redacted, counts = redact_article(article)
+
+    assert redacted == {"docId": "a-1", "title": "Mail me: [EMAIL]", "article": "Helpline [PHONE] opens at 9.",
+                        "views": 555_123_4567}
+    assert article["title"] == "Mail me: a@b.io"
+    assert counts == {"email": 1, "phone": 1}
+
+
+def test_format_counts():
+    assert format_counts(Counter()) == "none found"
+    assert format_counts(Counter(phone=1, email=3)) == "3 email, 1 phone"
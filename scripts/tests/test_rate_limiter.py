@@ -0,0 +1,71 @@
+"""Capacity-aware write rate limiting (seedlib.rate_limiter)."""
+
+import pytest
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+from seedlib.rate_limiter import AdaptiveRateLimiter, consumed_units, item_write_units, table_rate_limiter
+from seedlib.sink import BulkSink
+
+TABLE = "limit-test"
+
+
+def test_write_units_are_billed_per_started_kilobyte():
+    small = marshal_item({"PK": "P", "SK": "S"})
+    large = marshal_item({"PK": "P", "SK": "S", "body": "x" * 2500})
+
+    assert item_write_units(small) == 1
+    assert item_write_units(large) == 3
+
+
+def test_consumed_units_fall_back_to_the_reservation():
+    assert consumed_units({}, 4) == 4
+    assert consumed_units({"ConsumedCapacity": {"CapacityUnits": 2.0}}, 4) == 2.0
+    assert consumed_units({"ConsumedCapacity": [{"CapacityUnits": 1.0}, {"CapacityUnits": 2.5}]}, 4) == 3.5
+
+
+def test_throttles_halve_the_rate_and_successes_recover_it():
+    limiter = AdaptiveRateLimiter(100, target_utilisation=0.8, recovery=0.1)
+    assert limiter.ceiling == 80
+
+    limiter.throttled()
+    limiter.throttled()
+    assert (limiter.rate, limiter.throttles) == (20, 2)
+    for _ in range(10):
+        limiter.record(1, 1)
+    assert limiter.rate == 80
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(100, target_utilisation=1.5)
+
+
+def test_reservations_beyond_the_burst_wait_at_the_rate():
+    limiter = AdaptiveRateLimiter(100, target_utilisation=0.5, burst_seconds=1.0)
+
+    assert limiter.reserve(50) == 0.0
+    assert limiter.reserve(25) == pytest.approx(0.5, abs=0.01)
+
+
+def test_table_rate_limiter_is_off_for_on_demand_tables():
+    on_demand = FakeDynamoDB()
+    provisioned = FakeDynamoDB(write_capacity=200)
+
+    assert table_rate_limiter(on_demand, TABLE, 0.5) is None
+    assert table_rate_limiter(on_demand, TABLE, 0.5, capacity=40).ceiling == 20
+    assert table_rate_limiter(provisioned, TABLE, 0.5).ceiling == 100
+
+
+def test_paced_writes_stay_within_provisioned_capacity():
+    client = FakeDynamoDB(write_capacity=400)
+    create_table(client, TABLE)
+    limiter = table_rate_limiter(client, TABLE, 0.5)
+    writer = BatchWriter(client, TABLE, max_workers=4, base_delay=0.001, rate_limiter=limiter)
+
+    with BulkSink(writer) as sink:
+        for i in range(300):
+            sink.put({"PK": "P", "SK": f"S#{i}"})
+    result = sink.close()
+
+    assert (result.written, result.failed) == (300, 0)
+    assert limiter.consumed == pytest.approx(300)
@@ -0,0 +1,68 @@
+"""Concurrent S3 uploads with ETag skip checks (seedlib.s3_upload)."""
+
+import pytest
+
+from seedlib.fake_s3 import FakeS3
+from seedlib.s3_upload import Artifact, S3Uploader, expected_etag, part_size_for
+
+BUCKET = "upload-test"
+
+
+class FailingS3(FakeS3):
+    """FakeS3 whose UploadPart fails for keys starting with "bad"."""
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body=b"", **kwargs):
+        if Key.startswith("bad"):
+            raise ConnectionError("connection reset")
+        return super().upload_part(Bucket, Key, UploadId, PartNumber, Body, **kwargs)
+
+
+def make_client(cls=FakeS3):
+    client = cls(min_part_size=4)
+    client.create_bucket(Bucket=BUCKET)
+    return client
+
+
+def run(uploader, artifacts) -> dict:
+    return {artifact.key: status for artifact, status in uploader.upload_all(artifacts)}
+
+
+def test_artifact_needs_exactly_one_source(tmp_path):
+    with pytest.raises(ValueError):
+        Artifact("a.json")
+    with pytest.raises(ValueError):
+        Artifact("a.json", path=tmp_path / "a.json", body=b"{}")
+    assert Artifact("report.md", body=b"#").content_type == "text/markdown; charset=utf-8"
+    assert part_size_for(100 * 10_000 + 1, 10) == 101
+
+
+def test_uploads_then_skips_unchanged_objects(tmp_path):
+    client = make_client()
+    (tmp_path / "big.json").write_bytes(b"0123456789" * 5)
+    artifacts = [Artifact("big.json", path=tmp_path / "big.json"), Artifact("small.md", body=b"# title")]
+
+    with S3Uploader(client, BUCKET, max_workers=2, part_size=16, multipart_threshold=32) as uploader:
+        assert run(uploader, artifacts) == {"big.json": "multipart", "small.md": "put"}
+    assert client.calls["UploadPart"] == 4
+    assert client.get_object(Bucket=BUCKET, Key="big.json")["Body"].read() == b"0123456789" * 5
+    assert client.head_object(Bucket=BUCKET, Key="big.json")["ETag"] == expected_etag(artifacts[0], 16, 32)
+
+    artifacts.append(Artifact("new.json", body=b"[]"))
+    with S3Uploader(client, BUCKET, max_workers=2, part_size=16, multipart_threshold=32) as rerun:
+        assert rerun.load_remote() == 2
+        assert run(rerun, artifacts) == {"big.json": "skipped", "small.md": "skipped", "new.json": "put"}
+    assert (rerun.result.uploaded, rerun.result.skipped, rerun.result.bytes) == (1, 2, 2)
+    assert client.calls["UploadPart"] == 4
+
+
+def test_failures_are_counted_and_multipart_aborted():
+    client = make_client(FailingS3)
+    artifacts = [Artifact("bad.json", body=b"x" * 40), Artifact("good.json", body=b"x" * 40)]
+
+    with S3Uploader(client, BUCKET, max_workers=2, part_size=16, multipart_threshold=32) as uploader:
+        assert run(uploader, artifacts) == {"bad.json": None, "good.json": "multipart"}
+
+    assert (uploader.result.uploaded, uploader.result.multipart, uploader.result.failed) == (1, 1, 1)
+    assert uploader.result.errors == [f"s3://{BUCKET}/bad.json: connection reset"]
+    assert client.calls["AbortMultipartUpload"] == 1
+    assert client.open_uploads == 0
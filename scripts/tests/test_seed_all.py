@@ -0,0 +1,44 @@
+"""In-process LocalStack seeding (seed-all.py)."""
+
+import json
+
+import pytest
+
+from conftest import load_script
+
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+
+seed_all = load_script("seed-all")
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    client = FakeDynamoDB()
+    create_table(client, seed_all.TABLE_NAME)
+    monkeypatch.setattr(seed_all, "dynamodb_client", lambda *args: client)
+    monkeypatch.setattr(seed_all, "FAILURES", [])
+    monkeypatch.setattr(seed_all, "READ_MODELS", None)
+    monkeypatch.setattr(seed_all, "SEED_CACHE_DIR", None)
+    monkeypatch.setattr("sys.argv", ["seed-all.py", "--no-stats"])
+    return client
+
+
+def test_seeds_every_seed_file_in_batches(fake, capsys):
+    sources = [path for path in seed_all.SEED_DATA_DIR.glob("*.json") if path.name != "all-items.json"]
+    expected = sum(len(json.loads(path.read_text())) for path in sources)
+
+    seed_all.main()
+
+    assert len(fake.table(seed_all.TABLE_NAME)) == expected
+    assert fake.calls.get("PutItem", 0) == 0
+    assert f"Total items: {expected}, failed: 0" in capsys.readouterr().out
+
+
+def test_falls_back_to_the_hardcoded_items(fake, monkeypatch, tmp_path):
+    monkeypatch.setattr(seed_all, "SEED_DATA_DIR", tmp_path)
+
+    seed_all.main()
+
+    entities = {item["entityType"]["S"] for item in fake.table(seed_all.TABLE_NAME).values()}
+    assert entities == {"Partner", "Trend", "Report"}
@@ -0,0 +1,78 @@
+"""Binary seed cache (seedlib.seed_cache)."""
+
+import json
+import os
+import pickle
+
+import pytest
+
+from conftest import load_script
+
+from seedlib.marshal import marshal_item
+from seedlib.seed_cache import build_cache, cache_is_fresh, cache_path_for, iter_cached_batches, load_items
+
+ITEMS = [
+    marshal_item({"PK": "PARTNERS", "SK": f"PARTNER#p-{i}", "entityType": "Partner", "n": i, "tags": ["a", "b"]})
+    for i in range(30)
+]
+
+
+class Exploit:
+    def __reduce__(self):
+        return (os.system, ("echo pwned",))
+
+
+def write_source(tmp_path):
+    source = tmp_path / "partners.json"
+    source.write_text(json.dumps(ITEMS, indent=2))
+    return source
+
+
+def test_cache_round_trips_in_batches(tmp_path):
+    source = write_source(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    build_cache(source, cache_dir=cache_dir)
+
+    assert cache_is_fresh(source, cache_dir)
+    assert [len(batch) for batch in iter_cached_batches(source, cache_dir)] == [25, 5]
+    assert load_items(source, cache_dir) == ITEMS
+
+
+def test_changed_source_makes_the_cache_stale(tmp_path):
+    source = write_source(tmp_path)
+    build_cache(source)
+    source.write_text(json.dumps(ITEMS[:3]))
+
+    assert not cache_is_fresh(source)
+    assert iter_cached_batches(source) is None
+    assert load_items(source) == ITEMS[:3]
+
+
+def test_batches_that_are_not_plain_data_are_refused(tmp_path, monkeypatch):
+    source = write_source(tmp_path)
+    real_dumps = pickle.dumps
+    monkeypatch.setattr(pickle, "dumps", lambda batch, protocol: real_dumps([Exploit()], protocol=protocol))
+    build_cache(source)
+    monkeypatch.undo()
+
+    with pytest.raises(pickle.UnpicklingError):
+        list(iter_cached_batches(source))
+    assert load_items(source) == ITEMS
+    assert cache_path_for(source).exists()
+
+
+def test_build_script_rebuilds_only_stale_caches(tmp_path, monkeypatch, capsys):
+    build_script = load_script("build-seed-cache")
+    source = write_source(tmp_path)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(build_script, "SEED_DATA_DIR", tmp_path)
+    monkeypatch.setattr(build_script, "SEED_CACHE_DIR", cache_dir)
+    monkeypatch.setattr("sys.argv", ["build-seed-cache.py"])
+
+    build_script.main()
+    assert cache_is_fresh(source, cache_dir)
+    build_script.main()
+
+    assert "partners.json: up to date" in capsys.readouterr().out
+    assert load_items(source, cache_dir) == ITEMS
@@ -0,0 +1,94 @@
+"""Bulk and per-item sinks (seedlib.sink)."""
+
+import threading
+
+from seedlib.batch_writer import BatchWriter
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.sink import BulkSink, PutItemSink
+
+TABLE = "sink-test"
+
+
+def item(i: int, version: int = 0) -> dict:
+    return {"PK": "ORG#stt", "SK": f"REPORT#r-{i:03d}", "entityType": "Report", "version": version}
+
+
+def fake_table() -> FakeDynamoDB:
+    client = FakeDynamoDB(seed=7)
+    create_table(client, TABLE)
+    return client
+
+
+def test_bulk_sink_writes_full_batches_and_the_remainder():
+    client = fake_table()
+    with BulkSink(BatchWriter(client, TABLE, max_workers=4)) as sink:
+        for i in range(60):
+            sink.put(item(i))
+    result = sink.close()
+
+    assert (result.written, result.failed) == (60, 0)
+    assert client.calls["BatchWriteItem"] == 3
+    assert len(client.table(TABLE)) == 60
+
+
+def test_bulk_sink_keeps_the_last_put_of_a_key_in_one_batch():
+    client = fake_table()
+    with BulkSink(BatchWriter(client, TABLE)) as sink:
+        sink.put(item(1, version=1))
+        sink.put(item(1, version=2))
+    result = sink.close()
+
+    assert result.written == 1
+    stored = client.table(TABLE)[("ORG#stt", "REPORT#r-001")]
+    assert stored["version"] == {"N": "2"}
+
+
+def test_bulk_sink_bounds_the_batches_in_flight():
+    client = fake_table()
+    release = threading.Event()
+    peak = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    class SlowWriter(BatchWriter):
+        def write_batch(self, items):
+            with lock:
+                peak["now"] += 1
+                peak["max"] = max(peak["max"], peak["now"])
+            release.wait(0.01)
+            try:
+                return super().write_batch(items)
+            finally:
+                with lock:
+                    peak["now"] -= 1
+
+    with BulkSink(SlowWriter(client, TABLE, max_workers=8), max_in_flight=2) as sink:
+        for i in range(250):
+            sink.put(item(i))
+    result = sink.close()
+
+    assert result.written == 250
+    assert peak["max"] <= 2
+
+
+def test_bulk_sink_survives_throttling_and_unprocessed_items():
+    client = FakeDynamoDB(throttle_rate=0.3, unprocessed_rate=0.2, seed=3)
+    create_table(client, TABLE)
+    with BulkSink(BatchWriter(client, TABLE, base_delay=0, max_retries=20)) as sink:
+        for i in range(200):
+            sink.put(item(i))
+    result = sink.close()
+
+    assert (result.written, result.failed) == (200, 0)
+    assert result.retried > 0
+    assert len(client.table(TABLE)) == 200
+
+
+def test_put_item_sink_writes_one_request_per_item():
+    client = fake_table()
+    with PutItemSink(client, TABLE) as sink:
+        for i in range(5):
+            sink.put(item(i))
+
+    assert sink.result.written == 5
+    assert client.calls["PutItem"] == 5
@@ -0,0 +1,61 @@
+"""Synthetic scale-out data (seedlib.synthetic, generate-scale-data.py)."""
+
+import json
+from collections import Counter
+
+from conftest import load_script
+
+from seedlib.synthetic import KINDS, ScaleConfig, SkewedChoice, chunk_plan, generate_chunk
+
+SEED_DATA_DIR = str(load_script("generate-scale-data").SEED_DATA_DIR)
+
+
+def small_config(**overrides) -> ScaleConfig:
+    options = dict(
+        templates_dir=SEED_DATA_DIR, orgs=5, partners=7, trends=6, reports=40, conversations=4,
+        messages_per_conversation=3, articles=30, article_words=20,
+    )
+    return ScaleConfig(**{**options, **overrides})
+
+
+def generate(config: ScaleConfig, chunk_items: int) -> list:
+    return [item for task in chunk_plan(config, KINDS, chunk_items) for item in generate_chunk(config, task)]
+
+
+def test_output_does_not_depend_on_the_chunk_size():
+    config = small_config()
+    items = generate(config, 1000)
+
+    assert generate(config, 7) == items
+    assert generate(small_config(seed=43), 1000) != items
+    counts = Counter(item["entityType"]["S"] for item in items)
+    assert counts == {
+        "Partner": 7, "Trend": 6, "Report": 40, "Conversation": 4, "Message": 12, "TahArticle": 30,
+    }
+    assert len({(item["PK"]["S"], item["SK"]["S"]) for item in items}) == len(items)
+
+
+def test_skew_concentrates_picks_on_the_first_values():
+    assert SkewedChoice(range(10), 0).share(1) == 0.1
+    assert SkewedChoice(range(10), 2).share(1) > 0.6
+    config = small_config(orgs=50, reports=400, org_skew=2.0)
+    reports = generate_chunk(config, ("reports", 0, 400))
+
+    hottest = Counter(item["PK"]["S"] for item in reports).most_common(1)[0]
+    assert hottest[0] == "ORG#org-00000" and hottest[1] > 200
+
+
+def test_generate_scale_data_writes_sharded_files(tmp_path, monkeypatch, capsys):
+    script = load_script("generate-scale-data")
+    monkeypatch.setattr("sys.argv", [
+        "generate-scale-data.py", "--out-dir", str(tmp_path), "--shard-items", "10", "--processes", "1",
+        "--orgs", "3", "--reports", "25", "--partners", "2", "--trends", "2", "--conversations", "0",
+        "--articles", "0", "--kinds", "reports,partners",
+    ])
+
+    script.main()
+
+    reports = sorted(tmp_path.glob("reports-*.json"))
+    assert [len(json.loads(path.read_text())) for path in reports] == [10, 10, 5]
+    assert len(json.loads((tmp_path / "partners-0000.json").read_text())) == 2
+    assert "Report: 25" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+"""Segmented Scan export into seed files (seedlib.table_export)."""
+
+import json
+
+from seedlib.dedup import alias_item
+from seedlib.fake_dynamodb import FakeDynamoDB
+from seedlib.indexes import create_table
+from seedlib.marshal import marshal_item
+from seedlib.table_export import entity_filename, export_table
+
+TABLE = "export-test"
+
+
+def test_entity_filename():
+    assert entity_filename("Partner") == "partners.json"
+    assert entity_filename("TahArticle") == "tah-articles.json"
+    assert entity_filename("Stats") == "stats.json"
+    assert entity_filename("TahArticleAlias") == "tah-article-alias.json"
+    assert entity_filename(None) == "unknown.json"
+
+
+def test_export_skips_derived_items(tmp_path):
+    client = FakeDynamoDB()
+    create_table(client, TABLE)
+    partners = [
+        marshal_item({"PK": "PARTNERS", "SK": f"PARTNER#p-{i}", "entityType": "Partner", "id": f"p-{i}"})
+        for i in range(5)
+    ]
+    article = marshal_item({"PK": "REGION#APAC", "SK": "ARTICLE#a-1", "entityType": "TahArticle", "docId": "a-1"})
+    derived = [
+        alias_item({**article, "SK": {"S": "ARTICLE#a-2"}}, ("REGION#APAC", "ARTICLE#a-1"), 0.95),
+        marshal_item({"PK": "STATS#PARTNERS", "SK": "STATS", "entityType": "Stats", "total": 5}),
+    ]
+    for item in partners + [article] + derived:
+        client.put_item(TableName=TABLE, Item=item)
+
+    counts = export_table(client, TABLE, tmp_path, segments=3, page_size=2, progress=lambda line: None)
+
+    assert counts == {"partners.json": 5, "tah-articles.json": 1, "all-items.json": 6}
+    exported = json.loads((tmp_path / "partners.json").read_text())
+    assert sorted(item["SK"]["S"] for item in exported) == sorted(item["SK"]["S"] for item in partners)
+    everything = json.loads((tmp_path / "all-items.json").read_text())
+    assert {item["entityType"]["S"] for item in everything} == {"Partner", "TahArticle"}
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,53 @@
+"""Seed run telemetry (seedlib.telemetry)."""
+
+import json
+
+from seedlib.telemetry import LATENCY_BUCKETS, EntityStats, Telemetry
+
+
+def test_quantile_past_the_last_bucket_is_null_in_the_json_summary(tmp_path):
+    telemetry = Telemetry()
+    item = {"PK": {"S": "P"}, "SK": {"S": "S"}, "entityType": {"S": "Report"}}
+    telemetry.record_call([item], LATENCY_BUCKETS[-1] * 2, 1.0)
+
+    telemetry.write_json(tmp_path / "seed-metrics.json")
+    summary = json.loads((tmp_path / "seed-metrics.json").read_text(), parse_constant=lambda name: name)
+
+    assert summary["entities"]["Report"]["latency_p99"] is None
+    assert "p99 > " in telemetry.table()[0]
+
+
+def test_quantile_is_the_bucket_bound():
+    stats = EntityStats()
+    for seconds in (0.002, 0.002, 0.002, 0.04):
+        stats.observe_latency(seconds)
+
+    assert stats.latency_quantile(0.5) == 0.0025
+    assert stats.latency_quantile(0.99) == 0.05
+    assert EntityStats().latency_quantile(0.99) == 0.0
+
+
+def test_sink_stage_excludes_nested_stages_and_calls_are_timed_apart():
+    telemetry = Telemetry()
+    item = {"PK": {"S": "P"}, "SK": {"S": "S"}, "entityType": {"S": "Report"}}
+    with telemetry.stage("Report", "sink"):
+        with telemetry.stage("Report", "transform"):
+            pass
+        telemetry.record_call([item], 0.004, 1.0)
+
+    stats = telemetry.entities["Report"]
+    assert set(stats.stage_seconds) == {"parse", "transform", "sink"}
+    assert stats.calls == 1 and stats.latency_sum == 0.004
+    assert 'stage="sink"' in telemetry.prometheus()
+
+
+def test_export_replaces_the_files_whole(tmp_path):
+    telemetry = Telemetry()
+    (tmp_path / "seed-metrics.prom").write_text("stale")
+
+    paths = telemetry.export(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["seed-metrics.json", "seed-metrics.prom"]
+    assert (tmp_path / "seed-metrics.prom").read_text() == telemetry.prometheus()
+    assert json.loads((tmp_path / "seed-metrics.json").read_text())["entities"] == {}
+    assert len(paths) == 2
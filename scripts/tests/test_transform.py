@@ -0,0 +1,34 @@
+"""Process-pool transform stage (seedlib.transform)."""
+
+import json
+from functools import partial
+from itertools import count
+
+from seedlib.articles import synthetic_article_item
+from seedlib.transform import transform_ordered
+
+RECORDS = [
+    (i, json.dumps({"doc_id": f"d-{i}", "title": f"Article {i}", "region": "APAC", "article": "text " * i}))
+    for i in range(300)
+] + [(300, "{not json")]
+
+
+def test_pool_output_matches_the_serial_transform_in_order():
+    build = partial(synthetic_article_item, shards=4)
+    serial = list(transform_ordered(build, RECORDS, workers=0))
+
+    assert list(transform_ordered(build, RECORDS, workers=3, chunk_size=16)) == serial
+    assert [item["docId"]["S"] for item in serial[:-1]] == [f"d-{i}" for i in range(300)]
+    assert serial[-1] is None
+
+
+def test_pool_reads_the_input_lazily():
+    consumed = count()
+    records = ((next(consumed), f"{i}") for i in range(100000))
+
+    results = transform_ordered(int, (line for _, line in records), workers=2, chunk_size=10)
+    first = [next(results) for _ in range(5)]
+    results.close()
+
+    assert first == [0, 1, 2, 3, 4]
+    assert next(consumed) <= 2 * 2 * 10 + 10
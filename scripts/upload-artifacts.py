@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Upload report and message artifacts to S3 and record their keys on the DynamoDB items.
+
+Scans the table for Report and Message items and uploads their artifacts
+under `<orgId>/...` (see seedlib.artifacts). Every other file of
+--artifacts-dir, which mirrors the bucket layout, is uploaded under its
+relative path. All uploads share one pooled S3 client. Bodies above the
+multipart threshold go up as concurrent multipart uploads, and objects
+whose ETag already matches are skipped. Afterwards each Report gets
+`s3Keys` and each Message `contentRef` via UpdateItem. Items that already
+hold those values are not written again.
+
+    python3 scripts/upload-artifacts.py --artifacts-dir ./artifacts --workers 32
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from seedlib.artifacts import message_artifact, message_update, report_artifacts, report_update
+from seedlib.clients import dynamodb_client, s3_client
+from seedlib.marshal import item_key
+from seedlib.s3_upload import MB, MULTIPART_THRESHOLD, PART_SIZE, Artifact, S3Uploader
+from seedlib.table_export import scan_segment
+
+# Configuration
+TABLE_NAME = os.getenv("DYNAMODB_TABLE", "lon12-table")
+REGION = os.getenv("AWS_REGION", "us-west-2")
+ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT", "http://localhost:4566")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT", ENDPOINT_URL)
+ARTIFACT_BUCKET = os.getenv("ARTIFACT_BUCKET", "treven-data-local")
+ARTIFACTS_DIR = os.getenv("ARTIFACTS_DIR")
+WORKERS = int(os.getenv("UPLOAD_WORKERS", "16"))
+SEGMENTS = int(os.getenv("EXPORT_SEGMENTS", "4"))
+PART_SIZE_MB = int(os.getenv("S3_PART_SIZE_MB", str(PART_SIZE // MB)))
+MULTIPART_THRESHOLD_MB = int(os.getenv("S3_MULTIPART_THRESHOLD_MB", str(MULTIPART_THRESHOLD // MB)))
+MESSAGE_MIN_CHARS = int(os.getenv("MESSAGE_ARTIFACT_MIN_CHARS", "0"))
+
+
+def scan_items(client, segments: int, entity_types: tuple) -> list:
+    """Typed items of `entity_types`, read with a parallel segmented Scan."""
+
+    def run(segment: int) -> list:
+        return [
+            item
+            for page in scan_segment(client, TABLE_NAME, segment, segments)
+            for item in page
+            if item.get("entityType", {}).get("S") in entity_types
+        ]
+
+    with ThreadPoolExecutor(max_workers=segments) as pool:
+        return [item for items in pool.map(run, range(segments)) for item in items]
+
+
+def plan_uploads(items: list, artifacts_dir: Path, message_min_chars: int) -> tuple:
+    """(artifacts to upload, {artifact key: (item, format or None)}) for the scanned items and the directory."""
+    artifacts, owners = [], {}
+    for item in items:
+        if item["entityType"]["S"] == "Report":
+            for fmt, artifact in report_artifacts(item, artifacts_dir).items():
+                artifacts.append(artifact)
+                owners[artifact.key] = (item, fmt)
+        else:
+            artifact = message_artifact(item, message_min_chars)
+            if artifact:
+                artifacts.append(artifact)
+                owners[artifact.key] = (item, None)
+
+    if artifacts_dir:
+        for path in sorted(artifacts_dir.rglob("*")):
+            key = path.relative_to(artifacts_dir).as_posix()
+            if path.is_file() and key not in owners:
+                artifacts.append(Artifact(key, path=path))
+    return artifacts, owners
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--artifacts-dir",
+        type=Path,
+        default=Path(ARTIFACTS_DIR) if ARTIFACTS_DIR else None,
+        help="Local files laid out as the bucket (<orgId>/reports/<reportId>/v<n>/report.pdf, ...)",
+    )
+    parser.add_argument("--bucket", default=ARTIFACT_BUCKET, help="Destination bucket")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Concurrent uploads (and parts per upload pool)")
+    parser.add_argument("--segments", type=int, default=SEGMENTS, help="Parallel Scan segments for finding the items")
+    parser.add_argument("--part-size-mb", type=int, default=PART_SIZE_MB, help="Multipart part size (S3 minimum 5)")
+    parser.add_argument(
+        "--multipart-threshold-mb",
+        type=int,
+        default=MULTIPART_THRESHOLD_MB,
+        help="Bodies at least this large are sent as multipart uploads",
+    )
+    parser.add_argument(
+        "--message-min-chars",
+        type=int,
+        default=MESSAGE_MIN_CHARS,
+        help="Only give messages with at least this much content a contentRef (0 = every message)",
+    )
+    parser.add_argument("--no-messages", action="store_true", help="Upload report artifacts only")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    print("=== Artifact Upload ===")
+    print(f"Table: {TABLE_NAME}")
+    print(f"Bucket: {args.bucket} ({S3_ENDPOINT_URL or 'AWS default'})")
+    print(f"Artifacts directory: {args.artifacts_dir or 'none (rendered report markdown and message content only)'}")
+    print()
+
+    start = time.perf_counter()
+    dynamodb = dynamodb_client(REGION, ENDPOINT_URL, max(args.segments, args.workers))
+    entity_types = ("Report",) if args.no_messages else ("Report", "Message")
+    items = scan_items(dynamodb, args.segments, entity_types)
+    artifacts, owners = plan_uploads(items, args.artifacts_dir, args.message_min_chars)
+    print(f"Found {len(items)} items, {len(artifacts)} artifacts")
+
+    uploader = S3Uploader(
+        s3_client(REGION, S3_ENDPOINT_URL, args.workers * 2),
+        args.bucket,
+        max_workers=args.workers,
+        part_size=args.part_size_mb * MB,
+        multipart_threshold=args.multipart_threshold_mb * MB,
+    )
+    with uploader:
+        for prefix in sorted({artifact.key.split("/", 1)[0] + "/" for artifact in artifacts}):
+            uploader.load_remote(prefix)
+        report_keys, message_keys = {}, {}
+        for artifact, status in uploader.upload_all(artifacts):
+            if status is None or artifact.key not in owners:
+                continue
+            item, fmt = owners[artifact.key]
+            if fmt:
+                report_keys.setdefault(item_key(item), (item, {}))[1][fmt] = artifact.key
+            else:
+                message_keys[artifact.key] = item
+    upload_seconds = time.perf_counter() - start
+
+    updates = [report_update(item, keys) for item, keys in report_keys.values()]
+    updates += [message_update(item, args.bucket, key) for key, item in message_keys.items()]
+    updates = [update for update in updates if update]
+    update_errors = []
+
+    def apply(update: dict):
+        try:
+            dynamodb.update_item(TableName=TABLE_NAME, **update)
+        except (BotoCoreError, ClientError) as error:
+            update_errors.append(f"{update['Key']['PK']['S']} {update['Key']['SK']['S']}: {error}")
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(apply, updates))
+    elapsed = time.perf_counter() - start
+
+    result = uploader.result
+    print()
+    print(
+        f"  Uploaded: {result.uploaded} ({result.multipart} multipart, {result.bytes / MB:.1f} MB, "
+        f"{result.bytes / MB / upload_seconds if upload_seconds else 0:.1f} MB/s)"
+    )
+    print(f"  Unchanged: {result.skipped}")
+    print(f"  Failed: {result.failed}")
+    print(f"  Items updated: {len(updates) - len(update_errors)}")
+    for error in result.errors + update_errors:
+        print(f"  Error: {error}")
+    print(f"=== Artifact upload complete in {elapsed:.2f}s ===")
+    if result.failed or update_errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()